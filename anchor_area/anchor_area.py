@@ -9,7 +9,8 @@ class AnchorArea:
         self._present_ids.discard(wand_id.upper())
 
     def is_present(self, wand_id: str) -> bool:
-        return wand_id.upper() in self._present_ids
+        # Tags normally arrive upper-case already, so try that before making a copy.
+        return wand_id in self._present_ids or wand_id.upper() in self._present_ids
 
     def ids(self) -> list[str]:
         return list(self._present_ids)
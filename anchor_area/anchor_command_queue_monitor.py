@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from gamevolt.logging import Logger
+from gamevolt.messaging.events.message_handler import MessageHandler
+from messaging.messages.anchor_command_queue_message import AnchorCommandQueueMessage
+
+
+class AnchorCommandQueueMonitor:
+    """Keeps the latest command queue report from each anchor and warns when an anchor starts dropping commands."""
+
+    def __init__(self, logger: Logger, message_handler: MessageHandler) -> None:
+        self._message_handler = message_handler
+        self._logger = logger
+
+        self._latest: dict[str, AnchorCommandQueueMessage] = {}
+
+    def start(self) -> None:
+        self._message_handler.subscribe_typed(AnchorCommandQueueMessage, self._on_command_queue_message)
+
+    def stop(self) -> None:
+        self._message_handler.unsubscribe_typed(AnchorCommandQueueMessage, self._on_command_queue_message)
+
+    def latest(self, anchor_id: str) -> AnchorCommandQueueMessage | None:
+        return self._latest.get(anchor_id)
+
+    def _on_command_queue_message(self, message: AnchorCommandQueueMessage) -> None:
+        previous = self._latest.get(message.anchor_id)
+        self._latest[message.anchor_id] = message
+
+        summary = (
+            f"pending={message.pending} sent={message.sent} coalesced={message.coalesced} dropped={message.dropped} "
+            f"max_wait_ms={message.max_wait_ms} max_depth={message.max_depth}"
+        )
+
+        if previous is not None and message.dropped > previous.dropped:
+            self._logger.warning(f"Anchor ({message.anchor_id}) dropped {message.dropped - previous.dropped} commands: {summary}")
+            return
+
+        self._logger.debug(f"Anchor ({message.anchor_id}) command queue: {summary}")
@@ -4,12 +4,23 @@ import time
 from dataclasses import dataclass
 
 from anchor_area.anchor_area import AnchorArea
+from anchor_relay.anchor_relay_stats import AnchorRelayStats
+from anchor_relay.configuration.anchor_relay_settings import AnchorRelaySettings
+from anchor_relay.serial_lag_tracker import SerialLagTracker
+from anchor_relay.web_socket_frame_batcher import WebSocketFrameBatcher
 from gamevolt.logging import Logger
+from gamevolt.messaging.events.message_handler import MessageHandler
 from gamevolt.serial.line_receiver_protocol import LineReceiverProtocol
 from gamevolt.web_sockets.web_socket_client import WebSocketClient
+from messaging.messages.wand_wire_format_message import WandWireFormatMessage
+from wand.data.anchor_tag import AnchorTag
+from wand.data.anchor_tag_codec import AnchorTagCodec
+from wand.data.assembled_packet import AssembledPacket
 from wand.data.data_line import DataLine
+from wand.data.wand_binary_codec import WandBinaryCodec
 from wand.data.wand_protocol_parser import WandProtocolParser
 from wand.packet_header import PacketHeader
+from wand.pending_header_queue import PendingHeaderQueue
 
 
 @dataclass
@@ -22,21 +33,40 @@ class AnchorRelay:
     def __init__(
         self,
         logger: Logger,
+        settings: AnchorRelaySettings,
         line_receiver_protocol: LineReceiverProtocol,
         web_socket_client: WebSocketClient,
+        message_handler: MessageHandler,
         anchor_area: AnchorArea,
-        header_ttl_s: float = 2.0,
+        anchor_id: str | None = None,
     ) -> None:
         self._line_receiver_protocol = line_receiver_protocol
         self._web_socket_client = web_socket_client
+        self._message_handler = message_handler
         self._zone_prescence = anchor_area
+        self._anchor_id = anchor_id
+        self._settings = settings
         self._logger = logger
 
         self._parser = WandProtocolParser()
-        self._header_ttl_s = float(header_ttl_s)
-        self._pending: dict[int, PendingRelayPacket] = {}
+        self._codec = WandBinaryCodec()
+        self._anchor_tag_codec = AnchorTagCodec()
+        self._pending: PendingHeaderQueue[PendingRelayPacket] = PendingHeaderQueue(ttl_s=settings.header_ttl_s)
+        self._serial_lag = SerialLagTracker()
+
+        self._batcher = WebSocketFrameBatcher(web_socket_client, settings.batch_interval_s, settings.batch_max_bytes)
+        self._stats = AnchorRelayStats(last_log_monotonic=time.monotonic(), log_interval_s=2.0)
+
+        self._send_binary = False
+        self._send_combined = False
+        self._send_batched = False
+        self._binary_flags = 0
+        self._send_anchor_id: str | None = None
+        self._send_timestamps = False
 
     async def start_async(self) -> None:
+        self._web_socket_client.disconnected.subscribe(self._on_disconnected)
+        self._message_handler.subscribe_typed(WandWireFormatMessage, self._on_wire_format_message)
         self._line_receiver_protocol.line_received.subscribe(self._on_line_received)
 
         await self._line_receiver_protocol.start()
@@ -45,17 +75,57 @@ class AnchorRelay:
         await self._line_receiver_protocol.stop()
 
         self._line_receiver_protocol.line_received.unsubscribe(self._on_line_received)
+        self._message_handler.unsubscribe_typed(WandWireFormatMessage, self._on_wire_format_message)
+        self._web_socket_client.disconnected.unsubscribe(self._on_disconnected)
         self._pending.clear()
+        self._batcher.flush()
+
+    @property
+    def stats(self) -> AnchorRelayStats:
+        return self._stats
 
     def update(self) -> None:
         now = time.monotonic()
-        expired = [seq for seq, pending in self._pending.items() if (now - pending.header.received_monotonic) > self._header_ttl_s]
-        for seq in expired:
-            self._pending.pop(seq, None)
+        self._pending.prune(now)
+        self._batcher.update()
+        self._stats.maybe_log(self._logger, now)
+
+    def _on_wire_format_message(self, message: WandWireFormatMessage) -> None:
+        self._send_binary = self._settings.binary_frames and int(message.binary_version) == WandBinaryCodec.VERSION
+        self._send_combined = self._settings.combined_lines and bool(message.combined_lines)
+        self._send_batched = self._settings.batch_frames and bool(message.batched_frames)
+        self._binary_flags = self._requested_binary_flags() & int(message.binary_flags)
+        # Tagged with the anchor so the server can attribute shared-connection traffic and per-anchor latency.
+        self._send_anchor_id = self._anchor_id if bool(message.anchor_tags) else None
+        self._send_timestamps = self._send_anchor_id is not None and self._settings.timestamps and bool(message.relay_timestamps)
+        self._batcher.anchor_id = self._send_anchor_id
+        self._batcher.timestamps = self._send_timestamps
+        self._logger.info(
+            f"Server binary frame version: {message.binary_version}. Sending binary frames: {self._send_binary} "
+            f"(flags {self._binary_flags:#04x}). "
+            f"Sending combined lines: {self._send_combined}. Sending batched frames: {self._send_batched}. "
+            f"Sending timestamps: {self._send_timestamps}."
+        )
+
+    def _requested_binary_flags(self) -> int:
+        flags = WandBinaryCodec.FLAG_DELTA if self._settings.binary_delta else 0
+        return flags | (WandBinaryCodec.FLAG_ZLIB if self._settings.binary_zlib else 0)
+
+    def _on_disconnected(self) -> None:
+        # Renegotiated on every connection; the next server may be older.
+        self._send_binary = False
+        self._send_combined = False
+        self._send_batched = False
+        self._binary_flags = 0
+        self._send_anchor_id = None
+        self._send_timestamps = False
+        self._batcher.anchor_id = None
+        self._batcher.timestamps = False
+        self._batcher.clear()
 
     def _on_line_received(self, raw: str) -> None:
         raw = raw.strip()
-        if not raw:
+        if not raw or not self._passes_presence_filter(raw):
             return
 
         now = time.monotonic()
@@ -72,20 +142,116 @@ class AnchorRelay:
             self._on_data(raw, parsed)
             return
 
+        if isinstance(parsed, AssembledPacket):
+            self._on_combined(raw, parsed, now)
+            return
+
+    def _passes_presence_filter(self, raw: str) -> bool:
+        """
+        Most wands an anchor hears are not in its area, so their lines are dropped on a tag (or seq) lookup
+        before anything is parsed. Lines the peek cannot read go on to the parser as before.
+        """
+        if raw.startswith("PKT"):
+            tag = self._parser.peek_field(raw, "tag=")
+            if tag is not None and not self._zone_prescence.is_present(tag):
+                self._stats.lines_dropped_absent += 1
+                return False
+
+        elif raw.startswith("DATA"):
+            seq = self._parser.peek_field(raw, "seq=")
+            if seq is not None and seq.isdigit() and not self._pending.has_seq(int(seq)):
+                self._stats.lines_dropped_data += 1
+                return False
+
+        return True
+
     def _on_header(self, raw: str, header: PacketHeader) -> None:
         if not self._zone_prescence.is_present(header.tag_hex):
             self._logger.trace(f"Dropping PKT for non-present wand: tag={header.tag_hex} seq={header.seq}")
             return
 
-        self._pending[header.seq] = PendingRelayPacket(
-            header=header,
-            raw_header_line=raw,
+        self._pending.put(
+            header.tag_hex,
+            header.seq,
+            header.nsamp,
+            header.received_monotonic,
+            PendingRelayPacket(header=header, raw_header_line=raw),
         )
 
     def _on_data(self, raw: str, data: DataLine) -> None:
-        pending = self._pending.pop(data.seq, None)
+        pending = self._pending.pop_seq(data.seq, lambda: self._parser.count_samples(data.data_str))
         if pending is None:
             return
 
-        self._web_socket_client.send_data(pending.raw_header_line)
-        self._web_socket_client.send_data(raw)
+        self._stats.lines_forwarded += 2
+        header = pending.header
+        received_monotonic = header.received_monotonic
+        serial_ms = self._serial_lag_ms(header.t_rx_ms, received_monotonic)
+
+        if self._try_send_binary(header, data.data_str, received_monotonic, serial_ms):
+            return
+
+        if self._send_combined:
+            self._send(self._parser.combine(pending.raw_header_line, data.data_str), received_monotonic, serial_ms)
+            return
+
+        self._send(pending.raw_header_line, received_monotonic, serial_ms)
+        self._send(raw, received_monotonic, serial_ms)
+
+    def _on_combined(self, raw: str, packet: AssembledPacket, received_monotonic: float) -> None:
+        if not self._zone_prescence.is_present(packet.tag_hex):
+            self._logger.trace(f"Dropping PKTD for non-present wand: tag={packet.tag_hex} seq={packet.seq}")
+            return
+
+        self._stats.lines_forwarded += 1
+        serial_ms = self._serial_lag_ms(packet.t_rx_ms, received_monotonic)
+
+        if self._try_send_binary(packet, packet.data_str, received_monotonic, serial_ms):
+            return
+
+        if self._send_combined:
+            self._send(raw, received_monotonic, serial_ms)
+            return
+
+        for line in self._parser.split(raw, packet.seq, packet.data_str):
+            self._send(line, received_monotonic, serial_ms)
+
+    def _serial_lag_ms(self, t_rx_ms: int, received_monotonic: float) -> float:
+        if not self._send_timestamps:
+            return 0.0
+        return self._serial_lag.lag_ms(t_rx_ms, received_monotonic)
+
+    def _try_send_binary(
+        self,
+        header: PacketHeader | AssembledPacket,
+        data_str: str,
+        received_monotonic: float,
+        serial_ms: float,
+    ) -> bool:
+        if not self._send_binary:
+            return False
+
+        frame = self._codec.encode(header, self._parser.parse_samples(data_str), self._binary_flags)
+        if frame is None:
+            self._logger.trace(f"Packet not representable as binary, sending text: tag={header.tag_hex} seq={header.seq}")
+            return False
+
+        self._send(frame, received_monotonic, serial_ms)
+        return True
+
+    def _send(self, data: str | bytes, received_monotonic: float, serial_ms: float) -> None:
+        if self._send_batched:
+            self._batcher.add(data, received_monotonic, serial_ms)
+            return
+
+        if self._send_anchor_id is not None:
+            data = self._anchor_tag_codec.tag(self._make_tag(received_monotonic, serial_ms), data)
+
+        self._web_socket_client.send_data(data)
+
+    def _make_tag(self, received_monotonic: float, serial_ms: float) -> AnchorTag:
+        if not self._send_timestamps:
+            return AnchorTag(self._send_anchor_id)
+
+        queued_ms = (time.monotonic() - received_monotonic) * 1000.0
+        return AnchorTag(self._send_anchor_id, time.time() * 1000.0, queued_ms, serial_ms)
@@ -0,0 +1,28 @@
+import logging
+from dataclasses import dataclass
+
+from gamevolt.logging import Logger
+
+
+@dataclass
+class AnchorRelayStats:
+    lines_forwarded: int = 0
+    # PKT/PKTD lines for wands not in this anchor's area, caught before parsing
+    lines_dropped_absent: int = 0
+    # DATA lines with no pending PKT (usually one dropped above), caught before parsing
+    lines_dropped_data: int = 0
+
+    last_log_monotonic: float = 0.0
+    log_interval_s: float = 2.0
+
+    def maybe_log(self, logger: Logger, now: float) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        if (now - self.last_log_monotonic) < self.log_interval_s:
+            return
+
+        self.last_log_monotonic = now
+        logger.debug(
+            f"Anchor relay: forwarded={self.lines_forwarded} dropped_absent={self.lines_dropped_absent} "
+            f"dropped_data={self.lines_dropped_data}"
+        )
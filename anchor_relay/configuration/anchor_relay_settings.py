@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+from gamevolt.configuration.settings_base import SettingsBase
+
+
+@dataclass
+class AnchorRelaySettings(SettingsBase):
+    header_ttl_s: float = 2.0
+
+    # send binary frames once the server has advertised a compatible version
+    binary_frames: bool = True
+
+    # transcode binary frames (delta-encoded samples, optionally zlib per frame) if the server can decode them
+    binary_delta: bool = True
+    binary_zlib: bool = False
+
+    # send PKTD single-line packets (text fallback) once the server has advertised support
+    combined_lines: bool = True
+
+    # coalesce lines/frames into one web socket message per interval (or per max bytes) once the server supports it
+    batch_frames: bool = True
+    batch_interval_s: float = 0.01
+    batch_max_bytes: int = 16384
+
+    # stamp each message with send time, relay queueing and serial lag once the server asks for them
+    timestamps: bool = True
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from gamevolt.configuration.settings_base import SettingsBase
+
+
+@dataclass
+class RelayAnchorSettings(SettingsBase):
+    id: str
+
+    # serial port of this anchor; baud, timeout and retry interval come from serial_receiver
+    port: str
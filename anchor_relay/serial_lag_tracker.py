@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import math
+
+
+class SerialLagTracker:
+    """
+    How much later than usual packets reach the relay from one anchor, judged by the anchor's t_rx clock.
+
+    The anchor and relay clocks are unrelated, so only the difference (relay arrival - t_rx) is meaningful, and
+    its smallest value is the least delayed packet. Lag is measured against the smallest difference over the
+    last one to two windows, so the baseline follows clock drift and an anchor restart within a window or two.
+    """
+
+    def __init__(self, window_s: float = 30.0) -> None:
+        self._window_s = window_s
+        self._window_started_monotonic: float | None = None
+        self._current_floor_ms = math.inf
+        self._previous_floor_ms = math.inf
+
+    def lag_ms(self, t_rx_ms: int, received_monotonic: float) -> float:
+        if t_rx_ms <= 0:
+            return 0.0
+
+        difference_ms = received_monotonic * 1000.0 - t_rx_ms
+
+        if self._window_started_monotonic is None or received_monotonic - self._window_started_monotonic >= self._window_s:
+            self._previous_floor_ms = self._current_floor_ms
+            self._current_floor_ms = difference_ms
+            self._window_started_monotonic = received_monotonic
+        elif difference_ms < self._current_floor_ms:
+            self._current_floor_ms = difference_ms
+
+        return max(0.0, difference_ms - min(self._current_floor_ms, self._previous_floor_ms))
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import time
+
+from gamevolt.web_sockets.web_socket_client import WebSocketClient
+from wand.data.anchor_tag import AnchorTag
+from wand.data.anchor_tag_codec import AnchorTagCodec
+
+
+class WebSocketFrameBatcher:
+    """
+    Coalesces outgoing lines into one newline-delimited message, and binary frames into one concatenated message,
+    flushed every interval_s or as soon as max_bytes is pending. Switching between text and binary flushes first,
+    so the server still sees everything in order. Each message is tagged with anchor_id when one is set, and
+    with the relay's timestamps (measured from the oldest item's serial arrival) when timestamps is also set.
+    """
+
+    def __init__(self, web_socket_client: WebSocketClient, interval_s: float, max_bytes: int) -> None:
+        self._web_socket_client = web_socket_client
+        self._interval_s = interval_s
+        self._max_bytes = max_bytes
+
+        self._lines: list[str] = []
+        self._frames = bytearray()
+        self._pending_bytes = 0
+        self._first_pending_monotonic: float | None = None
+        self._oldest_received_monotonic: float | None = None
+        self._max_serial_ms = 0.0
+        self._anchor_tag_codec = AnchorTagCodec()
+
+        self.anchor_id: str | None = None
+        self.timestamps = False
+        self.messages_sent = 0
+        self.items_sent = 0
+
+    def add(self, item: str | bytes, received_monotonic: float | None = None, serial_ms: float = 0.0) -> None:
+        if isinstance(item, bytes):
+            if self._lines:
+                self.flush()
+            self._frames += item
+        else:
+            if self._frames:
+                self.flush()
+            self._lines.append(item)
+
+        if self._oldest_received_monotonic is None:
+            self._oldest_received_monotonic = received_monotonic
+        if serial_ms > self._max_serial_ms:
+            self._max_serial_ms = serial_ms
+
+        self._pending_bytes += len(item) + 1
+        self.items_sent += 1
+        if self._first_pending_monotonic is None:
+            self._first_pending_monotonic = time.monotonic()
+
+        if self._pending_bytes >= self._max_bytes:
+            self.flush()
+
+    def update(self) -> None:
+        if self._first_pending_monotonic is not None and time.monotonic() - self._first_pending_monotonic >= self._interval_s:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._lines:
+            self._send("\n".join(self._lines))
+            self._lines.clear()
+        elif self._frames:
+            self._send(bytes(self._frames))
+            self._frames.clear()
+
+        self._reset_pending()
+
+    def clear(self) -> None:
+        self._lines.clear()
+        self._frames.clear()
+        self._reset_pending()
+
+    def _reset_pending(self) -> None:
+        self._pending_bytes = 0
+        self._first_pending_monotonic = None
+        self._oldest_received_monotonic = None
+        self._max_serial_ms = 0.0
+
+    def _send(self, message: str | bytes) -> None:
+        if self.anchor_id is not None:
+            message = self._anchor_tag_codec.tag(self._make_tag(), message)
+
+        self._web_socket_client.send_data(message)
+        self.messages_sent += 1
+
+    def _make_tag(self) -> AnchorTag:
+        if not self.timestamps:
+            return AnchorTag(self.anchor_id)
+
+        now = time.monotonic()
+        oldest = self._oldest_received_monotonic if self._oldest_received_monotonic is not None else now
+        return AnchorTag(self.anchor_id, time.time() * 1000.0, (now - oldest) * 1000.0, self._max_serial_ms)
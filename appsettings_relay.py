@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 
+from anchor_relay.configuration.anchor_relay_settings import AnchorRelaySettings
+from anchor_relay.configuration.relay_anchor_settings import RelayAnchorSettings
 from gamevolt.configuration.appsettings_base import AppSettingsBase
 from gamevolt.logging.configuration.logging_settings import LoggingSettings
+from gamevolt.messaging.command_bridge.configuration.anchor_command_scheduler_settings import AnchorCommandSchedulerSettings
 from gamevolt.serial.configuration.serial_receiver_settings import SerialReceiverSettings
 from gamevolt.web_sockets.configuration.web_socket_client_settings import WebSocketClientSettings
 
@@ -14,3 +17,8 @@ class AppSettingsRelay(AppSettingsBase):
     logging: LoggingSettings
     serial_receiver: SerialReceiverSettings
     web_socket_client: WebSocketClientSettings
+    relay: AnchorRelaySettings
+    command_scheduler: AnchorCommandSchedulerSettings
+
+    # several anchors on this host, multiplexed over one connection; empty relays serial_receiver.port as `id`
+    anchors: list[RelayAnchorSettings]
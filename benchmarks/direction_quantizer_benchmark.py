@@ -0,0 +1,143 @@
+import argparse
+import math
+import timeit
+from dataclasses import replace
+
+import numpy as np
+import yaml
+
+from motion.configuration.motion_processor_settings import MotionProcessorSettings
+from motion.direction.direction_quantizer import DirectionQuantizer
+from motion.direction.direction_type import DirectionType
+from motion.direction.octant_method import OctantMethod
+from motion.motion_engine import MotionEngine
+
+EDGES_DEG = (-157.5, -112.5, -67.5, -22.5, 22.5, 67.5, 112.5, 157.5)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="direction_quantizer_benchmark",
+        description="Sweep every heading through both octant methods (scalar and MotionEngine), then compare their speed.",
+    )
+    p.add_argument("--steps-per-degree", type=int, default=1000, help="Headings checked per degree of the sweep.")
+    p.add_argument("--edge-tolerance", type=float, default=1e-9, help="Degrees from an octant edge where the methods may disagree.")
+    p.add_argument("--samples", type=int, default=200000, help="Velocities quantised per measurement.")
+    p.add_argument("--repeat", type=int, default=5, help="Measurements per method (best is reported).")
+    p.add_argument("--settings", default="appsettings.yml", help="Settings file with the motion processor section.")
+    p.add_argument("--seed", type=int, default=0)
+    return p
+
+
+def load_settings(path: str) -> MotionProcessorSettings:
+    with open(path) as f:
+        return MotionProcessorSettings.from_json_like(yaml.safe_load(f)["motion"]["processor"])
+
+
+def with_method(settings: MotionProcessorSettings, method: OctantMethod) -> MotionProcessorSettings:
+    return replace(settings, direction_quantizer=replace(settings.direction_quantizer, octant_method=method))
+
+
+def make_sweep(steps_per_degree: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Every heading on the grid (edges included, and their nearest neighbours), at speeds from slow to fast."""
+    degrees = np.arange(-180 * steps_per_degree, 180 * steps_per_degree + 1) / steps_per_degree
+    edges = np.array(EDGES_DEG + (-180.0, 0.0, 90.0, -90.0, 180.0))
+    degrees = np.concatenate((degrees, edges, np.nextafter(edges, -np.inf), np.nextafter(edges, np.inf)))
+
+    speeds = np.repeat((0.3, 1.0, 7.5, 1e4), len(degrees))
+    radians = np.radians(np.tile(degrees, 4))
+    return speeds * np.cos(radians), speeds * np.sin(radians), np.tile(degrees, 4)
+
+
+def check_sweep(settings: MotionProcessorSettings, steps_per_degree: int, edge_tolerance: float) -> tuple[int, int]:
+    """Returns (headings checked, disagreements); every disagreement must be next to an octant edge."""
+    vx, vy, degrees = make_sweep(steps_per_degree)
+    speed_sq = vx * vx + vy * vy
+
+    picks = {}
+    for method in OctantMethod:
+        method_settings = with_method(settings, method)
+        quantizer = DirectionQuantizer(method_settings.direction_quantizer)
+        scalar = np.array([quantizer._get_direction(x, y, s).value for x, y, s in zip(vx.tolist(), vy.tolist(), speed_sq.tolist())])
+        vectorised = MotionEngine(method_settings)._get_directions(vx, vy, speed_sq)
+        if not np.array_equal(scalar, vectorised):
+            raise AssertionError(f"MotionEngine's {method.name} octants differ from DirectionQuantizer's.")
+        picks[method] = scalar
+
+    disagree = np.flatnonzero(picks[OctantMethod.ATAN2] != picks[OctantMethod.COMPARE])
+    distance = np.min(np.abs(degrees[disagree, None] - np.array(EDGES_DEG)), axis=1) if len(disagree) else np.zeros(0)
+    if np.any(distance > edge_tolerance):
+        worst = int(disagree[np.argmax(distance)])
+        raise AssertionError(f"Octant methods disagree {distance.max():g}° from an edge (heading {degrees[worst]!r}°).")
+
+    # zero velocity past a zero deadband: atan2's octant for each signed zero
+    zero_x = np.array((0.0, -0.0, 0.0, -0.0))
+    zero_y = np.array((0.0, 0.0, -0.0, -0.0))
+    no_deadband = replace(settings, direction_quantizer=replace(settings.direction_quantizer, axis_deadband_per_s=0.0))
+    expected = [
+        DirectionQuantizer(with_method(no_deadband, OctantMethod.ATAN2).direction_quantizer)._get_octant(x, y)
+        for x, y in zip(zero_x, zero_y)
+    ]
+    for method in OctantMethod:
+        method_settings = with_method(no_deadband, method)
+        scalar = [DirectionQuantizer(method_settings.direction_quantizer)._get_direction(x, y, 0.0) for x, y in zip(zero_x, zero_y)]
+        vectorised = MotionEngine(method_settings)._get_directions(zero_x, zero_y, np.zeros(4))
+        if scalar != expected or vectorised.tolist() != [d.value for d in expected]:
+            raise AssertionError(f"{method.name}: zero velocity is {scalar}, expected {expected}.")
+
+    # the special values: stillness and NaN
+    for method in OctantMethod:
+        quantizer = DirectionQuantizer(with_method(settings, method).direction_quantizer)
+        if quantizer._get_direction(0.0, 0.0, 0.0) is not DirectionType.PAUSE:
+            raise AssertionError(f"{method.name}: zero velocity is not PAUSE.")
+        if quantizer._get_direction(math.nan, 1.0, math.nan) is not DirectionType.UNKNOWN:
+            raise AssertionError(f"{method.name}: NaN velocity is not UNKNOWN.")
+
+    return len(degrees), len(disagree)
+
+
+def measure(settings: MotionProcessorSettings, rng: np.random.Generator, count: int, repeat: int) -> None:
+    vx = rng.normal(0.0, 2.0, count)
+    vy = rng.normal(0.0, 2.0, count)
+    rows = list(zip(vx.tolist(), vy.tolist()))
+    speed_sq = vx * vx + vy * vy
+
+    print(f"{'method':>8} {'scalar ns/sample':>17} {'step ns/sample':>15} {'numpy ns/sample':>16}")
+    for method in OctantMethod:
+        method_settings = with_method(settings, method)
+        quantizer = DirectionQuantizer(method_settings.direction_quantizer)
+        engine = MotionEngine(method_settings)
+
+        # the quantizer's octant choice alone, then a whole step (hypot for ATAN2, as before; squared for COMPARE)
+        get_direction = quantizer._get_direction
+        if method is OctantMethod.ATAN2:
+
+            def step() -> None:
+                for x, y in rows:
+                    quantizer.step(x, y, math.hypot(x, y))
+
+        else:
+
+            def step() -> None:
+                for x, y in rows:
+                    quantizer.step_squared(x, y, x * x + y * y)
+
+        octant_s = min(timeit.repeat(lambda: [get_direction(x, y, x * x + y * y) for x, y in rows], number=1, repeat=repeat))
+        step_s = min(timeit.repeat(step, number=1, repeat=repeat))
+        numpy_s = min(timeit.repeat(lambda: engine._get_directions(vx, vy, speed_sq), number=1, repeat=repeat))
+        print(f"{method.name:>8} {octant_s / count * 1e9:>17.1f} {step_s / count * 1e9:>15.1f} {numpy_s / count * 1e9:>16.2f}")
+
+
+def main() -> int:
+    a = build_parser().parse_args()
+    settings = load_settings(a.settings)
+
+    checked, disagree = check_sweep(settings, a.steps_per_degree, a.edge_tolerance)
+    print(f"Octant methods agree on {checked - disagree} of {checked} headings; the {disagree} others are on an edge.")
+
+    measure(settings, np.random.default_rng(a.seed), a.samples, a.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
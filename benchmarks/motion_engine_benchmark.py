@@ -0,0 +1,177 @@
+import argparse
+import math
+import timeit
+
+import numpy as np
+import yaml
+
+from motion.configuration.motion_processor_settings import MotionProcessorSettings
+from motion.gesture.gesture_segment import GestureSegment
+from motion.motion_engine import MotionEngine
+from motion.motion_processor import MotionProcessor
+from wand.wand_rotation_batch import WandRotationBatch
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="motion_engine_benchmark",
+        description="Check MotionEngine raises the same events as a MotionProcessor per wand, then compare their speed.",
+    )
+    p.add_argument("--wands", type=int, nargs="+", default=[1, 16, 64, 256], help="Wands advanced per tick.")
+    p.add_argument("--nsamp", type=int, default=8, help="Samples per packet (one packet per wand per tick).")
+    p.add_argument("--ticks", type=int, default=200, help="Ticks per measurement.")
+    p.add_argument("--repeat", type=int, default=3, help="Measurements per size (best is reported).")
+    p.add_argument("--fuzz", type=int, default=64, help="Wands checked for equivalence before timing.")
+    p.add_argument("--seconds", type=float, default=30.0, help="Seconds of motion per wand checked.")
+    p.add_argument("--tolerance", type=float, default=1e-9, help="Largest allowed difference in segment values.")
+    p.add_argument("--settings", default="appsettings.yml", help="Settings file with the motion processor section.")
+    p.add_argument("--seed", type=int, default=0)
+    return p
+
+
+def load_settings(path: str) -> MotionProcessorSettings:
+    with open(path) as f:
+        return MotionProcessorSettings.from_json_like(yaml.safe_load(f)["motion"]["processor"])
+
+
+def make_motion(rng: np.random.Generator, seconds: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """200 Hz strokes and pauses of random length, speed and heading, with the odd repeated timestamp."""
+    count = int(seconds * 200)
+    ts_ms = 1000 + np.arange(count, dtype=np.int64) * 5
+    x_delta = np.empty(count)
+    y_delta = np.empty(count)
+
+    i = 0
+    while i < count:
+        n = int(rng.integers(10, 400))
+        speed = 0.0 if rng.random() < 0.4 else rng.uniform(0.2, 4.0)
+        heading = rng.uniform(-math.pi, math.pi)
+        x_delta[i : i + n] = speed * 0.005 * math.cos(heading)
+        y_delta[i : i + n] = speed * 0.005 * math.sin(heading)
+        i += n
+
+    x_delta += rng.normal(0.0, 0.0004, count)
+    y_delta += rng.normal(0.0, 0.0004, count)
+    repeated = rng.random(count) < 0.002
+    ts_ms[1:][repeated[1:]] = ts_ms[:-1][repeated[1:]]
+    return ts_ms, x_delta, y_delta
+
+
+def packets(ts_ms: np.ndarray, x_delta: np.ndarray, y_delta: np.ndarray, sizes: list[int]) -> list[WandRotationBatch]:
+    out = []
+    start = 0
+    for size in sizes:
+        end = min(start + size, len(ts_ms))
+        out.append(
+            WandRotationBatch("E000", ts_ms[start:end], x_delta[start:end], y_delta[start:end], x_delta[start:end], y_delta[start:end])
+        )
+        start = end
+    return out
+
+
+def record(processor, events: list) -> None:
+    """Subscribes like TrackedWand, including its reset after a (here: every fifth) matched segment."""
+
+    def on_segment(segment: GestureSegment) -> None:
+        events.append(segment)
+        if segment.sample_count % 5 == 0:
+            processor.reset()
+
+    processor.motion_changed.subscribe(lambda phase: events.append(phase))
+    processor.direction_changed.subscribe(lambda direction: events.append(direction))
+    processor.segment_completed.subscribe(on_segment)
+    processor.start()
+
+
+def largest_difference(expected: list, actual: list) -> float:
+    if len(expected) != len(actual):
+        return math.inf
+
+    worst = 0.0
+    for e, a in zip(expected, actual):
+        if not isinstance(e, GestureSegment):
+            if e != a:
+                return math.inf
+            continue
+
+        if (e.start_ts_ms, e.end_ts_ms, e.sample_count, e.direction_type) != (a.start_ts_ms, a.end_ts_ms, a.sample_count, a.direction_type):
+            return math.inf
+        for name in ("duration_s", "avg_vec_x", "avg_vec_y", "net_dx", "net_dy", "mean_speed", "path_length"):
+            worst = max(worst, abs(getattr(e, name) - getattr(a, name)))
+    return worst
+
+
+def check_equivalence(
+    settings: MotionProcessorSettings, rng: np.random.Generator, wands: int, seconds: float, tolerance: float
+) -> tuple[float, int]:
+    engine = MotionEngine(settings, capacity=1)  # grows while slots are created
+    streams = [make_motion(rng, seconds) for _ in range(wands)]
+    expected: list[list] = [[] for _ in range(wands)]
+    actual: list[list] = [[] for _ in range(wands)]
+    processors = [MotionProcessor(settings) for _ in range(wands)]
+    slots = [engine.create() for _ in range(wands)]
+    for i in range(wands):
+        record(processors[i], expected[i])
+        record(slots[i], actual[i])
+
+    # packets of varying size, several per tick for some wands and none for others
+    per_wand = [packets(*stream, rng.integers(1, 24, len(stream[0])).tolist()) for stream in streams]
+    while any(per_wand):
+        for i, queue in enumerate(per_wand):
+            for _ in range(int(rng.integers(0, 3))):
+                if queue:
+                    batch = queue.pop(0)
+                    processors[i].on_rotation_batch(batch)
+                    slots[i].on_rotation_batch(batch)
+        engine.tick()
+
+    worst = max(largest_difference(e, a) for e, a in zip(expected, actual))
+    if worst > tolerance:
+        raise AssertionError(f"MotionEngine events differ from MotionProcessor's (largest difference {worst:g}).")
+    return worst, sum(len(e) for e in expected)
+
+
+def measure(
+    settings: MotionProcessorSettings, rng: np.random.Generator, wands: int, nsamp: int, ticks: int, repeat: int
+) -> tuple[float, float]:
+    """Seconds per tick: a MotionProcessor per wand, and one MotionEngine for all of them."""
+    streams = [make_motion(rng, ticks * nsamp / 200.0) for _ in range(wands)]
+    ticked = [packets(*stream, [nsamp] * ticks) for stream in streams]
+
+    def scalar() -> None:
+        processors = [MotionProcessor(settings) for _ in range(wands)]
+        for t in range(ticks):
+            for processor, batches in zip(processors, ticked):
+                processor.on_rotation_batch(batches[t])
+
+    def vectorised() -> None:
+        engine = MotionEngine(settings, capacity=wands)
+        slots = [engine.create() for _ in range(wands)]
+        for t in range(ticks):
+            for slot, batches in zip(slots, ticked):
+                slot.on_rotation_batch(batches[t])
+            engine.tick()
+
+    scalar_s = min(timeit.repeat(scalar, number=1, repeat=repeat)) / ticks
+    engine_s = min(timeit.repeat(vectorised, number=1, repeat=repeat)) / ticks
+    return scalar_s, engine_s
+
+
+def main() -> int:
+    a = build_parser().parse_args()
+    rng = np.random.default_rng(a.seed)
+    settings = load_settings(a.settings)
+
+    worst, events = check_equivalence(settings, rng, a.fuzz, a.seconds, a.tolerance)
+    print(f"MotionEngine: {a.fuzz} wands raise the same {events} events as MotionProcessor (largest difference {worst:.1e}).")
+
+    print(f"{'wands':>6} {'nsamp':>6} {'processor us/tick':>18} {'engine us/tick':>15} {'speedup':>8}")
+    for wands in a.wands:
+        scalar_s, engine_s = measure(settings, rng, wands, a.nsamp, a.ticks, a.repeat)
+        print(f"{wands:>6} {a.nsamp:>6} {scalar_s * 1e6:>18.1f} {engine_s * 1e6:>15.1f} {scalar_s / engine_s:>7.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
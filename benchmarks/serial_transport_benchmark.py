@@ -0,0 +1,129 @@
+import argparse
+import asyncio
+import os
+import pty
+import tempfile
+import threading
+import time
+import tty
+
+import serial_asyncio
+
+from gamevolt.logging import Logger, get_logger
+from gamevolt.logging.configuration.logging_settings import LoggingSettings
+from gamevolt.serial.configuration.serial_receiver_settings import SerialReceiverSettings
+from gamevolt.serial.serial_transport import SerialTransport
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="serial_transport_benchmark",
+        description="Push relay lines through a pty into SerialTransport and into a readline()-per-line reader.",
+    )
+    p.add_argument("--lines", type=int, default=100000, help="Lines sent per measurement.")
+    p.add_argument("--repeat", type=int, default=3, help="Measurements per reader (best is reported).")
+    p.add_argument("--log-level", default="WARNING", help="Logger minimum level (TRACE shows per-line logging cost).")
+    return p
+
+
+def make_lines(count: int) -> list[str]:
+    return [
+        f'PKTD t_rx={seq * 40} t0={1000 + seq * 40} dt_us=5000 tag=E00{seq % 4} seq={seq} nsamp=2 data="100,200,30000;-5,7,32767"'
+        for seq in range(count)
+    ]
+
+
+def write_lines(master_fd: int, payload: bytes) -> None:
+    view = memoryview(payload)
+    while view:
+        written = os.write(master_fd, view[:4096])
+        view = view[written:]
+
+
+async def receive_readline(port: str, count: int, logger: Logger) -> list[str]:
+    """The previous SerialTransport read loop: one awaited readline(), decode and trace per line."""
+    reader, writer = await serial_asyncio.open_serial_connection(url=port, baudrate=921600)
+    received: list[str] = []
+    try:
+        while len(received) < count:
+            raw = await reader.readline()
+            line = raw.decode("utf-8", errors="ignore").strip()
+            if not line:
+                continue
+            logger.trace(f"Received from '{port}': {line}")
+            received.append(line)
+    finally:
+        writer.close()
+    return received
+
+
+async def receive_transport(port: str, count: int, logger: Logger) -> list[str]:
+    transport = SerialTransport(logger, SerialReceiverSettings(port=port, baud=921600, timeout=3, retry_interval=0.1))
+    received: list[str] = []
+    done = asyncio.Event()
+
+    def on_lines(lines: list[str]) -> None:
+        received.extend(lines)
+        if len(received) >= count:
+            done.set()
+
+    transport.lines_received.subscribe(on_lines)
+    await transport.start()
+    try:
+        await done.wait()
+    finally:
+        await transport.stop()
+    return received
+
+
+async def measure(receive, lines: list[str], logger: Logger) -> float:
+    master_fd, slave_fd = pty.openpty()
+    tty.setraw(slave_fd)
+    port = os.ttyname(slave_fd)
+    payload = "".join(f"{line}\n" for line in lines).encode("utf-8")
+
+    try:
+        task = asyncio.create_task(receive(port, len(lines), logger))
+        await asyncio.sleep(0.2)  # let the reader open the port before anything is written
+
+        started = time.perf_counter()
+        writer = threading.Thread(target=write_lines, args=(master_fd, payload), daemon=True)
+        writer.start()
+        received = await task
+        elapsed = time.perf_counter() - started
+        writer.join()
+    finally:
+        os.close(master_fd)
+        os.close(slave_fd)
+
+    if received != lines:
+        raise AssertionError(f"{receive.__name__} delivered {len(received)} lines that differ from the {len(lines)} sent.")
+    return elapsed
+
+
+async def run(a: argparse.Namespace) -> None:
+    log_path = os.path.join(tempfile.gettempdir(), "serial_transport_benchmark.log")
+    logger = get_logger(LoggingSettings(minimum_level=a.log_level, file_path=log_path), name="serial_transport_benchmark")
+    lines = make_lines(a.lines)
+
+    readline_s: list[float] = []
+    transport_s: list[float] = []
+    for _ in range(a.repeat):
+        readline_s.append(await measure(receive_readline, lines, logger))
+        transport_s.append(await measure(receive_transport, lines, logger))
+
+    readline_us = min(readline_s) / a.lines * 1e6
+    transport_us = min(transport_s) / a.lines * 1e6
+    print(f"{'reader':>16} {'us/line':>9} {'lines/s':>11}")
+    print(f"{'readline()':>16} {readline_us:>9.2f} {1e6 / readline_us:>11.0f}")
+    print(f"{'SerialTransport':>16} {transport_us:>9.2f} {1e6 / transport_us:>11.0f}")
+    print(f"speedup {readline_us / transport_us:.2f}x")
+
+
+def main() -> int:
+    asyncio.run(run(build_parser().parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
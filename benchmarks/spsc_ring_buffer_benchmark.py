@@ -0,0 +1,119 @@
+import argparse
+import multiprocessing
+import queue
+import time
+
+from gamevolt.io.spsc_ring_buffer import SpscRingBuffer
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="spsc_ring_buffer_benchmark",
+        description="Move relay lines from one process to another through SpscRingBuffer and through multiprocessing.Queue.",
+    )
+    p.add_argument("--lines", type=int, default=100000, help="Lines sent per measurement.")
+    p.add_argument("--capacity", type=int, default=1 << 20, help="Ring buffer capacity in bytes.")
+    p.add_argument("--batch", type=int, default=2048, help="Max records per consumer drain.")
+    p.add_argument("--repeat", type=int, default=3, help="Measurements per transport (best is reported).")
+    p.add_argument("--start-method", default="spawn", choices=multiprocessing.get_all_start_methods())
+    return p
+
+
+def make_lines(count: int) -> list[str | bytes]:
+    lines: list[str | bytes] = []
+    for seq in range(count):
+        if seq % 4 == 3:
+            lines.append(b"WB\x01\x00" + seq.to_bytes(4, "little") * 16)
+        else:
+            lines.append(f'PKTD t_rx=1 t0={1000 + seq * 40} dt_us=5000 tag=E001 seq={seq} nsamp=2 data="100,200,30000;-5,7,32767"')
+    return lines
+
+
+def ring_consumer(ring: SpscRingBuffer, count: int, batch: int, result: multiprocessing.Queue) -> None:
+    received: list[str | bytes] = []
+    while len(received) < count:
+        items = ring.drain(batch)
+        if items:
+            received.extend(items)
+        else:
+            time.sleep(0)
+    result.put(received)
+    ring.close()
+
+
+def queue_consumer(source: multiprocessing.Queue, count: int, result: multiprocessing.Queue) -> None:
+    received: list[str | bytes] = []
+    while len(received) < count:
+        received.append(source.get())
+    result.put(received)
+
+
+def run_ring(ctx, lines: list[str | bytes], capacity: int, batch: int) -> tuple[float, list, int]:
+    ring = SpscRingBuffer.create(capacity)
+    result = ctx.Queue()
+    process = ctx.Process(target=ring_consumer, args=(ring, len(lines), batch, result))
+    process.start()
+
+    started = time.perf_counter()
+    for line in lines:
+        while not ring.try_put(line):
+            time.sleep(0)
+    received = result.get()
+    elapsed = time.perf_counter() - started
+
+    process.join()
+    high_water = ring.high_water_mark_bytes
+    ring.close()
+    return elapsed, received, high_water
+
+
+def run_queue(ctx, lines: list[str | bytes]) -> tuple[float, list]:
+    source = ctx.Queue()
+    result = ctx.Queue()
+    process = ctx.Process(target=queue_consumer, args=(source, len(lines), result))
+    process.start()
+
+    started = time.perf_counter()
+    for line in lines:
+        source.put(line)
+    try:
+        received = result.get(timeout=600)
+    except queue.Empty:
+        received = []
+    elapsed = time.perf_counter() - started
+
+    process.join()
+    return elapsed, received
+
+
+def main() -> int:
+    a = build_parser().parse_args()
+    ctx = multiprocessing.get_context(a.start_method)
+    lines = make_lines(a.lines)
+
+    ring_s: list[float] = []
+    queue_s: list[float] = []
+    high_water = 0
+
+    for _ in range(a.repeat):
+        elapsed, received, high_water = run_ring(ctx, lines, a.capacity, a.batch)
+        if received != lines:
+            raise AssertionError("Ring buffer delivered lines out of order or altered.")
+        ring_s.append(elapsed)
+
+        elapsed, received = run_queue(ctx, lines)
+        if received != lines:
+            raise AssertionError("multiprocessing.Queue delivered lines out of order or altered.")
+        queue_s.append(elapsed)
+
+    ring_us = min(ring_s) / a.lines * 1e6
+    queue_us = min(queue_s) / a.lines * 1e6
+    print(f"{'transport':>12} {'us/line':>9} {'lines/s':>11}")
+    print(f"{'ring':>12} {ring_us:>9.2f} {1e6 / ring_us:>11.0f}   high water {high_water}/{a.capacity} bytes")
+    print(f"{'mp.Queue':>12} {queue_us:>9.2f} {1e6 / queue_us:>11.0f}")
+    print(f"speedup {queue_us / ring_us:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+import argparse
+import math
+import random
+import timeit
+
+import numpy as np
+
+from wand.data.wand_binary_codec import WandBinaryCodec
+from wand.packet_header import PacketHeader
+
+MODES = {
+    "raw": 0,
+    "delta": WandBinaryCodec.FLAG_DELTA,
+    "zlib": WandBinaryCodec.FLAG_ZLIB,
+    "delta+zlib": WandBinaryCodec.FLAG_DELTA | WandBinaryCodec.FLAG_ZLIB,
+}
+
+# (sweep rate, jitter) in radians per sample at 200 Hz
+PROFILES = {
+    "held": (0.0, 0.0005),
+    "pointing": (0.005, 0.001),
+    "casting": (0.04, 0.003),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="wand_binary_transcoding_benchmark",
+        description="Check transcoded binary frames round-trip exactly, then compare their size and encode/decode cost.",
+    )
+    p.add_argument("--sizes", type=int, nargs="+", default=[8, 32], help="Samples per packet.")
+    p.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=list(PROFILES), help="Wand motion to encode.")
+    p.add_argument("--packets", type=int, default=5000, help="Packets encoded/decoded per measurement.")
+    p.add_argument("--repeat", type=int, default=3, help="Measurements per mode (best is reported).")
+    p.add_argument("--fuzz", type=int, default=20000, help="Random packets checked for equivalence before timing.")
+    p.add_argument("--seed", type=int, default=0)
+    return p
+
+
+def make_header(rng: random.Random, nsamp: int) -> PacketHeader:
+    return PacketHeader(rng.randint(0, 2**32 - 1), f"{rng.randint(0, 0xFFFF):04X}", rng.randint(0, 2**40), 5000, nsamp, "yawpitch", 0.0)
+
+
+def make_motion(rng: random.Random, nsamp: int, profile: str = "casting") -> list[tuple[int, int, int]]:
+    """A wand forward vector sweeping at 200 Hz, as q15 triplets."""
+    rate, jitter = PROFILES[profile]
+    yaw = rng.uniform(-math.pi, math.pi)
+    pitch = rng.uniform(-1.0, 1.0)
+    yaw_rate, pitch_rate = rng.uniform(-rate, rate), rng.uniform(-rate, rate) * 0.6
+
+    samples = []
+    for _ in range(nsamp):
+        yaw += yaw_rate + rng.gauss(0.0, jitter)
+        pitch += pitch_rate + rng.gauss(0.0, jitter)
+        x, y, z = math.cos(pitch) * math.cos(yaw), math.cos(pitch) * math.sin(yaw), math.sin(pitch)
+        samples.append((round(x * 32767), round(y * 32767), round(z * 32767)))
+    return samples
+
+
+def make_noise(rng: random.Random, nsamp: int) -> list[tuple[int, int, int]]:
+    # includes out-of-range values, which every mode must clamp identically
+    return [tuple(rng.choice((rng.randint(-32767, 32767), -40000, 40000, -32767, 32767, 0)) for _ in range(3)) for _ in range(nsamp)]
+
+
+def check_equivalence(codec: WandBinaryCodec, rng: random.Random, count: int) -> None:
+    for _ in range(count):
+        nsamp = rng.randint(0, 40)
+        samples = make_noise(rng, nsamp) if rng.random() < 0.5 else make_motion(rng, nsamp, rng.choice(list(PROFILES)))
+        header = make_header(rng, nsamp)
+        expected = np.clip(np.array(samples, dtype=np.int64).reshape(-1, 3), -32767, 32767)
+
+        frames = []
+        for mode, flags in MODES.items():
+            frame = codec.encode(header, samples, flags)
+            packet = codec.decode(frame)
+            if packet is None or packet.seq != header.seq or packet.tag_hex != header.tag_hex or packet.nsamp != nsamp:
+                raise AssertionError(f"{mode} frame did not decode (nsamp={nsamp}).")
+            if not np.array_equal(np.array(packet.samples, dtype=np.int64).reshape(-1, 3), expected):
+                raise AssertionError(f"{mode} frame decoded to different samples (nsamp={nsamp}).")
+            frames.append(frame)
+
+        if list(codec.split(b"".join(frames))) != frames:
+            raise AssertionError("Concatenated frames did not split back into the originals.")
+
+        # truncated or corrupted transcoded frames must be rejected, never raise
+        frame = frames[-1]
+        codec.decode(frame[: rng.randint(0, len(frame) - 1)])
+        codec.decode(frame[:-1] + bytes([frame[-1] ^ 0xFF]))
+
+
+def measure(codec: WandBinaryCodec, rng: random.Random, profile: str, nsamp: int, packet_count: int, repeat: int) -> None:
+    packets = [(make_header(rng, nsamp), make_motion(rng, nsamp, profile)) for _ in range(200)]
+    rounds = max(1, packet_count // len(packets))
+    per_packet = rounds * len(packets)
+    raw_bytes = 0.0
+
+    for mode, flags in MODES.items():
+        frames = [codec.encode(h, s, flags) for h, s in packets]
+        size = sum(len(f) for f in frames) / len(frames)
+        raw_bytes = raw_bytes or size
+
+        encode_s = min(timeit.repeat(lambda: [codec.encode(h, s, flags) for h, s in packets], number=rounds, repeat=repeat))
+        decode_s = min(timeit.repeat(lambda: [codec.decode(f) for f in frames], number=rounds, repeat=repeat))
+        print(
+            f"{profile:>9} {nsamp:>6} {mode:>11} {size:>10.1f} {size / raw_bytes:>6.2f}x "
+            f"{encode_s / per_packet * 1e6:>10.2f} {decode_s / per_packet * 1e6:>10.2f}"
+        )
+
+    text_bytes = sum(len(";".join(f"{x},{y},{z}" for x, y, z in s)) for _, s in packets) / len(packets)
+    print(f"{profile:>9} {nsamp:>6} {'text DATA':>11} {text_bytes:>10.1f}")
+
+
+def main() -> int:
+    a = build_parser().parse_args()
+    rng = random.Random(a.seed)
+    codec = WandBinaryCodec()
+
+    check_equivalence(codec, rng, a.fuzz)
+
+    print(f"{'profile':>9} {'nsamp':>6} {'mode':>11} {'bytes/pkt':>10} {'vs raw':>7} {'encode us':>10} {'decode us':>10}")
+    for profile in a.profiles:
+        for nsamp in a.sizes:
+            measure(codec, rng, profile, nsamp, a.packets, a.repeat)
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,83 @@
+import argparse
+import logging
+import math
+import random
+import timeit
+from typing import Iterable
+
+from wand.wand_client import WandClient
+from wand.wand_rotation_raw import WandRotationRaw
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="wand_client_decode_benchmark",
+        description="Compare per-sample and batch (NumPy) decoding of DATA payloads in WandClient.",
+    )
+    p.add_argument("--sizes", type=int, nargs="+", default=[8, 16, 32], help="Samples per packet.")
+    p.add_argument("--packets", type=int, default=20000, help="Packets decoded per measurement.")
+    p.add_argument("--repeat", type=int, default=5, help="Measurements per size (best is reported).")
+    return p
+
+
+def per_sample_reference(wand_id: str, t0_ms: int, sample_dt_us: int, data_str: str) -> Iterable[WandRotationRaw]:
+    """The original string-split, one-sample-at-a-time decoder."""
+    dt_ms = sample_dt_us / 1000.0
+    idx = 0
+
+    for part in data_str.split(";"):
+        part = part.strip().strip('"')
+        if not part:
+            continue
+
+        toks = [t.strip() for t in part.split(",") if t.strip()]
+        if len(toks) < 3:
+            continue
+
+        try:
+            q = (int(toks[0]), int(toks[1]), int(toks[2]))
+        except ValueError:
+            continue
+
+        fx, fy, fz = (max(-1.0, min(1.0, v / 32767.0)) for v in q)
+        mag = math.sqrt(fx * fx + fy * fy + fz * fz)
+        fx, fy, fz = (0.0, 0.0, 0.0) if mag < 1e-6 else (fx / mag, fy / mag, fz / mag)
+
+        yield WandRotationRaw(id=wand_id, ms=int(round(t0_ms + idx * dt_ms)), fx=fx, fy=fy, fz=fz)
+        idx += 1
+
+
+def make_payload(nsamp: int) -> str:
+    return ";".join(
+        f"{random.randint(-32767, 32767)},{random.randint(-32767, 32767)},{random.randint(-32767, 32767)}" for _ in range(nsamp)
+    )
+
+
+def main() -> int:
+    a = build_parser().parse_args()
+
+    random.seed(0)
+    client = WandClient(logger=logging.getLogger("benchmark"), id="E000")
+
+    print(f"{'nsamp':>6} {'per-sample us/pkt':>18} {'batch us/pkt':>13} {'speedup':>8}")
+    for nsamp in a.sizes:
+        payload = make_payload(nsamp)
+
+        reference = list(per_sample_reference("E000", 1000, 5000, payload))
+        batch = client.decode_batch(1000, 5000, payload)
+        decoded = [WandRotationRaw("E000", ms, fx, fy, fz) for ms, (fx, fy, fz) in zip(batch.ts_ms.tolist(), batch.f.tolist())]
+        if decoded != reference:
+            raise AssertionError(f"Batch decode differs from the per-sample decoder (nsamp={nsamp}).")
+
+        scalar_s = min(timeit.repeat(lambda: list(per_sample_reference("E000", 1000, 5000, payload)), number=a.packets, repeat=a.repeat))
+        batch_s = min(timeit.repeat(lambda: client.decode_batch(1000, 5000, payload), number=a.packets, repeat=a.repeat))
+
+        scalar_us = scalar_s / a.packets * 1e6
+        batch_us = batch_s / a.packets * 1e6
+        print(f"{nsamp:>6} {scalar_us:>18.2f} {batch_us:>13.2f} {scalar_us / batch_us:>7.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
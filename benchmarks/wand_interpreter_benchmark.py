@@ -0,0 +1,208 @@
+import argparse
+import math
+import timeit
+
+import numpy as np
+
+from wand.interpreters.configuration.rmf_settings import ClipMode, RMFSettings
+from wand.interpreters.wand_forward_gravity_interpreter import ForwardGravityInterpreter
+from wand.interpreters.wand_yawpitch_rmf_interpreter import YawPitchRMFInterpreter
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="wand_interpreter_benchmark",
+        description="Check the batch (NumPy) wand interpreters against their per-sample path, then compare their speed.",
+    )
+    p.add_argument("--sizes", type=int, nargs="+", default=[8, 16, 32], help="Samples per packet.")
+    p.add_argument("--packets", type=int, default=2000, help="Packets interpreted per measurement.")
+    p.add_argument("--repeat", type=int, default=5, help="Measurements per size (best is reported).")
+    p.add_argument("--fuzz", type=int, default=500, help="Random sample streams checked for equivalence before timing.")
+    p.add_argument("--tolerance", type=float, default=1e-9, help="Largest allowed difference between the two paths.")
+    p.add_argument("--seed", type=int, default=0)
+    return p
+
+
+def make_forward(rng: np.random.Generator, count: int) -> np.ndarray:
+    """A wand forward vector sweeping at 200 Hz, with the odd repeated, zero and straight-up sample."""
+    yaw = np.cumsum(rng.normal(0.0, 0.03, count)) + rng.uniform(-math.pi, math.pi)
+    pitch = np.clip(np.cumsum(rng.normal(0.0, 0.02, count)) + rng.uniform(-1.2, 1.2), -1.55, 1.55)
+    f = np.column_stack((np.cos(pitch) * np.cos(yaw), np.cos(pitch) * np.sin(yaw), np.sin(pitch)))
+
+    if count > 3 and rng.random() < 0.3:
+        f[rng.integers(1, count)] = f[rng.integers(count)]
+        f[rng.integers(count)] = 0.0
+        f[rng.integers(count)] = (0.0, 0.0, 1.0)
+    return f
+
+
+def make_yawpitch(rng: np.random.Generator, count: int) -> tuple[np.ndarray, np.ndarray]:
+    """Yaw/pitch in degrees, sweeping at 200 Hz across the ±180° seam, with the odd repeated and pole sample."""
+    yaw = np.cumsum(rng.normal(0.0, 1.5, count)) + rng.uniform(-180.0, 180.0)
+    pitch = np.clip(np.cumsum(rng.normal(0.0, 1.0, count)) + rng.uniform(-70.0, 70.0), -90.0, 90.0)
+
+    if count > 3 and rng.random() < 0.3:
+        i = rng.integers(1, count)
+        yaw[i], pitch[i] = yaw[i - 1], pitch[i - 1]
+        pitch[rng.integers(count)] = 90.0
+    return (yaw + 180.0) % 360.0 - 180.0, pitch
+
+
+def make_settings(rng: np.random.Generator) -> RMFSettings:
+    return RMFSettings(
+        world_up=((0.0, 0.0, 1.0), (0.0, 1.0, 0.0), (0.2, 0.1, 0.95))[rng.integers(3)],
+        gain_x=float(rng.choice((1.0, 2.5))),
+        deadzone_x=float(rng.choice((0.0, 0.002))),
+        deadzone_y=float(rng.choice((0.0, 0.002))),
+        invert_x=bool(rng.integers(2)),
+        invert_y=bool(rng.integers(2)),
+        abs_invert_x=bool(rng.integers(2)),
+        abs_invert_y=bool(rng.integers(2)),
+        abs_yaw_limit_deg=float(rng.choice((45.0, 90.0))),
+        abs_clip_mode=(ClipMode.CLAMP, ClipMode.DISCARD)[rng.integers(2)],
+    )
+
+
+def largest_difference(expected: float | None, actual: float) -> float:
+    if expected is None:
+        return 0.0 if math.isnan(actual) else math.inf
+    return abs(expected - actual)
+
+
+def check_forward_gravity(rng: np.random.Generator, streams: int, tolerance: float) -> float:
+    worst = 0.0
+    for _ in range(streams):
+        settings = make_settings(rng)
+        scalar, batch = ForwardGravityInterpreter(settings), ForwardGravityInterpreter(settings)
+        batch.BATCH_MIN_SAMPLES = 0  # check the NumPy path at every size, not just where on_batch picks it
+
+        for _ in range(8):
+            count = int(rng.integers(0, 40))
+            f = make_forward(rng, count)
+            if count and rng.random() < 0.3:
+                # straight along world up, where elevation (asin) is most sensitive to rounding
+                f[rng.integers(count)] = settings.world_up
+            ts_ms = np.arange(count, dtype=np.int64)
+            result = batch.on_batch("E000", ts_ms, f)
+
+            for i, (fx, fy, fz) in enumerate(f.tolist()):
+                expected = scalar.on_sample("E000", i, fx, fy, fz)
+                worst = max(
+                    worst,
+                    largest_difference(expected.x_delta, result.x_delta[i]),
+                    largest_difference(expected.y_delta, result.y_delta[i]),
+                    largest_difference(expected.nx, result.nx[i]),
+                    largest_difference(expected.ny, result.ny[i]),
+                )
+
+        if worst > tolerance:
+            raise AssertionError(f"ForwardGravityInterpreter batch differs from per-sample by {worst:g}.")
+    return worst
+
+
+def check_yawpitch(rng: np.random.Generator, streams: int, tolerance: float) -> float:
+    worst = 0.0
+    for _ in range(streams):
+        settings = make_settings(rng)
+        scalar, batch = YawPitchRMFInterpreter(settings), YawPitchRMFInterpreter(settings)
+        batch.BATCH_MIN_SAMPLES = 0
+
+        for _ in range(8):
+            count = int(rng.integers(0, 40))
+            yaw, pitch = make_yawpitch(rng, count)
+            ts_ms = np.arange(count, dtype=np.int64)
+            result = batch.on_batch("E000", ts_ms, yaw, pitch)
+
+            for i, (y, p) in enumerate(zip(yaw.tolist(), pitch.tolist())):
+                expected = scalar.on_sample("E000", i, y, p)
+                worst = max(
+                    worst,
+                    largest_difference(expected.x_delta, result.x_delta[i]),
+                    largest_difference(expected.y_delta, result.y_delta[i]),
+                    largest_difference(expected.nx, result.nx[i]),
+                    largest_difference(expected.ny, result.ny[i]),
+                )
+
+        # the transported frame carries into the next packet, so it must match too
+        if scalar._r_prev is not None:
+            worst = max(worst, *(abs(e - a) for e, a in zip(scalar._r_prev + scalar._v_prev, batch._r_prev + batch._v_prev)))
+        if worst > tolerance:
+            raise AssertionError(f"YawPitchRMFInterpreter batch differs from per-sample by {worst:g}.")
+    return worst
+
+
+def measure_forward_gravity(rng: np.random.Generator, nsamp: int, packet_count: int, repeat: int) -> tuple[float, float, float]:
+    """Seconds per packet: on_sample per sample, on_batch as shipped, and on_batch's NumPy path forced."""
+    packets = [make_forward(rng, nsamp) for _ in range(200)]
+    rows = [f.tolist() for f in packets]
+    ts_ms = np.arange(nsamp, dtype=np.int64)
+    rounds = max(1, packet_count // len(packets))
+    interpreter = ForwardGravityInterpreter()
+    vectorised = ForwardGravityInterpreter()
+    vectorised.BATCH_MIN_SAMPLES = 0
+
+    def scalar() -> None:
+        for packet in rows:
+            for fx, fy, fz in packet:
+                interpreter.on_sample("E000", 0, fx, fy, fz)
+
+    def batch(target: ForwardGravityInterpreter) -> None:
+        for f in packets:
+            target.on_batch("E000", ts_ms, f)
+
+    per_packet = rounds * len(packets)
+    scalar_s = min(timeit.repeat(scalar, number=rounds, repeat=repeat)) / per_packet
+    batch_s = min(timeit.repeat(lambda: batch(interpreter), number=rounds, repeat=repeat)) / per_packet
+    numpy_s = min(timeit.repeat(lambda: batch(vectorised), number=rounds, repeat=repeat)) / per_packet
+    return scalar_s, batch_s, numpy_s
+
+
+def measure_yawpitch(rng: np.random.Generator, nsamp: int, packet_count: int, repeat: int) -> tuple[float, float, float]:
+    """Seconds per packet: on_sample per sample, on_batch as shipped, and on_batch's NumPy path forced."""
+    packets = [make_yawpitch(rng, nsamp) for _ in range(200)]
+    rows = [list(zip(yaw.tolist(), pitch.tolist())) for yaw, pitch in packets]
+    ts_ms = np.arange(nsamp, dtype=np.int64)
+    rounds = max(1, packet_count // len(packets))
+    interpreter = YawPitchRMFInterpreter()
+    vectorised = YawPitchRMFInterpreter()
+    vectorised.BATCH_MIN_SAMPLES = 0
+
+    def scalar() -> None:
+        for packet in rows:
+            for yaw, pitch in packet:
+                interpreter.on_sample("E000", 0, yaw, pitch)
+
+    def batch(target: YawPitchRMFInterpreter) -> None:
+        for yaw, pitch in packets:
+            target.on_batch("E000", ts_ms, yaw, pitch)
+
+    per_packet = rounds * len(packets)
+    scalar_s = min(timeit.repeat(scalar, number=rounds, repeat=repeat)) / per_packet
+    batch_s = min(timeit.repeat(lambda: batch(interpreter), number=rounds, repeat=repeat)) / per_packet
+    numpy_s = min(timeit.repeat(lambda: batch(vectorised), number=rounds, repeat=repeat)) / per_packet
+    return scalar_s, batch_s, numpy_s
+
+
+def main() -> int:
+    a = build_parser().parse_args()
+    rng = np.random.default_rng(a.seed)
+
+    worst = check_forward_gravity(rng, a.fuzz, a.tolerance)
+    print(f"ForwardGravityInterpreter: {a.fuzz} streams match per-sample (largest difference {worst:.1e}).")
+    worst = check_yawpitch(rng, a.fuzz, a.tolerance)
+    print(f"YawPitchRMFInterpreter: {a.fuzz} streams match per-sample (largest difference {worst:.1e}).")
+
+    print(f"{'interpreter':>14} {'nsamp':>6} {'scalar us/pkt':>14} {'batch us/pkt':>13} {'numpy us/pkt':>13} {'speedup':>8}")
+    for name, measure in (("forward", measure_forward_gravity), ("yawpitch", measure_yawpitch)):
+        for nsamp in a.sizes:
+            scalar_s, batch_s, numpy_s = measure(rng, nsamp, a.packets, a.repeat)
+            print(
+                f"{name:>14} {nsamp:>6} {scalar_s * 1e6:>14.2f} {batch_s * 1e6:>13.2f} {numpy_s * 1e6:>13.2f} "
+                f"{scalar_s / batch_s:>7.2f}x"
+            )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,28 @@
+import logging
+from dataclasses import dataclass
+
+from gamevolt.io.spsc_ring_buffer import SpscRingBuffer
+from gamevolt.logging import Logger
+
+
+@dataclass
+class SpscRingBufferStats:
+    drained: int = 0
+    drains: int = 0
+    max_drain: int = 0
+
+    last_log_monotonic: float = 0.0
+    log_interval_s: float = 2.0
+
+    def maybe_log(self, logger: Logger, now: float, name: str, ring: SpscRingBuffer) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        if (now - self.last_log_monotonic) < self.log_interval_s:
+            return
+
+        self.last_log_monotonic = now
+        logger.debug(
+            f"{name} ring buffer: put={ring.put_count} drained={self.drained} drains={self.drains} "
+            f"max_drain={self.max_drain} dropped={ring.dropped_count} depth_items={ring.depth_items} "
+            f"depth_bytes={ring.depth_bytes} high_water_bytes={ring.high_water_mark_bytes}/{ring.capacity_bytes}"
+        )
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import asyncio
 from typing import Any
 
 from gamevolt.logging import Logger
+from gamevolt.messaging.command_bridge.anchor_command_priority import AnchorCommandPriority
+from gamevolt.messaging.command_bridge.anchor_command_scheduler import AnchorCommandScheduler
 from gamevolt.messaging.events.message_handler import MessageHandler
-from gamevolt.serial.line_sender_protocol import LineSenderProtocol
+from gamevolt.messaging.message import Message
 from messaging.messages.wand_haptic_message import WandHapticMessage
 from messaging.messages.wand_haptic_sequence_message import WandHapticSequenceMessage
 from messaging.messages.wand_led_message import WandLedMessage
@@ -13,13 +14,18 @@ from messaging.messages.wand_tx_message import WandTxMessage
 
 
 class AnchorCommandBridge:
-    def __init__(self, logger: Logger, message_handler: MessageHandler, serial_transport: LineSenderProtocol) -> None:
+    def __init__(
+        self,
+        logger: Logger,
+        message_handler: MessageHandler,
+        scheduler: AnchorCommandScheduler,
+        anchor_id: str | None = None,
+    ) -> None:
         self._message_handler = message_handler
-        self._serial = serial_transport
+        self._scheduler = scheduler
+        self._anchor_id = anchor_id
         self._logger = logger
 
-        self._send_lock = asyncio.Lock()
-
     def start(self) -> None:
         self._message_handler.subscribe_typed(WandHapticSequenceMessage, self._on_wand_haptic_sequence_message)
         self._message_handler.subscribe_typed(WandHapticMessage, self._on_wand_haptic_message)
@@ -32,6 +38,11 @@ class AnchorCommandBridge:
         self._message_handler.unsubscribe_typed(WandLedMessage, self._on_wand_led_message)
         self._message_handler.unsubscribe_typed(WandTxMessage, self._on_wand_tx_message)
 
+    def _is_for_this_anchor(self, message: Message) -> bool:
+        # Multi-anchor relays share one connection; messages aimed at one anchor carry its ID, broadcasts do not.
+        target = getattr(message, "AnchorId", None)
+        return self._anchor_id is None or target is None or target == self._anchor_id
+
     def _norm_tag(self, tag_id: Any) -> str:
         if tag_id is None:
             raise ValueError("tag_id is required")
@@ -52,14 +63,14 @@ class AnchorCommandBridge:
 
         raise ValueError(f"Unsupported tag_id type: {type(tag_id)}")
 
-    def _fire_and_forget_send(self, line: str) -> None:
-        async def _run() -> None:
-            async with self._send_lock:
-                await self._serial.send_line_async(line)
-
-        asyncio.create_task(_run())
+    def _submit(self, priority: AnchorCommandPriority, tag: str, command: str, line: str, coalesce: bool = True) -> None:
+        self._logger.verbose(f"UDP msg -> SERIAL '{line}'")
+        self._scheduler.submit(priority, tag, command, line, coalesce)
 
     def _on_wand_led_message(self, message: WandLedMessage) -> None:
+        if not self._is_for_this_anchor(message):
+            return
+
         tag = self._norm_tag(message.tag_id)
         seq = int(message.sequence_id)
 
@@ -67,17 +78,19 @@ class AnchorCommandBridge:
             self._logger.warning(f"Invalid sequence_id={seq} for WandLedMessage")
             return
 
-        line = f"led {tag} {1 if message.enabled else 0} {seq}"
-        self._logger.verbose(f"UDP msg -> SERIAL '{line}'")
-        self._fire_and_forget_send(line)
+        self._submit(AnchorCommandPriority.LED, tag, "led", f"led {tag} {1 if message.enabled else 0} {seq}")
 
     def _on_wand_tx_message(self, message: WandTxMessage) -> None:
+        if not self._is_for_this_anchor(message):
+            return
+
         tag = self._norm_tag(message.tag_id)
-        line = f"tx {tag} {1 if message.enabled else 0}"
-        self._logger.verbose(f"UDP msg -> SERIAL '{line}'")
-        self._fire_and_forget_send(line)
+        self._submit(AnchorCommandPriority.TX, tag, "tx", f"tx {tag} {1 if message.enabled else 0}")
 
     def _on_wand_haptic_message(self, message: WandHapticMessage) -> None:
+        if not self._is_for_this_anchor(message):
+            return
+
         tag = self._norm_tag(message.tag_id)
         pattern_id = int(message.pattern_id)
 
@@ -85,11 +98,12 @@ class AnchorCommandBridge:
             self._logger.warning(f"Invalid pattern_id={pattern_id} for WandHapticMessage")
             return
 
-        line = f"hplay {tag} {pattern_id}"
-        self._logger.verbose(f"UDP msg -> SERIAL '{line}'")
-        self._fire_and_forget_send(line)
+        self._submit(AnchorCommandPriority.HAPTIC, tag, "hplay", f"hplay {tag} {pattern_id}", coalesce=False)
 
     def _on_wand_haptic_sequence_message(self, message: WandHapticSequenceMessage) -> None:
+        if not self._is_for_this_anchor(message):
+            return
+
         tag = self._norm_tag(message.tag_id)
 
         try:
@@ -106,9 +120,7 @@ class AnchorCommandBridge:
             self._logger.warning(f"Invalid pattern_ids={patterns} for WandHapticSequenceMessage")
             return
 
-        line = f"hseq {tag} {' '.join(str(pattern_id) for pattern_id in patterns)}"
-        self._logger.verbose(f"UDP msg -> SERIAL '{line}'")
-        self._fire_and_forget_send(line)
+        self._submit(AnchorCommandPriority.HAPTIC, tag, "hseq", f"hseq {tag} {' '.join(str(pattern_id) for pattern_id in patterns)}")
 
     # def _send_line_repeating(self, line: str, repeat: int) -> None:
     #     for i in range(repeat):
@@ -0,0 +1,9 @@
+from enum import IntEnum
+
+
+class AnchorCommandPriority(IntEnum):
+    """Lower values are sent first."""
+
+    TX = 0
+    HAPTIC = 1
+    LED = 2
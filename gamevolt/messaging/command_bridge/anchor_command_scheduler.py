@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import dataclass
+
+from gamevolt.logging import Logger
+from gamevolt.messaging.command_bridge.anchor_command_priority import AnchorCommandPriority
+from gamevolt.messaging.command_bridge.anchor_command_scheduler_stats import AnchorCommandSchedulerStats
+from gamevolt.messaging.command_bridge.configuration.anchor_command_scheduler_settings import AnchorCommandSchedulerSettings
+from gamevolt.serial.line_sender_protocol import LineSenderProtocol
+from gamevolt.web_sockets.web_socket_client import WebSocketClient
+from messaging.messages.anchor_command_queue_message import AnchorCommandQueueMessage
+
+
+@dataclass
+class PendingCommand:
+    line: str
+    submitted_monotonic: float
+
+
+class AnchorCommandScheduler:
+    """
+    Outbound serial command queue for one anchor, drained by a single task.
+
+    Commands are sent highest priority first and oldest first within a priority. A state command (`coalesce`)
+    for a tag and command kind that is still waiting replaces the waiting one, since only the latest state
+    matters; it moves to the back of the queue, so it still goes out after anything submitted before it (a
+    broadcast to "*" in between, say). One-shot commands such as a haptic pulse are never merged. Sending is paced by a token bucket of `link_share` of the link's byte rate, so a burst of low-priority
+    commands cannot crowd out the serial transport's queue.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        settings: AnchorCommandSchedulerSettings,
+        serial_transport: LineSenderProtocol,
+        baud: int,
+        anchor_id: str,
+        web_socket_client: WebSocketClient | None = None,
+    ) -> None:
+        self._serial = serial_transport
+        self._web_socket_client = web_socket_client
+        self._anchor_id = anchor_id
+        self._settings = settings
+        self._logger = logger
+
+        # 10 bits per byte on the wire (8N1)
+        self._bytes_per_s = max(1.0, baud / 10.0 * settings.link_share)
+        self._tokens = float(settings.burst_bytes)
+        self._refilled_monotonic = time.monotonic()
+
+        self._queues: list[OrderedDict[tuple, PendingCommand]] = [OrderedDict() for _ in AnchorCommandPriority]
+        self._depth = 0
+        self._one_shot_ids = itertools.count()
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._report_task: asyncio.Task | None = None
+
+        self._stats = AnchorCommandSchedulerStats(last_log_monotonic=time.monotonic(), log_interval_s=settings.report_interval_s)
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def stats(self) -> AnchorCommandSchedulerStats:
+        return self._stats
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+        self._report_task = asyncio.create_task(self._report_loop())
+
+    async def stop_async(self) -> None:
+        for task in (self._task, self._report_task):
+            if task is not None:
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+
+        self._task = None
+        self._report_task = None
+
+    def submit(self, priority: AnchorCommandPriority, tag: str, command: str, line: str, coalesce: bool = True) -> None:
+        self._stats.submitted += 1
+        queue = self._queues[priority]
+        key = (tag, command) if coalesce else (tag, command, next(self._one_shot_ids))
+
+        pending = queue.get(key)
+        if pending is not None:
+            # Superseded before it was sent; re-queued behind anything submitted since.
+            pending.line = line
+            pending.submitted_monotonic = time.monotonic()
+            queue.move_to_end(key)
+            self._stats.coalesced += 1
+            return
+
+        if self._depth >= self._settings.max_pending and not self._drop_lowest(priority):
+            self._stats.dropped += 1
+            self._logger.warning(f"Anchor ({self._anchor_id}) command queue full; dropped '{line}'.")
+            return
+
+        queue[key] = PendingCommand(line, time.monotonic())
+        self._depth += 1
+        self._stats.max_depth = max(self._stats.max_depth, self._depth)
+        self._wake.set()
+
+    def pending_by_priority(self) -> list[int]:
+        return [len(queue) for queue in self._queues]
+
+    async def _run(self) -> None:
+        while True:
+            queue = next((q for q in self._queues if q), None)
+            if queue is None:
+                self._wake.clear()
+                await self._wake.wait()
+                continue
+
+            pending = next(iter(queue.values()))
+            cost = min(len(pending.line) + 1, self._settings.burst_bytes)
+
+            shortfall = cost - self._refill()
+            if shortfall > 0:
+                # Re-checked after the wait: something more urgent may have arrived meanwhile.
+                await asyncio.sleep(shortfall / self._bytes_per_s)
+                continue
+
+            queue.popitem(last=False)
+            self._depth -= 1
+            self._tokens -= cost
+
+            now = time.monotonic()
+            self._stats.sent += 1
+            self._stats.sent_bytes += cost
+            self._stats.max_wait_s = max(self._stats.max_wait_s, now - pending.submitted_monotonic)
+
+            await self._serial.send_line_async(pending.line)
+
+    def _refill(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(float(self._settings.burst_bytes), self._tokens + (now - self._refilled_monotonic) * self._bytes_per_s)
+        self._refilled_monotonic = now
+        return self._tokens
+
+    def _drop_lowest(self, priority: AnchorCommandPriority) -> bool:
+        """Makes room for a command of `priority` by dropping the oldest command of the lowest priority not above it."""
+        for queue in reversed(self._queues[priority:]):
+            if queue:
+                _, dropped = queue.popitem(last=False)
+                self._depth -= 1
+                self._stats.dropped += 1
+                self._logger.warning(f"Anchor ({self._anchor_id}) command queue full; dropped '{dropped.line}'.")
+                return True
+
+        return False
+
+    async def _report_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._settings.report_interval_s)
+
+            pending = self.pending_by_priority()
+            self._stats.maybe_log(self._logger, time.monotonic(), f"Anchor ({self._anchor_id})", pending)
+
+            if self._web_socket_client is not None and self._web_socket_client.is_connected:
+                self._web_socket_client.send_message(
+                    AnchorCommandQueueMessage(
+                        anchor_id=self._anchor_id,
+                        pending=pending,
+                        submitted=self._stats.submitted,
+                        coalesced=self._stats.coalesced,
+                        dropped=self._stats.dropped,
+                        sent=self._stats.sent,
+                        max_wait_ms=round(self._stats.max_wait_s * 1000.0, 1),
+                        max_depth=self._stats.max_depth,
+                    )
+                )
+
+            self._stats.max_wait_s = 0.0
+            self._stats.max_depth = self._depth
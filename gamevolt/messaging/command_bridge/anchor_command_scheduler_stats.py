@@ -0,0 +1,32 @@
+import logging
+from dataclasses import dataclass
+
+from gamevolt.logging import Logger
+
+
+@dataclass
+class AnchorCommandSchedulerStats:
+    submitted: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+    sent: int = 0
+    sent_bytes: int = 0
+    # since the last report
+    max_wait_s: float = 0.0
+    max_depth: int = 0
+
+    last_log_monotonic: float = 0.0
+    log_interval_s: float = 2.0
+
+    def maybe_log(self, logger: Logger, now: float, name: str, pending: list[int]) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        if (now - self.last_log_monotonic) < self.log_interval_s:
+            return
+
+        self.last_log_monotonic = now
+        logger.debug(
+            f"{name} command queue: submitted={self.submitted} coalesced={self.coalesced} dropped={self.dropped} "
+            f"sent={self.sent} sent_bytes={self.sent_bytes} pending={pending} max_depth={self.max_depth} "
+            f"max_wait_ms={self.max_wait_s * 1000.0:.1f}"
+        )
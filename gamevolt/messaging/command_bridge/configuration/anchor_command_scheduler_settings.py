@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from gamevolt.configuration.settings_base import SettingsBase
+
+
+@dataclass
+class AnchorCommandSchedulerSettings(SettingsBase):
+    # share of the serial link's byte rate (baud / 10) that commands may use
+    link_share: float = 0.5
+    burst_bytes: int = 256
+
+    # commands waiting to be sent, across all priorities; beyond this the lowest-priority oldest is dropped
+    max_pending: int = 64
+
+    # how often queue metrics are reported to the server
+    report_interval_s: float = 2.0
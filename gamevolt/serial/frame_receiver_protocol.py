@@ -0,0 +1,10 @@
+from collections.abc import Callable
+from typing import Protocol
+
+from gamevolt.events.event import Event
+
+
+class FrameReceiverProtocol(Protocol):
+
+    @property
+    def frame_received(self) -> Event[Callable[[bytes], None]]: ...
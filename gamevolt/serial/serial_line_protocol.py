@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+
+class SerialLineProtocol(asyncio.Protocol):
+    """
+    Frames newline-terminated lines out of whatever chunks the serial transport reads.
+
+    Each chunk is appended to one reusable buffer; every complete line in it is decoded in a single pass and
+    handed to on_lines as one batch, and only the trailing partial line stays buffered for the next chunk.
+    """
+
+    def __init__(self, on_lines: Callable[[list[str]], None], max_line_bytes: int = 4096) -> None:
+        self._on_lines = on_lines
+        self._max_line_bytes = max_line_bytes
+
+        self._buffer = bytearray()
+        self._transport: asyncio.Transport | None = None
+        self._closed: asyncio.Future[Exception | None] = asyncio.get_running_loop().create_future()
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+
+        self.overflowed_bytes = 0
+
+    @property
+    def transport(self) -> asyncio.Transport | None:
+        return self._transport
+
+    @property
+    def closed(self) -> asyncio.Future[Exception | None]:
+        """Resolves with the error (or None) once the port is lost or closed."""
+        return self._closed
+
+    async def wait_writable(self) -> None:
+        await self._can_write.wait()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport  # type: ignore[assignment]
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._transport = None
+        self._buffer.clear()
+        self._can_write.set()
+        if not self._closed.done():
+            self._closed.set_result(exc)
+
+    def pause_writing(self) -> None:
+        self._can_write.clear()
+
+    def resume_writing(self) -> None:
+        self._can_write.set()
+
+    def data_received(self, data: bytes) -> None:
+        buffer = self._buffer
+        buffer += data
+
+        end = buffer.rfind(b"\n")
+        if end < 0:
+            if len(buffer) > self._max_line_bytes:
+                # No terminator in sight (wrong baud, binary noise); drop rather than grow without bound.
+                self.overflowed_bytes += len(buffer)
+                buffer.clear()
+            return
+
+        text = buffer[:end].decode("utf-8", errors="ignore")
+        del buffer[: end + 1]
+
+        lines = [line for line in (part.strip() for part in text.split("\n")) if line]
+        if lines:
+            self._on_lines(lines)
@@ -8,21 +8,29 @@ from contextlib import suppress
 import serial_asyncio
 
 from gamevolt.events.event import Event
-from gamevolt.logging import Logger
+from gamevolt.logging import TRACE, Logger
 from gamevolt.serial.configuration.serial_receiver_settings import SerialReceiverSettings
 from gamevolt.serial.line_receiver_protocol import LineReceiverProtocol
 from gamevolt.serial.line_sender_protocol import LineSenderProtocol
+from gamevolt.serial.serial_line_protocol import SerialLineProtocol
 
 
 class SerialTransport(LineReceiverProtocol, LineSenderProtocol):
+    """
+    Line transport over a serial port, reconnecting until stopped.
+
+    Reads arrive as bulk chunks through SerialLineProtocol rather than one awaited readline() per line; each
+    chunk's complete lines are raised together on lines_received, then one by one on line_received.
+    """
+
     def __init__(self, logger: Logger, settings: SerialReceiverSettings) -> None:
         self._line_received: Event[Callable[[str], None]] = Event()
+        self._lines_received: Event[Callable[[list[str]], None]] = Event()
 
         self._settings = settings
         self._logger = logger
 
-        self._reader: asyncio.StreamReader | None = None
-        self._writer: asyncio.StreamWriter | None = None
+        self._protocol: SerialLineProtocol | None = None
         self._read_task: asyncio.Task | None = None
         self._write_task: asyncio.Task | None = None
         self._running: bool = False
@@ -33,6 +41,10 @@ class SerialTransport(LineReceiverProtocol, LineSenderProtocol):
     def line_received(self) -> Event[Callable[[str], None]]:
         return self._line_received
 
+    @property
+    def lines_received(self) -> Event[Callable[[list[str]], None]]:
+        return self._lines_received
+
     async def send_line_async(self, line: str) -> None:
         # Always newline-terminate for MCU command parser.
         data = (line.rstrip("\r\n") + "\n").encode("utf-8")
@@ -77,11 +89,13 @@ class SerialTransport(LineReceiverProtocol, LineSenderProtocol):
     async def _run(self) -> None:
         try:
             while self._running:
-                if self._reader is None or self._writer is None:
+                if self._protocol is None:
                     try:
                         self._logger.debug(f"Attempting to open serial port '{self._settings.port}' @ {self._settings.baud}...")
 
-                        self._reader, self._writer = await serial_asyncio.open_serial_connection(
+                        _, self._protocol = await serial_asyncio.create_serial_connection(
+                            asyncio.get_running_loop(),
+                            lambda: SerialLineProtocol(self._on_lines),
                             url=self._settings.port,
                             baudrate=self._settings.baud,
                         )
@@ -106,33 +120,15 @@ class SerialTransport(LineReceiverProtocol, LineSenderProtocol):
                         await asyncio.sleep(self._settings.retry_interval)
                         continue
 
-                try:
-                    raw = await self._reader.readline()
-                except asyncio.CancelledError:
-                    raise
-                except Exception as exc:
+                # Lines are delivered from the protocol's callbacks; this task only waits to reconnect.
+                exc = await self._protocol.closed
+                if exc is not None:
                     self._logger.error(f"Error in SerialReceiver read loop on port '{self._settings.port}': {exc}")
+                else:
+                    self._logger.warning(f"Serial port '{self._settings.port}' closed - treating as disconnect.")
 
-                    await self._close_streams()
-                    await asyncio.sleep(self._settings.retry_interval)
-                    continue
-
-                if not raw:
-                    self._logger.warning(f"Empty read from serial port '{self._settings.port}' - treating as disconnect.")
-                    await self._close_streams()
-                    await asyncio.sleep(self._settings.retry_interval)
-                    continue
-
-                line = raw.decode("utf-8", errors="ignore").strip()
-                if not line:
-                    continue
-
-                self._logger.trace(f"Received from '{self._settings.port}': {line}")
-
-                try:
-                    self.line_received.invoke(line)
-                except Exception as ex:  # noqa: BLE001
-                    self._logger.exception(f"Error in SerialReceiver data_received handler: {ex}")
+                await self._close_streams()
+                await asyncio.sleep(self._settings.retry_interval)
 
         except asyncio.CancelledError:
             pass
@@ -141,12 +137,29 @@ class SerialTransport(LineReceiverProtocol, LineSenderProtocol):
             await self._close_streams()
             self._read_task = None
 
+    def _on_lines(self, lines: list[str]) -> None:
+        if self._logger.isEnabledFor(TRACE):
+            for line in lines:
+                self._logger.trace(f"Received from '{self._settings.port}': {line}")
+
+        try:
+            self._lines_received.invoke(lines)
+        except Exception as ex:  # noqa: BLE001
+            self._logger.exception(f"Error in SerialReceiver lines_received handler: {ex}")
+
+        for line in lines:
+            try:
+                self._line_received.invoke(line)
+            except Exception as ex:  # noqa: BLE001
+                self._logger.exception(f"Error in SerialReceiver data_received handler: {ex}")
+
     async def _write_loop(self) -> None:
         try:
             while self._running:
                 data = await self._tx_queue.get()
 
-                if self._writer is None:
+                protocol = self._protocol
+                if protocol is None or protocol.transport is None:
                     try:
                         self._tx_queue.put_nowait(data)
                     except asyncio.QueueFull:
@@ -155,14 +168,18 @@ class SerialTransport(LineReceiverProtocol, LineSenderProtocol):
                     continue
 
                 try:
-                    self._writer.write(data)
-                    await self._writer.drain()
+                    await protocol.wait_writable()
+                    if protocol.transport is None:
+                        continue
+                    protocol.transport.write(data)
                     self._logger.debug(f"Sent to '{self._settings.port}': {data!r}")
                 except asyncio.CancelledError:
                     raise
                 except Exception as exc:
                     self._logger.error(f"Error in SerialReceiver write loop on port '{self._settings.port}': {exc}")
-                    await self._close_streams()
+                    # The read loop sees the connection close and reconnects.
+                    if protocol.transport is not None:
+                        protocol.transport.close()
                     await asyncio.sleep(self._settings.retry_interval)
 
         except asyncio.CancelledError:
@@ -175,10 +192,8 @@ class SerialTransport(LineReceiverProtocol, LineSenderProtocol):
                 await self._write_task
         self._write_task = None
 
-        if self._writer is not None:
-            self._writer.close()
+        protocol, self._protocol = self._protocol, None
+        if protocol is not None and protocol.transport is not None:
+            protocol.transport.close()
             with suppress(Exception):
-                await self._writer.wait_closed()
-
-        self._reader = None
-        self._writer = None
+                await protocol.closed
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class ClockProtocol(ABC):
+    @abstractmethod
+    def now(self) -> float:
+        """Current time in seconds."""
+        ...
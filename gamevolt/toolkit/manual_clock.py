@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from gamevolt.toolkit.clock_protocol import ClockProtocol
+
+
+class ManualClock(ClockProtocol):
+    """A clock that only moves when told to, e.g. to the timestamp of the sample being processed."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self._now = now
+
+    def now(self) -> float:
+        return self._now
+
+    def set(self, now: float) -> None:
+        self._now = now
+
+    def advance(self, seconds: float) -> None:
+        self._now += seconds
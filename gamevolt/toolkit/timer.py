@@ -1,13 +1,15 @@
-import time
+from gamevolt.toolkit.clock_protocol import ClockProtocol
+from gamevolt.toolkit.wall_clock import WallClock
 
 
 class Timer:
-    def __init__(self, duration: float):
+    def __init__(self, duration: float, clock: ClockProtocol | None = None):
         self.duration = duration
         self._start_time: float | None = None
+        self._now = (clock if clock is not None else WallClock()).now
 
     def start(self) -> None:
-        self._start_time = time.time()
+        self._start_time = self._now()
 
     def stop(self) -> None:
         self._start_time = None
@@ -24,18 +26,18 @@ class Timer:
     def is_complete(self) -> bool:
         if self._start_time is None:
             return False
-        return time.time() >= self._start_time + self.duration
+        return self._now() >= self._start_time + self.duration
 
     @property
     def elapsed_time(self) -> float | None:
         if self._start_time is None:
             return None
-        elapsed = time.time() - self._start_time
+        elapsed = self._now() - self._start_time
         return elapsed
 
     @property
     def remaining_time(self) -> float | None:
         if self._start_time is None:
             return None
-        remainder = self._start_time + self.duration - time.time()
+        remainder = self._start_time + self.duration - self._now()
         return max(remainder, 0.0)
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+import time
+
+from gamevolt.toolkit.clock_protocol import ClockProtocol
+
+
+class WallClock(ClockProtocol):
+    def now(self) -> float:
+        return time.time()
@@ -10,3 +10,6 @@ from gamevolt.web_sockets.configuration.web_socket_settings import WebSocketSett
 class WebSocketServerSettings(SettingsBase):
     web_socket: WebSocketSettings
     select_interval: float = field(default=0.1)
+
+    # ping/pong probes per client for round trip and clock offset; 0 disables them
+    ping_interval_s: float = 2.0
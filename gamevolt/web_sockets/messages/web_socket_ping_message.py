@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from gamevolt.messaging.message import Message
+
+
+@dataclass
+class WebSocketPingMessage(Message):
+    ping_id: int
+
+    # server wall clock (ms) when the ping was sent
+    sent_ms: float
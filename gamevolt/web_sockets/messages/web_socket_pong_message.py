@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from gamevolt.messaging.message import Message
+
+
+@dataclass
+class WebSocketPongMessage(Message):
+    # echoed from the ping
+    ping_id: int
+    sent_ms: float
+
+    # client wall clock (ms) when the ping arrived; the pong is sent straight back
+    received_ms: float
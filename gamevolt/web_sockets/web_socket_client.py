@@ -1,5 +1,6 @@
 import asyncio
 import json
+import time
 from collections.abc import Callable
 from contextlib import suppress
 from logging import Logger
@@ -12,6 +13,8 @@ from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK, Inv
 from gamevolt.events.event import Event
 from gamevolt.messaging.message import Message
 from gamevolt.web_sockets.configuration.web_socket_client_settings import WebSocketClientSettings
+from gamevolt.web_sockets.messages.web_socket_ping_message import WebSocketPingMessage
+from gamevolt.web_sockets.messages.web_socket_pong_message import WebSocketPongMessage
 
 
 class WebSocketClient:
@@ -68,7 +71,7 @@ class WebSocketClient:
             return
         asyncio.run_coroutine_threadsafe(self.send_message_async(message), self._loop)
 
-    def send_data(self, raw: str) -> None:
+    def send_data(self, raw: str | bytes) -> None:
         if not self._loop or not self.is_connected:
             self._logger.debug("Dropping message, client not connected.")
             return
@@ -80,7 +83,7 @@ class WebSocketClient:
             return
         await self.send_data_async(json.dumps(message.to_dict()))
 
-    async def send_data_async(self, data: str) -> None:
+    async def send_data_async(self, data: str | bytes) -> None:
         if not self.is_connected or self._ws is None:
             self._logger.debug("Dropping message, socket not open.")
             return
@@ -89,6 +92,23 @@ class WebSocketClient:
         except Exception as e:
             self._logger.error(f"Failed to send message: {e}")
 
+    async def _try_answer_ping(self, raw: str) -> bool:
+        # Answered straight from the receive loop, so the pong's timestamp is not delayed behind handlers.
+        if WebSocketPingMessage.__name__ not in raw:
+            return False
+
+        received_ms = time.time() * 1000.0
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            return False
+        if payload.get("MessageType") != WebSocketPingMessage.__name__:
+            return False
+
+        pong = WebSocketPongMessage(ping_id=payload.get("ping_id", 0), sent_ms=payload.get("sent_ms", 0.0), received_ms=received_ms)
+        await self.send_message_async(pong)
+        return True
+
     async def _update(self) -> None:
         interval = self._settings.reconnection_interval
         url = self._settings.web_socket.url
@@ -132,6 +152,8 @@ class WebSocketClient:
 
                     while not self._stop_event.is_set():
                         raw = await self._ws.recv()
+                        if isinstance(raw, str) and raw.startswith("{") and await self._try_answer_ping(raw):
+                            continue
                         try:
                             self.message_received.invoke(raw)
                         except Exception:
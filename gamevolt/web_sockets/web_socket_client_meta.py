@@ -8,5 +8,9 @@ class WebSocketClientMeta:
     host: str
     port: int
 
+    # anchors multiplexed over this connection by a multi-anchor relay; empty for a single-anchor client
+    anchor_ids: tuple[str, ...] = ()
+
     def __str__(self) -> str:
-        return f"ID: {self.id} | Version: {self.version} | Address: {self.host}:{self.port})"
+        anchors = f" | Anchors: {', '.join(self.anchor_ids)}" if self.anchor_ids else ""
+        return f"ID: {self.id} | Version: {self.version} | Address: {self.host}:{self.port}){anchors}"
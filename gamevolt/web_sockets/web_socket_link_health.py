@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+
+
+@dataclass
+class WebSocketLinkHealth:
+    """
+    Round trip and clock offset of one client connection, from the server's ping/pong probes.
+
+    The offset (client wall clock minus server wall clock) is taken from the fastest of the recent probes, whose
+    send and return legs are the least queued and so the most nearly symmetric.
+    """
+
+    window: int = 8
+
+    pings_sent: int = 0
+    pongs_received: int = 0
+    last_ping_id: int = 0
+
+    rtt_ms: float | None = None
+    min_rtt_ms: float | None = None
+    clock_offset_ms: float | None = None
+
+    _samples: deque[tuple[float, float]] = field(default_factory=deque, repr=False)
+
+    def on_ping(self) -> int:
+        self.pings_sent += 1
+        self.last_ping_id += 1
+        return self.last_ping_id
+
+    def on_pong(self, sent_ms: float, client_ms: float, received_ms: float) -> None:
+        rtt_ms = max(0.0, received_ms - sent_ms)
+        offset_ms = client_ms - (sent_ms + received_ms) / 2.0
+
+        self.pongs_received += 1
+        self.rtt_ms = rtt_ms
+
+        self._samples.append((rtt_ms, offset_ms))
+        while len(self._samples) > self.window:
+            self._samples.popleft()
+
+        self.min_rtt_ms, self.clock_offset_ms = min(self._samples)
+
+    def to_server_ms(self, client_ms: float) -> float | None:
+        """A client wall-clock time on the server's clock, once a probe has come back."""
+        if self.clock_offset_ms is None:
+            return None
+        return client_ms - self.clock_offset_ms
@@ -1,6 +1,8 @@
 import asyncio
 import json
+import time
 from collections.abc import Callable
+from contextlib import suppress
 from http.cookies import SimpleCookie
 
 from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
@@ -10,7 +12,10 @@ from gamevolt.events.event import Event
 from gamevolt.logging import Logger
 from gamevolt.messaging.message import Message
 from gamevolt.web_sockets.configuration.web_socket_server_settings import WebSocketServerSettings
+from gamevolt.web_sockets.messages.web_socket_ping_message import WebSocketPingMessage
+from gamevolt.web_sockets.messages.web_socket_pong_message import WebSocketPongMessage
 from gamevolt.web_sockets.web_socket_client_meta import WebSocketClientMeta
+from gamevolt.web_sockets.web_socket_link_health import WebSocketLinkHealth
 
 
 class WebSocketServer:
@@ -24,19 +29,27 @@ class WebSocketServer:
 
         self.client_connected: Event[Callable[[WebSocketClientMeta], None]] = Event()
         self.client_disconnected: Event[Callable[[WebSocketClientMeta], None]] = Event()
-        self._message_received: Event[Callable[[str], None]] = Event()
+        self._message_received: Event[Callable[[str | bytes], None]] = Event()
 
         self._clients: dict[str, WebSocketServerProtocol] = {}
+        # anchor ID -> ID of the client connection carrying it, for multi-anchor relays
+        self._anchor_aliases: dict[str, str] = {}
+        self._link_health: dict[str, WebSocketLinkHealth] = {}
         self._server = None
+        self._ping_task: asyncio.Task | None = None
 
     @property
     def connected_clients(self) -> dict[str, WebSocketServerProtocol]:
         return self._clients
 
     @property
-    def message_received(self) -> Event[Callable[[str], None]]:
+    def message_received(self) -> Event[Callable[[str | bytes], None]]:
         return self._message_received
 
+    def link_health(self, client_id: str) -> WebSocketLinkHealth | None:
+        """Ping/pong health of the connection carrying client_id (a client, or an anchor of a multi-anchor relay)."""
+        return self._link_health.get(self._anchor_aliases.get(client_id, client_id))
+
     async def start_async(self) -> None:
         host = self._settings.web_socket.host
         port = self._settings.web_socket.port
@@ -49,8 +62,17 @@ class WebSocketServer:
         )
         self._logger.info(f"WebSocket server listening on ws://{host}:{port}.")
 
+        if self._settings.ping_interval_s > 0:
+            self._ping_task = asyncio.create_task(self._ping_loop())
+
     async def stop_async(self) -> None:
         self._logger.info("Stopping server...")
+        if self._ping_task is not None:
+            self._ping_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._ping_task
+            self._ping_task = None
+
         if self._server:
             self._server.close()
             await self._server.wait_closed()
@@ -62,13 +84,22 @@ class WebSocketServer:
                 pass
 
         self._clients.clear()
+        self._anchor_aliases.clear()
+        self._link_health.clear()
         self._logger.info("Server stopped.")
 
     async def send_to_client_async(self, client_id: str, message: Message) -> None:
+        payload = message.to_dict()
         client = self._clients.get(client_id)
+
+        if client is None and client_id in self._anchor_aliases:
+            # Shared connection: name the anchor so the relay hands it to the right port.
+            client = self._clients.get(self._anchor_aliases[client_id])
+            payload["AnchorId"] = client_id
+
         if client is not None:
             try:
-                await client.send(json.dumps(message.to_dict()))
+                await client.send(json.dumps(payload))
                 self._logger.trace(f"Sent to {client_id}: {message}")
             except Exception as e:
                 self._logger.warning(f"Failed to send to {client_id}: {e}")
@@ -102,16 +133,21 @@ class WebSocketServer:
 
         version_cookie = cookie.get("GameVolt-Version")
         version = version_cookie.value if version_cookie else "?.?.?"
+        anchors_cookie = cookie.get("GameVolt-Anchors")
+        anchor_ids = self._register_anchor_aliases(client_id, anchors_cookie.value if anchors_cookie else "")
         host, port = ws.remote_address
-        client_meta = WebSocketClientMeta(id=client_id, version=version, host=host, port=port)
+        client_meta = WebSocketClientMeta(id=client_id, version=version, host=host, port=port, anchor_ids=anchor_ids)
 
         self._clients[client_id] = ws
+        self._link_health[client_id] = WebSocketLinkHealth()
         self._logger.info(f"Client connected: {client_meta}.")
         self.client_connected.invoke(client_meta)
 
         try:
             async for raw in ws:
                 self._logger.trace(f"Received from {client_meta.id}: {raw}")
+                if isinstance(raw, str) and raw.startswith("{") and self._try_receive_pong(client_id, raw):
+                    continue
                 self._message_received.invoke(raw)
         except ConnectionClosedOK:
             pass
@@ -119,5 +155,56 @@ class WebSocketServer:
             self._logger.warning(f"Connection error from {client_meta.id}: {ce}")
         finally:
             self._clients.pop(client_id, None)
+            self._link_health.pop(client_id, None)
+            for anchor_id in anchor_ids:
+                self._anchor_aliases.pop(anchor_id, None)
             self._logger.info(f"Client disconnected: {client_meta}")
             self.client_disconnected.invoke(client_meta)
+
+    def _register_anchor_aliases(self, client_id: str, anchors: str) -> tuple[str, ...]:
+        anchor_ids: list[str] = []
+
+        for anchor_id in (a.strip() for a in anchors.split(",")):
+            if not anchor_id:
+                continue
+
+            if anchor_id == client_id:
+                self._logger.warning(f"Client ({client_id}) announced itself as an anchor; its commands will reach all of its anchors.")
+                continue
+
+            if anchor_id in self._clients or anchor_id in self._anchor_aliases:
+                self._logger.warning(f"Client ({client_id}) announced anchor ({anchor_id}), which is already connected; ignoring it.")
+                continue
+
+            self._anchor_aliases[anchor_id] = client_id
+            anchor_ids.append(anchor_id)
+
+        return tuple(anchor_ids)
+
+    async def _ping_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._settings.ping_interval_s)
+
+            for client_id, health in list(self._link_health.items()):
+                ping = WebSocketPingMessage(ping_id=health.on_ping(), sent_ms=time.time() * 1000.0)
+                await self.send_to_client_async(client_id, ping)
+
+    def _try_receive_pong(self, client_id: str, raw: str) -> bool:
+        # Cheap substring check first: relays send other JSON reports on the same connection.
+        if WebSocketPongMessage.__name__ not in raw:
+            return False
+
+        received_ms = time.time() * 1000.0
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            return False
+        if payload.get("MessageType") != WebSocketPongMessage.__name__:
+            return False
+
+        health = self._link_health.get(client_id)
+        if health is not None and payload.get("ping_id") == health.last_ping_id:
+            health.on_pong(float(payload["sent_ms"]), float(payload["received_ms"]), received_ms)
+            self._logger.trace(f"Link to {client_id}: rtt={health.rtt_ms:.1f}ms offset={health.clock_offset_ms:.1f}ms")
+
+        return True
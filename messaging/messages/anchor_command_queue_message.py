@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+from gamevolt.messaging.message import Message
+
+
+@dataclass
+class AnchorCommandQueueMessage(Message):
+    anchor_id: str
+
+    # commands waiting, per AnchorCommandPriority
+    pending: list[int]
+
+    # running totals since the relay started
+    submitted: int
+    coalesced: int
+    dropped: int
+    sent: int
+
+    # worst queueing delay and depth since the previous report
+    max_wait_ms: float
+    max_depth: int
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+from gamevolt.messaging.message import Message
+
+
+@dataclass
+class WandWireFormatMessage(Message):
+    binary_version: int
+
+    # PKTD single-line packets; absent from older servers
+    combined_lines: bool = False
+
+    # several newline-delimited lines, or concatenated binary frames, per web socket message
+    batched_frames: bool = False
+
+    # WandBinaryCodec flags (delta, zlib) the server can decode; 0 means plain frames only
+    binary_flags: int = 0
+
+    # messages may start with an AnchorTagCodec tag (relays multiplexing several anchors on one connection)
+    anchor_tags: bool = False
+
+    # tags may carry relay timestamps (send time, relay queueing, serial lag) for link latency telemetry
+    relay_timestamps: bool = False
@@ -11,3 +11,7 @@ class MotionProcessorSettings(SettingsBase):
     phase_tracker: MotionPhaseTrackerSettings
     direction_quantizer: DirectionQuantizerSettings
     segment_builder: SegmentBuilderSettings
+
+    # one MotionEngine advancing all wands per tick instead of a MotionProcessor per wand; slower below ~40 wands
+    # (0.07x at 1, 0.61x at 16, 1.74x at 64 in benchmarks/motion_engine_benchmark.py)
+    vectorised: bool = False
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from gamevolt.configuration.settings_base import SettingsBase
+from motion.direction.octant_method import OctantMethod
 
 
 @dataclass
@@ -8,3 +9,5 @@ class DirectionQuantizerSettings(SettingsBase):
     speed_stop: float
     min_direction_duration: float
     axis_deadband_per_s: float
+    # COMPARE is a cheaper octant choice, but no faster per step and it can pick the other octant exactly on an edge
+    octant_method: OctantMethod = OctantMethod.ATAN2
@@ -2,10 +2,15 @@ from __future__ import annotations
 
 import math
 
+from gamevolt.toolkit.clock_protocol import ClockProtocol
 from gamevolt.toolkit.timer import Timer
 from motion.direction.configuration.direction_quantizer_settings import DirectionQuantizerSettings
 from motion.direction.direction_type import DirectionType
 from motion.direction.direction_update import DirectionUpdate
+from motion.direction.octant_method import OctantMethod
+
+# |vy| <= TAN_22_5 * |vx| is within 22.5° of the x axis (and likewise for y)
+TAN_22_5 = math.tan(math.radians(22.5))
 
 
 class DirectionQuantizer:
@@ -15,17 +20,28 @@ class DirectionQuantizer:
     Notes:
       - DirectionType.UNKNOWN means "no confident direction / ignore".
       - DirectionType.PAUSE means "deliberate stillness" (emits a segment).
+      - The dwell is timed by `clock` (wall clock if None); MotionProcessor drives it from sample timestamps.
+      - Speeds are compared squared (see step_squared), and the octant comes from atan2 or, without any
+        trigonometry, from comparisons (settings.octant_method).
     """
 
-    def __init__(self, settings: DirectionQuantizerSettings) -> None:
+    def __init__(self, settings: DirectionQuantizerSettings, clock: ClockProtocol | None = None) -> None:
         self._settings = settings
-        self._dir_dwell = Timer(settings.min_direction_duration)
+        self._dir_dwell = Timer(settings.min_direction_duration, clock)
+
+        self._deadband_sq = settings.axis_deadband_per_s * settings.axis_deadband_per_s
+        self._speed_stop_sq = settings.speed_stop * settings.speed_stop
+        self._get_octant = self._get_octant_compare if settings.octant_method is OctantMethod.COMPARE else self._get_octant_atan2
 
         self._current: DirectionType = DirectionType.UNKNOWN  # last committed direction
         self._candidate: DirectionType = DirectionType.UNKNOWN  # candidate direction waiting to commit
 
     def step(self, vx: float, vy: float, speed: float) -> DirectionUpdate:
-        pick = self._get_direction(vx, vy, speed)
+        return self.step_squared(vx, vy, speed * speed)
+
+    def step_squared(self, vx: float, vy: float, speed_sq: float) -> DirectionUpdate:
+        """step() for a caller that has vx² + vy² to hand, sparing the square root."""
+        pick = self._get_direction(vx, vy, speed_sq)
 
         # No confident direction -> do not change state, do not emit commit
         if pick == DirectionType.UNKNOWN:
@@ -35,7 +51,7 @@ class DirectionQuantizer:
             return DirectionUpdate(None)
 
         # If we're definitely stopped, commit PAUSE immediately (prevents "pause" being swallowed by moving)
-        if pick == DirectionType.PAUSE and speed < self._settings.speed_stop:
+        if pick == DirectionType.PAUSE and speed_sq < self._speed_stop_sq:
             if self._current != DirectionType.PAUSE:
                 self._dir_dwell.stop()
                 self._candidate = DirectionType.PAUSE
@@ -72,11 +88,14 @@ class DirectionQuantizer:
     def reset(self) -> None:
         self.force(DirectionType.UNKNOWN)
 
-    def _get_direction(self, vx: float, vy: float, speed: float) -> DirectionType:
+    def _get_direction(self, vx: float, vy: float, speed_sq: float) -> DirectionType:
         # Stillness -> PAUSE
-        if speed < self._settings.axis_deadband_per_s:
+        if speed_sq < self._deadband_sq:
             return DirectionType.PAUSE
 
+        return self._get_octant(vx, vy)
+
+    def _get_octant_atan2(self, vx: float, vy: float) -> DirectionType:
         a = math.degrees(math.atan2(vy, vx))  # -180..180, 0=E, +90=N
 
         if 67.5 <= a < 112.5:
@@ -97,3 +116,28 @@ class DirectionQuantizer:
             return DirectionType.MOVING_NW
 
         return DirectionType.UNKNOWN
+
+    def _get_octant_compare(self, vx: float, vy: float) -> DirectionType:
+        # Same octants as _get_octant_atan2 (up to rounding exactly on an edge); NaN -> UNKNOWN
+        ax = abs(vx)
+        ay = abs(vy)
+
+        if ay <= TAN_22_5 * ax:
+            # (0, 0) lands here too; atan2 makes it E for vx = +0.0 and W for -0.0
+            east = vx > 0 or (vx == 0 and math.copysign(1.0, vx) > 0)
+            return DirectionType.MOVING_E if east else DirectionType.MOVING_W
+        if ax <= TAN_22_5 * ay:
+            return DirectionType.MOVING_N if vy > 0 else DirectionType.MOVING_S
+
+        if vy > 0:
+            if vx > 0:
+                return DirectionType.MOVING_NE
+            if vx < 0:
+                return DirectionType.MOVING_NW
+        elif vy < 0:
+            if vx > 0:
+                return DirectionType.MOVING_SE
+            if vx < 0:
+                return DirectionType.MOVING_SW
+
+        return DirectionType.UNKNOWN
@@ -0,0 +1,6 @@
+from enum import Enum, auto
+
+
+class OctantMethod(Enum):
+    ATAN2 = auto()  # heading angle from atan2, bucketed into 45° octants
+    COMPARE = auto()  # signs and |vy| vs tan(22.5°)·|vx| comparisons, no trigonometry
@@ -0,0 +1,459 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from motion.configuration.motion_processor_settings import MotionProcessorSettings
+from motion.direction.direction_quantizer import TAN_22_5
+from motion.direction.direction_type import DirectionType
+from motion.direction.octant_method import OctantMethod
+from motion.gesture.gesture_segment import GestureSegment
+from motion.motion_engine_slot import MotionEngineSlot
+from motion.motion_phase_type import MotionPhaseType
+
+_NONE = MotionPhaseType.NONE.value
+_MOVING = MotionPhaseType.MOVING.value
+_PAUSED = MotionPhaseType.PAUSED.value
+_HOLDING = MotionPhaseType.HOLDING.value
+_STOPPED = MotionPhaseType.STOPPED.value
+
+_UNKNOWN = DirectionType.UNKNOWN.value
+_PAUSE = DirectionType.PAUSE.value
+
+# DirectionQuantizer._get_octant_atan2's edges (degrees, 0=E, +90=N); searchsorted(side="right") indexes _OCTANTS
+_OCTANT_EDGES = np.array((-157.5, -112.5, -67.5, -22.5, 22.5, 67.5, 112.5, 157.5))
+_OCTANTS = np.array(
+    [
+        d.value
+        for d in (
+            DirectionType.MOVING_W,
+            DirectionType.MOVING_SW,
+            DirectionType.MOVING_S,
+            DirectionType.MOVING_SE,
+            DirectionType.MOVING_E,
+            DirectionType.MOVING_NE,
+            DirectionType.MOVING_N,
+            DirectionType.MOVING_NW,
+            DirectionType.MOVING_W,
+        )
+    ]
+)
+
+# DirectionQuantizer._get_octant_compare, indexed by near_x * 8 + near_y * 4 + east * 2 + (vy > 0)
+_COMPARE_OCTANTS = np.array(
+    [
+        (
+            (DirectionType.MOVING_E if east else DirectionType.MOVING_W)
+            if near_x
+            else (
+                (DirectionType.MOVING_N if north else DirectionType.MOVING_S)
+                if near_y
+                else (
+                    (DirectionType.MOVING_NE if north else DirectionType.MOVING_SE)
+                    if east
+                    else (DirectionType.MOVING_NW if north else DirectionType.MOVING_SW)
+                )
+            )
+        ).value
+        for near_x in (False, True)
+        for near_y in (False, True)
+        for east in (False, True)
+        for north in (False, True)
+    ]
+)
+
+# state array -> (dtype, value on reset); NaN timer starts mean "stopped"
+_STATE: dict[str, tuple[type, object]] = {
+    # MotionProcessor
+    "has_previous": (np.bool_, False),
+    "previous_ts_ms": (np.int64, 0),
+    "motion_mode": (np.int8, _NONE),
+    "motion_state": (np.int8, _UNKNOWN),
+    # MotionPhaseTracker
+    "phase": (np.int8, _NONE),
+    "move_dwell": (np.float64, math.nan),
+    "still_since": (np.float64, math.nan),
+    # DirectionQuantizer
+    "current": (np.int8, _UNKNOWN),
+    "candidate": (np.int8, _UNKNOWN),
+    "dir_dwell": (np.float64, math.nan),
+    # SegmentBuilder
+    "active": (np.bool_, False),
+    "direction": (np.int8, _UNKNOWN),
+    "start_ms": (np.int64, 0),
+    "last_ms": (np.int64, 0),
+    "samples": (np.int64, 0),
+    "net_dx": (np.float64, 0.0),
+    "net_dy": (np.float64, 0.0),
+    "path": (np.float64, 0.0),
+}
+
+
+class MotionEngine:
+    """
+    MotionProcessor (phase tracker, direction quantizer and segment builder) for many wands at once.
+
+    Each wand is a row in a set of NumPy arrays instead of a tree of objects. A tick advances every wand with
+    queued samples together: the n-th sample of every such wand is one vectorised step, so the per-sample cost
+    is shared by all wands rather than paid per wand. Dwells are timed from sample timestamps, as
+    MotionProcessor's default clock does.
+
+    Only rows whose phase, direction or segment actually change drop back to Python, to raise the slot's events
+    in the same order MotionProcessor does; a subscriber resetting its wand mid-step sees the same state too.
+    The segment builder's point history (never read) is not kept. Released rows are reused by later slots, so
+    wands coming and going do not grow the arrays.
+    """
+
+    def __init__(self, settings: MotionProcessorSettings, capacity: int = 16) -> None:
+        phase_settings = settings.phase_tracker
+        quantizer_settings = settings.direction_quantizer
+        self._phase_settings = phase_settings
+        self._quantizer_settings = quantizer_settings
+
+        # speeds are compared squared, as MotionProcessor does
+        self._speed_start_sq = phase_settings.speed_start * phase_settings.speed_start
+        self._speed_stop_sq = phase_settings.speed_stop * phase_settings.speed_stop
+        self._deadband_sq = quantizer_settings.axis_deadband_per_s * quantizer_settings.axis_deadband_per_s
+        self._direction_stop_sq = quantizer_settings.speed_stop * quantizer_settings.speed_stop
+        self._get_octants = (
+            self._get_octants_compare if quantizer_settings.octant_method is OctantMethod.COMPARE else self._get_octants_atan2
+        )
+
+        if not (phase_settings.min_paused_duration < phase_settings.min_holding_duration < phase_settings.min_stopped_duration):
+            raise ValueError("Expected: min_paused_duration < min_holding_duration < min_stopped_duration")
+
+        # MotionPhaseTracker starts its pause, hold and stop timers together and only reads each one in the phase
+        # before it, so one still-episode start plus these per-phase lookups (indexed by phase value) replace them.
+        self._still_duration = np.full(max(p.value for p in MotionPhaseType) + 1, math.inf)
+        self._next_phase = np.zeros(len(self._still_duration), dtype=np.int8)
+        for phase, duration, next_phase in (
+            (MotionPhaseType.NONE, phase_settings.min_paused_duration, MotionPhaseType.PAUSED),
+            (MotionPhaseType.MOVING, phase_settings.min_paused_duration, MotionPhaseType.PAUSED),
+            (MotionPhaseType.PAUSED, phase_settings.min_holding_duration, MotionPhaseType.HOLDING),
+            (MotionPhaseType.HOLDING, phase_settings.min_stopped_duration, MotionPhaseType.STOPPED),
+            (MotionPhaseType.STOPPED, math.inf, MotionPhaseType.STOPPED),
+        ):
+            self._still_duration[phase.value] = duration
+            self._next_phase[phase.value] = next_phase.value
+
+        self._slots: list[MotionEngineSlot | None] = []
+        self._free_rows: list[int] = []
+        self._pending: list[MotionEngineSlot] = []
+
+        self._capacity = max(1, capacity)
+        for name, (dtype, value) in _STATE.items():
+            setattr(self, f"_{name}", np.full(self._capacity, value, dtype=dtype))
+
+    @property
+    def wand_count(self) -> int:
+        return len(self._slots) - len(self._free_rows)
+
+    def create(self) -> MotionEngineSlot:
+        if self._free_rows:
+            row = self._free_rows.pop()
+            slot = MotionEngineSlot(self, row)
+            self._slots[row] = slot
+            return slot
+
+        row = len(self._slots)
+        if row == self._capacity:
+            self._grow()
+
+        slot = MotionEngineSlot(self, row)
+        self._slots.append(slot)
+        return slot
+
+    def release(self, slot: MotionEngineSlot) -> None:
+        """Frees the slot's row for the next create(); its queued samples are dropped and no more events are raised."""
+        row = slot.row
+        if self._slots[row] is not slot:
+            return
+
+        slot.pending.clear()
+        self.reset_row(row)
+        self._slots[row] = None
+        self._free_rows.append(row)
+
+    def mark_pending(self, slot: MotionEngineSlot) -> None:
+        self._pending.append(slot)
+
+    def reset_row(self, row: int) -> None:
+        for name, (_, value) in _STATE.items():
+            getattr(self, f"_{name}")[row] = value
+
+    def tick(self) -> None:
+        """Processes every sample queued since the last tick."""
+        if not self._pending:
+            return
+
+        slots: list[MotionEngineSlot] = []
+        queued: list[list[tuple[np.ndarray, np.ndarray, np.ndarray]]] = []
+        for slot in self._pending:
+            # a slot reset (and re-queued) since it was marked is listed twice; only its current queue counts
+            if slot.pending:
+                slots.append(slot)
+                queued.append(slot.pending[:])
+                slot.pending.clear()
+        self._pending = []
+        if not slots:
+            return
+
+        lengths = np.array([sum(len(ts) for ts, _, _ in batches) for batches in queued])
+        width = int(lengths.max())
+        rows = np.array([slot.row for slot in slots])
+        ts_ms = np.zeros((len(slots), width), dtype=np.int64)
+        x_delta = np.zeros((len(slots), width))
+        y_delta = np.zeros((len(slots), width))
+
+        for i, batches in enumerate(queued):
+            column = 0
+            for ts, dx, dy in batches:
+                end = column + len(ts)
+                ts_ms[i, column:end] = ts
+                x_delta[i, column:end] = dx
+                y_delta[i, column:end] = dy
+                column = end
+
+        for k in range(width):
+            live = lengths > k
+            if live.all():
+                self._step(rows, ts_ms[:, k], x_delta[:, k], y_delta[:, k])
+            else:
+                self._step(rows[live], ts_ms[live, k], x_delta[live, k], y_delta[live, k])
+
+    # ── one sample for each of `rows` (MotionProcessor._step) ───────────────
+    def _step(self, rows: np.ndarray, ts_ms: np.ndarray, x_delta: np.ndarray, y_delta: np.ndarray) -> None:
+        has_previous = self._has_previous[rows]
+        if not has_previous.all():
+            for i in np.flatnonzero(~has_previous).tolist():
+                self._first_sample(int(rows[i]), int(ts_ms[i]), float(x_delta[i]), float(y_delta[i]))
+
+            rows, ts_ms, x_delta, y_delta = rows[has_previous], ts_ms[has_previous], x_delta[has_previous], y_delta[has_previous]
+
+        raw_dt_ms = ts_ms - self._previous_ts_ms[rows]
+        advancing = raw_dt_ms > 0
+        if not advancing.all():
+            rows, ts_ms, x_delta, y_delta, raw_dt_ms = (
+                rows[advancing],
+                ts_ms[advancing],
+                x_delta[advancing],
+                y_delta[advancing],
+                raw_dt_ms[advancing],
+            )
+        if not len(rows):
+            return
+
+        dt = raw_dt_ms / 1000.0
+        vx = x_delta / dt
+        vy = y_delta / dt
+        speed_sq = vx * vx + vy * vy
+        now = ts_ms / 1000.0
+
+        for i in np.flatnonzero(self._step_phase(rows, speed_sq, now)).tolist():
+            self._on_phase(int(rows[i]), MotionPhaseType(int(self._phase[rows[i]])), int(ts_ms[i]), float(x_delta[i]), float(y_delta[i]))
+
+        for i, direction in self._step_direction(rows, vx, vy, speed_sq, now):
+            self._set_direction(int(rows[i]), DirectionType(direction), int(ts_ms[i]), float(x_delta[i]), float(y_delta[i]))
+
+        active = self._active[rows]
+        if active.any():
+            self._accumulate(rows[active], ts_ms[active], x_delta[active], y_delta[active])
+
+        self._previous_ts_ms[rows] = ts_ms
+        self._has_previous[rows] = True
+
+    def _step_phase(self, rows: np.ndarray, speed_sq: np.ndarray, now: np.ndarray) -> np.ndarray:
+        """MotionPhaseTracker.step for each row; returns which rows changed phase."""
+        settings = self._phase_settings
+        phase = self._phase[rows]
+
+        # movement (>= start threshold): dwell into MOVING; fmin starts a stopped (NaN) dwell, time only moves on
+        moving = speed_sq >= self._speed_start_sq
+        move_dwell = self._move_dwell[rows]
+        arming = moving & (phase != _MOVING)
+        dwelled = arming & (now >= move_dwell + settings.min_state_duration)
+        self._move_dwell[rows] = np.where(arming & ~dwelled, np.fmin(move_dwell, now), math.nan)
+
+        # not moving enough: a still episode begins at/below the stop threshold and ends with movement
+        still_since = self._still_since[rows]
+        still_since = np.where(moving, math.nan, np.where(speed_sq <= self._speed_stop_sq, np.fmin(still_since, now), still_since))
+        self._still_since[rows] = still_since
+
+        # advance at most one state per sample (NaN, i.e. no still episode, never advances)
+        advance = now >= still_since + self._still_duration[phase]
+
+        new_phase = np.where(dwelled, _MOVING, np.where(advance, self._next_phase[phase], phase))
+        self._phase[rows] = new_phase
+        return new_phase != phase
+
+    def _step_direction(
+        self, rows: np.ndarray, vx: np.ndarray, vy: np.ndarray, speed_sq: np.ndarray, now: np.ndarray
+    ) -> list[tuple[int, int]]:
+        """DirectionQuantizer.step for MOVING rows (force(UNKNOWN) for the rest); returns (index, direction) commits."""
+        moving = self._motion_mode[rows] == _MOVING
+        if not moving.all():
+            idle = rows[~moving]
+            self._current[idle] = _UNKNOWN
+            self._candidate[idle] = _UNKNOWN
+            self._dir_dwell[idle] = math.nan
+
+            index = np.flatnonzero(moving)
+            rows, vx, vy, speed_sq, now = rows[moving], vx[moving], vy[moving], speed_sq[moving], now[moving]
+            if not len(rows):
+                return []
+        else:
+            index = None
+
+        settings = self._quantizer_settings
+        pick = self._get_directions(vx, vy, speed_sq)
+        current = self._current[rows]
+        candidate = self._candidate[rows]
+
+        # Definitely stopped commits PAUSE at once; any other new pick becomes the candidate and restarts the dwell.
+        # The dwell is only read while a (known) candidate differs from the committed direction, and every way
+        # into that state restarts it, so unlike DirectionQuantizer it is never stopped explicitly.
+        pause = (pick == _PAUSE) & (speed_sq < self._direction_stop_sq)
+        commit_pause = pause & (current != _PAUSE)
+        restart = ~pause & (pick != candidate)
+        dwelled = ~pause & ~restart & (candidate != current) & (candidate != _UNKNOWN)
+        dwelled &= now >= self._dir_dwell[rows] + settings.min_direction_duration
+
+        if restart.any():
+            self._dir_dwell[rows[restart]] = now[restart]
+            candidate = np.where(restart, pick, candidate)
+
+        committed = commit_pause | dwelled
+        if not committed.any():
+            self._candidate[rows] = candidate
+            return []
+
+        current = np.where(dwelled, candidate, current)
+        current[commit_pause] = _PAUSE
+        candidate[commit_pause] = _PAUSE
+        self._current[rows] = current
+        self._candidate[rows] = candidate
+
+        committed = np.flatnonzero(committed)
+        directions = current[committed]
+        if index is not None:
+            committed = index[committed]
+        return list(zip(committed.tolist(), directions.tolist()))
+
+    def _get_directions(self, vx: np.ndarray, vy: np.ndarray, speed_sq: np.ndarray) -> np.ndarray:
+        pick = self._get_octants(vx, vy)
+        pick[np.isnan(speed_sq)] = _UNKNOWN
+        pick[speed_sq < self._deadband_sq] = _PAUSE
+        return pick
+
+    def _get_octants_atan2(self, vx: np.ndarray, vy: np.ndarray) -> np.ndarray:
+        return _OCTANTS[np.searchsorted(_OCTANT_EDGES, np.degrees(np.arctan2(vy, vx)), side="right")]
+
+    def _get_octants_compare(self, vx: np.ndarray, vy: np.ndarray) -> np.ndarray:
+        ax = np.abs(vx)
+        ay = np.abs(vy)
+        near_x = ay <= TAN_22_5 * ax
+        near_y = ax <= TAN_22_5 * ay
+        east = ~np.signbit(vx)  # vx > 0, except that (+0.0, 0) is E as with atan2
+        return _COMPARE_OCTANTS[near_x * 8 + near_y * 4 + east * 2 + (vy > 0)]
+
+    def _accumulate(self, rows: np.ndarray, ts_ms: np.ndarray, x_delta: np.ndarray, y_delta: np.ndarray) -> None:
+        self._last_ms[rows] = ts_ms
+        self._samples[rows] += 1
+
+        # PAUSE segments do not accumulate "noise distance"
+        moving = self._direction[rows] != _PAUSE
+        if not moving.all():
+            rows, x_delta, y_delta = rows[moving], x_delta[moving], y_delta[moving]
+
+        self._net_dx[rows] += x_delta
+        self._net_dy[rows] += y_delta
+        self._path[rows] += np.hypot(x_delta, y_delta)
+
+    # ── per-row events (rare; same order as MotionProcessor) ───────────────
+    def _first_sample(self, row: int, ts_ms: int, x_delta: float, y_delta: float) -> None:
+        self._previous_ts_ms[row] = ts_ms
+        self._has_previous[row] = True
+
+        self._set_motion_phase(row, MotionPhaseType.PAUSED)
+        self._start_segment(row, _UNKNOWN, ts_ms, x_delta, y_delta)
+
+    def _on_phase(self, row: int, phase: MotionPhaseType, ts_ms: int, x_delta: float, y_delta: float) -> None:
+        if phase is MotionPhaseType.PAUSED and self._motion_state[row] != _UNKNOWN:
+            self._set_direction(row, DirectionType.UNKNOWN, ts_ms, x_delta, y_delta)
+
+        self._set_motion_phase(row, phase)
+
+    def _set_motion_phase(self, row: int, phase: MotionPhaseType) -> None:
+        if phase.value != self._motion_mode[row]:
+            self._motion_mode[row] = phase.value
+            self._slots[row].motion_changed.invoke(phase)
+
+    def _set_direction(self, row: int, dir_type: DirectionType, ts_ms: int, x_delta: float, y_delta: float) -> None:
+        if dir_type.value != self._motion_state[row]:
+            self._motion_state[row] = dir_type.value
+            self._slots[row].direction_changed.invoke(dir_type)
+            self._commit_segment(row, dir_type.value, ts_ms, x_delta, y_delta)
+
+    def _commit_segment(self, row: int, direction: int, ts_ms: int, x_delta: float, y_delta: float) -> None:
+        if self._active[row] and direction == self._direction[row]:
+            self._last_ms[row] = ts_ms
+            self._samples[row] += 1
+            if direction != _PAUSE:
+                self._net_dx[row] += x_delta
+                self._net_dy[row] += y_delta
+                self._path[row] += math.hypot(x_delta, y_delta)
+            return
+
+        if self._active[row]:
+            self._last_ms[row] = ts_ms
+            self._finish_segment(row)
+
+        self._start_segment(row, direction, ts_ms, x_delta, y_delta)
+
+    def _start_segment(self, row: int, direction: int, ts_ms: int, x_delta: float, y_delta: float) -> None:
+        self._active[row] = True
+        self._direction[row] = direction
+        self._start_ms[row] = ts_ms
+        self._last_ms[row] = ts_ms
+        self._samples[row] = 0
+        self._net_dx[row] = 0.0
+        self._net_dy[row] = 0.0
+        self._path[row] = 0.0
+
+    def _finish_segment(self, row: int) -> None:
+        start_ms = int(self._start_ms[row])
+        last_ms = int(self._last_ms[row])
+        net_dx = float(self._net_dx[row])
+        net_dy = float(self._net_dy[row])
+        path = float(self._path[row])
+
+        duration_s = max((last_ms - start_ms) / 1000.0, 0.0)
+        mag = math.hypot(net_dx, net_dy)
+
+        segment = GestureSegment(
+            start_ts_ms=start_ms,
+            end_ts_ms=last_ms,
+            duration_s=duration_s,
+            sample_count=int(self._samples[row]),
+            direction_type=DirectionType(int(self._direction[row])),
+            avg_vec_x=(net_dx / mag) if mag > 0 else 0.0,
+            avg_vec_y=(net_dy / mag) if mag > 0 else 0.0,
+            net_dx=net_dx,
+            net_dy=net_dy,
+            mean_speed=(path / duration_s) if duration_s > 0 else 0.0,
+            path_length=path,
+        )
+
+        self._active[row] = False
+        slot = self._slots[row]
+        if slot.forwards_segments:
+            slot.segment_completed.invoke(segment)
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        for name, (dtype, value) in _STATE.items():
+            current = getattr(self, f"_{name}")
+            grown = np.full(self._capacity, value, dtype=dtype)
+            grown[: len(current)] = current
+            setattr(self, f"_{name}", grown)
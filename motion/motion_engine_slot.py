@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+
+from gamevolt.events.event import Event
+from motion.direction.direction_type import DirectionType
+from motion.gesture.gesture_segment import GestureSegment
+from motion.motion_phase_type import MotionPhaseType
+from wand.wand_rotation import WandRotation
+from wand.wand_rotation_batch import WandRotationBatch
+
+if TYPE_CHECKING:
+    from motion.motion_engine import MotionEngine
+
+
+class MotionEngineSlot:
+    """
+    One wand's view of a MotionEngine, with MotionProcessor's interface.
+
+    Rotations are queued rather than processed on arrival; the engine advances every slot with queued samples
+    on its next tick and raises this slot's events from there.
+    """
+
+    def __init__(self, engine: MotionEngine, row: int) -> None:
+        self.segment_completed: Event[Callable[[GestureSegment], None]] = Event()
+        self.direction_changed: Event[Callable[[DirectionType], None]] = Event()
+        self.motion_changed: Event[Callable[[MotionPhaseType], None]] = Event()
+
+        self._engine = engine
+        self._row = row
+
+        self._pending: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self._forwards_segments = False
+        self._is_released = False
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+    @property
+    def forwards_segments(self) -> bool:
+        return self._forwards_segments
+
+    @property
+    def pending(self) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        return self._pending
+
+    def start(self) -> None:
+        self._forwards_segments = True
+
+    def stop(self) -> None:
+        self._forwards_segments = False
+
+    def reset(self) -> None:
+        """Clears the wand's motion state and drops rotations still waiting for a tick."""
+        if self._is_released:
+            return
+
+        self._pending.clear()
+        self._engine.reset_row(self._row)
+
+    def release(self) -> None:
+        """Hands the row back to the engine; rotations arriving afterwards are ignored."""
+        self._is_released = True
+        self._forwards_segments = False
+        self._engine.release(self)
+
+    def on_rotation_updated(self, rotation: WandRotation) -> None:
+        self._queue(np.array((rotation.ts_ms,), dtype=np.int64), np.array((rotation.x_delta,)), np.array((rotation.y_delta,)))
+
+    def on_rotation_batch(self, batch: WandRotationBatch) -> None:
+        if len(batch):
+            self._queue(batch.ts_ms, batch.x_delta, batch.y_delta)
+
+    def _queue(self, ts_ms: np.ndarray, x_delta: np.ndarray, y_delta: np.ndarray) -> None:
+        if self._is_released:
+            return
+        if not self._pending:
+            self._engine.mark_pending(self)
+        self._pending.append((ts_ms, x_delta, y_delta))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from gamevolt.toolkit.clock_protocol import ClockProtocol
 from gamevolt.toolkit.timer import Timer
 from motion.configuration.motion_phase_tracker_settings import MotionPhaseTrackerSettings
 from motion.motion_phase_type import MotionPhaseType
@@ -7,15 +8,19 @@ from motion.motion_phase_update import MotionPhaseUpdate
 
 
 class MotionPhaseTracker:
-    def __init__(self, settings: MotionPhaseTrackerSettings) -> None:
+    def __init__(self, settings: MotionPhaseTrackerSettings, clock: ClockProtocol | None = None) -> None:
+        """`clock` times the dwells (wall clock if None); MotionProcessor drives it from sample timestamps."""
         self._settings = settings
 
-        self._move_dwell = Timer(settings.min_state_duration)
+        self._move_dwell = Timer(settings.min_state_duration, clock)
 
         # thresholds since still-episode start
-        self._pause_timer = Timer(settings.min_paused_duration)
-        self._hold_timer = Timer(settings.min_holding_duration)
-        self._stop_timer = Timer(settings.min_stopped_duration)
+        self._pause_timer = Timer(settings.min_paused_duration, clock)
+        self._hold_timer = Timer(settings.min_holding_duration, clock)
+        self._stop_timer = Timer(settings.min_stopped_duration, clock)
+
+        self._speed_start_sq = settings.speed_start * settings.speed_start
+        self._speed_stop_sq = settings.speed_stop * settings.speed_stop
 
         self._state: MotionPhaseType = MotionPhaseType.NONE
         self._still_episode_open = False
@@ -32,13 +37,17 @@ class MotionPhaseTracker:
         self._still_episode_open = False
 
     def step(self, speed: float) -> MotionPhaseUpdate:
+        return self.step_squared(speed * speed)
+
+    def step_squared(self, speed_sq: float) -> MotionPhaseUpdate:
+        """step() for a caller that has the squared speed to hand, sparing the square root."""
         prev_state = self._state
         stop_started = False  # still-episode started
 
         # ----------------------------
         # MOVEMENT (>= START threshold)
         # ----------------------------
-        if speed >= self._settings.speed_start:
+        if speed_sq >= self._speed_start_sq:
             # end still episode + clear timers
             self._pause_timer.stop()
             self._hold_timer.stop()
@@ -61,7 +70,7 @@ class MotionPhaseTracker:
             self._move_dwell.stop()
 
             # still episode begins when we fall to/below STOP threshold
-            if speed <= self._settings.speed_stop:
+            if speed_sq <= self._speed_stop_sq:
                 if not self._still_episode_open:
                     self._still_episode_open = True
                     stop_started = True
@@ -1,7 +1,8 @@
-import math
 from typing import Callable
 
 from gamevolt.events.event import Event
+from gamevolt.toolkit.clock_protocol import ClockProtocol
+from gamevolt.toolkit.manual_clock import ManualClock
 from motion.configuration.motion_processor_settings import MotionProcessorSettings
 from motion.direction.direction_quantizer import DirectionQuantizer
 from motion.direction.direction_type import DirectionType
@@ -10,23 +11,34 @@ from motion.motion_phase_tracker import MotionPhaseTracker
 from motion.motion_phase_type import MotionPhaseType
 from motion.segment.segment_builder import SegmentBuilder
 from wand.wand_rotation import WandRotation
+from wand.wand_rotation_batch import WandRotationBatch
 
 
 class MotionProcessor:
-    def __init__(self, settings: MotionProcessorSettings):
+    def __init__(self, settings: MotionProcessorSettings, clock: ClockProtocol | None = None):
+        """
+        Phase and direction dwells are timed by `clock`. By default that is the sample clock: it reads the
+        `ts_ms` of the rotation being processed, so motion state depends only on the samples (not on when
+        they happen to be processed) and recorded sessions replay as fast as they can be fed in.
+        """
         self._settings = settings
 
+        # Set from each sample's ts_ms unless a clock was injected
+        self._sample_clock: ManualClock | None = None
+        if clock is None:
+            clock = self._sample_clock = ManualClock()
+
         self.segment_completed: Event[Callable[[GestureSegment], None]] = Event()
         self.direction_changed: Event[Callable[[DirectionType], None]] = Event()
         self.motion_changed: Event[Callable[[MotionPhaseType], None]] = Event()
 
-        self._direction_quantizer = DirectionQuantizer(settings.direction_quantizer)
-        self._phase_tracker = MotionPhaseTracker(settings.phase_tracker)
+        self._direction_quantizer = DirectionQuantizer(settings.direction_quantizer, clock)
+        self._phase_tracker = MotionPhaseTracker(settings.phase_tracker, clock)
         self._segment_builder = SegmentBuilder(settings.segment_builder)
 
         self._motion_mode: MotionPhaseType = MotionPhaseType.NONE
         self._motion_state: DirectionType = DirectionType.UNKNOWN
-        self._previous_position: WandRotation | None = None
+        self._previous_ts_ms: int | None = None
 
     def start(self) -> None:
         self._segment_builder.segment_completed.subscribe(self._on_segment_completed)
@@ -41,56 +53,69 @@ class MotionProcessor:
 
         self._motion_mode = MotionPhaseType.NONE
         self._motion_state = DirectionType.UNKNOWN
-        self._previous_position = None
+        self._previous_ts_ms = None
+
+    def release(self) -> None:
+        """Nothing to hand back; MotionEngineSlot has the same method to free its engine row."""
 
     def _set_motion_phase(self, phase: MotionPhaseType) -> None:
         if phase != self._motion_mode:
             self._motion_mode = phase
             self.motion_changed.invoke(phase)
 
-    def _set_direction(self, dir_type: DirectionType, pos: WandRotation) -> None:
+    def _set_direction(self, dir_type: DirectionType, ts_ms: int, x_delta: float, y_delta: float) -> None:
         if dir_type != self._motion_state:
             self._motion_state = dir_type
             self.direction_changed.invoke(dir_type)
-            self._segment_builder.commit(dir_type, pos)
+            self._segment_builder.commit(dir_type, ts_ms, x_delta, y_delta)
 
     def _on_segment_completed(self, seg) -> None:
         self.segment_completed.invoke(seg)
 
     def on_rotation_updated(self, rotation: WandRotation) -> None:
-        if self._previous_position is None:
-            self._previous_position = rotation
+        self._step(rotation.ts_ms, rotation.x_delta, rotation.y_delta)
+
+    def on_rotation_batch(self, batch: WandRotationBatch) -> None:
+        for ts_ms, x_delta, y_delta in zip(batch.ts_ms.tolist(), batch.x_delta.tolist(), batch.y_delta.tolist()):
+            self._step(ts_ms, x_delta, y_delta)
+
+    def _step(self, ts_ms: int, x_delta: float, y_delta: float) -> None:
+        if self._previous_ts_ms is None:
+            self._previous_ts_ms = ts_ms
 
             self._set_motion_phase(MotionPhaseType.PAUSED)
-            self._segment_builder.start(DirectionType.UNKNOWN, rotation)
+            self._segment_builder.start(DirectionType.UNKNOWN, ts_ms, x_delta, y_delta)
             return
 
-        raw_dt_ms = rotation.ts_ms - self._previous_position.ts_ms
+        raw_dt_ms = ts_ms - self._previous_ts_ms
         if raw_dt_ms <= 0:
             return
         dt = raw_dt_ms / 1000.0
 
-        vx = rotation.x_delta / dt
-        vy = rotation.y_delta / dt
-        speed = math.hypot(vx, vy)
+        if self._sample_clock is not None:
+            self._sample_clock.set(ts_ms / 1000.0)
+
+        vx = x_delta / dt
+        vy = y_delta / dt
+        speed_sq = vx * vx + vy * vy
 
-        phase_update = self._phase_tracker.step(speed)
+        phase_update = self._phase_tracker.step_squared(speed_sq)
 
         if phase_update.new_phase is not None:
             if phase_update.new_phase == MotionPhaseType.PAUSED:
                 if self._motion_state != DirectionType.UNKNOWN:
-                    self._set_direction(DirectionType.UNKNOWN, rotation)
+                    self._set_direction(DirectionType.UNKNOWN, ts_ms, x_delta, y_delta)
 
             self._set_motion_phase(phase_update.new_phase)
 
         if self._motion_mode == MotionPhaseType.MOVING:
-            direction_update = self._direction_quantizer.step(vx, vy, speed)
+            direction_update = self._direction_quantizer.step_squared(vx, vy, speed_sq)
             if direction_update.new_direction is not None:
-                self._set_direction(direction_update.new_direction, rotation)
+                self._set_direction(direction_update.new_direction, ts_ms, x_delta, y_delta)
         else:
             self._direction_quantizer.force(DirectionType.UNKNOWN)
 
         if self._segment_builder.active:
-            self._segment_builder.accumulate(rotation)
+            self._segment_builder.accumulate(ts_ms, x_delta, y_delta)
 
-        self._previous_position = rotation
+        self._previous_ts_ms = ts_ms
@@ -8,7 +8,6 @@ from gamevolt.events.event import Event
 from motion.direction.direction_type import DirectionType
 from motion.gesture.gesture_segment import GestureSegment
 from motion.segment.configuration.segment_builder_settings import SegmentBuilderSettings
-from wand.wand_rotation import WandRotation
 
 
 class SegmentBuilder:
@@ -23,7 +22,7 @@ class SegmentBuilder:
         self._net_dx: float = 0.0
         self._net_dy: float = 0.0
         self._path: float = 0.0
-        self._points: Deque[WandRotation] = deque(maxlen=settings.max_sample_count)
+        self._points: Deque[tuple[int, float, float]] = deque(maxlen=settings.max_sample_count)
 
         self.segment_completed: Event[Callable[[GestureSegment], None]] = Event()
 
@@ -31,35 +30,33 @@ class SegmentBuilder:
     def active(self) -> bool:
         return self._active
 
-    def start(self, dir_type: DirectionType, pos: WandRotation) -> None:
+    def start(self, dir_type: DirectionType, ts_ms: int, x_delta: float, y_delta: float) -> None:
         self._active = True
         self._direction = dir_type
-        self._start_ms = pos.ts_ms
-        self._last_ms = pos.ts_ms
+        self._start_ms = ts_ms
+        self._last_ms = ts_ms
         self._samples = 0
         self._net_dx = 0.0
         self._net_dy = 0.0
         self._path = 0.0
         self._points.clear()
-        self._points.append(pos)
+        self._points.append((ts_ms, x_delta, y_delta))
 
-    def accumulate(self, pos: WandRotation) -> None:
+    def accumulate(self, ts_ms: int, x_delta: float, y_delta: float) -> None:
         if not self._active:
             return
 
-        self._last_ms = pos.ts_ms
+        self._last_ms = ts_ms
         self._samples += 1
-        self._points.append(pos)
+        self._points.append((ts_ms, x_delta, y_delta))
 
         # Recommended: do not let PAUSE segments accumulate “noise distance”
         if self._direction == DirectionType.PAUSE:
             return
 
-        dx = pos.x_delta
-        dy = pos.y_delta
-        self._net_dx += dx
-        self._net_dy += dy
-        self._path += math.hypot(dx, dy)
+        self._net_dx += x_delta
+        self._net_dy += y_delta
+        self._path += math.hypot(x_delta, y_delta)
 
     def finish(self) -> None:
         if not self._active:
@@ -88,17 +85,17 @@ class SegmentBuilder:
         self._active = False
         self.segment_completed.invoke(seg)
 
-    def commit(self, new_dir: DirectionType, pos: WandRotation) -> None:
+    def commit(self, new_dir: DirectionType, ts_ms: int, x_delta: float, y_delta: float) -> None:
         # Guard: if upstream accidentally "commits" the same dir repeatedly, just accumulate.
         if self._active and new_dir == self._direction:
-            self.accumulate(pos)
+            self.accumulate(ts_ms, x_delta, y_delta)
             return
 
         if self._active:
-            self._last_ms = pos.ts_ms
+            self._last_ms = ts_ms
             self.finish()
 
-        self.start(new_dir, pos)
+        self.start(new_dir, ts_ms, x_delta, y_delta)
 
     def reset(self) -> None:
         self._active = False
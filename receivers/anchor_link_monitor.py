@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import time
+
+from gamevolt.web_sockets.web_socket_server import WebSocketServer
+from wand.anchor_link_stats import AnchorLinkStats
+from wand.data.anchor_tag import AnchorTag
+
+
+class AnchorLinkMonitor:
+    """
+    Per-anchor latency from the relays' message tags.
+
+    A timed tag carries the relay's send time on its own wall clock; the server's ping/pong probes of the
+    connection carrying the anchor give the clock offset, so the one-way transit is the receive time minus
+    the send time moved onto the server's clock. Relay queueing and serial lag are measured by the relay.
+    """
+
+    def __init__(self, web_socket_server: WebSocketServer) -> None:
+        self._web_socket_server = web_socket_server
+        self._stats: dict[str, AnchorLinkStats] = {}
+
+    @property
+    def stats(self) -> dict[str, AnchorLinkStats]:
+        return self._stats
+
+    def record(self, tag: AnchorTag, items: int, received_ms: float) -> None:
+        stats = self._stats.get(tag.anchor_id)
+        if stats is None:
+            stats = self._stats[tag.anchor_id] = AnchorLinkStats()
+
+        stats.messages += 1
+        stats.items += items
+        if items > stats.max_items:
+            stats.max_items = items
+        stats.last_message_monotonic = time.monotonic()
+
+        if tag.sent_ms is None:
+            return
+
+        stats.relay_queue_ms.add(tag.queued_ms)
+        stats.serial_lag_ms.add(tag.serial_ms)
+
+        health = self._web_socket_server.link_health(tag.anchor_id)
+        sent_ms = health.to_server_ms(tag.sent_ms) if health is not None else None
+        if health is None or sent_ms is None:
+            stats.unsynced += 1
+            return
+
+        stats.rtt_ms = health.rtt_ms
+        # The offset is only as good as the probe's symmetry; never report a negative transit.
+        stats.transit_ms.add(max(0.0, received_ms - sent_ms))
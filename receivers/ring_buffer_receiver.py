@@ -0,0 +1,56 @@
+import time
+from logging import Logger
+from typing import Callable
+
+from gamevolt.events.event import Event
+from gamevolt.io.spsc_ring_buffer import SpscRingBuffer
+from gamevolt.io.spsc_ring_buffer_stats import SpscRingBufferStats
+from gamevolt.serial.frame_receiver_protocol import FrameReceiverProtocol
+from gamevolt.serial.line_receiver_protocol import LineReceiverProtocol
+
+
+class RingBufferReceiver(LineReceiverProtocol, FrameReceiverProtocol):
+    """Consumer end of an ingest ring buffer; raises what the producer queued on each update(), in batches."""
+
+    def __init__(self, logger: Logger, ring_buffer: SpscRingBuffer, drain_max_items: int) -> None:
+        self._line_received: Event[Callable[[str], None]] = Event()
+        self._frame_received: Event[Callable[[bytes], None]] = Event()
+
+        self._drain_max_items = drain_max_items
+        self._ring_buffer = ring_buffer
+        self._logger = logger
+
+        self._stats = SpscRingBufferStats(last_log_monotonic=time.monotonic(), log_interval_s=2.0)
+
+    @property
+    def line_received(self) -> Event[Callable[[str], None]]:
+        return self._line_received
+
+    @property
+    def frame_received(self) -> Event[Callable[[bytes], None]]:
+        return self._frame_received
+
+    @property
+    def ring_buffer(self) -> SpscRingBuffer:
+        return self._ring_buffer
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    def update(self) -> None:
+        # Bounded per tick so a backlog cannot starve the rest of the loop; the remainder waits for the next tick.
+        items = self._ring_buffer.drain(self._drain_max_items)
+
+        if items:
+            self._stats.drains += 1
+            self._stats.drained += len(items)
+            self._stats.max_drain = max(self._stats.max_drain, len(items))
+
+        for item in items:
+            if isinstance(item, bytes):
+                self._frame_received.invoke(item)
+            else:
+                self._line_received.invoke(item)
+
+        self._stats.maybe_log(self._logger, time.monotonic(), "Ingest", self._ring_buffer)
@@ -1,27 +1,110 @@
+import time
 from logging import Logger
 from typing import Callable
 
 from gamevolt.events.event import Event
+from gamevolt.io.spsc_ring_buffer import SpscRingBuffer
+from gamevolt.serial.frame_receiver_protocol import FrameReceiverProtocol
 from gamevolt.serial.line_receiver_protocol import LineReceiverProtocol
+from gamevolt.web_sockets.web_socket_client_meta import WebSocketClientMeta
 from gamevolt.web_sockets.web_socket_server import WebSocketServer
+from messaging.messages.wand_wire_format_message import WandWireFormatMessage
+from receivers.anchor_link_monitor import AnchorLinkMonitor
+from wand.data.anchor_tag_codec import AnchorTagCodec
+from wand.data.wand_binary_codec import WandBinaryCodec
 
 
-class WebSocketLineReceiver(LineReceiverProtocol):
-    def __init__(self, logger: Logger, web_socket_server: WebSocketServer) -> None:
+class WebSocketLineReceiver(LineReceiverProtocol, FrameReceiverProtocol):
+    def __init__(
+        self,
+        logger: Logger,
+        web_socket_server: WebSocketServer,
+        ring_buffer: SpscRingBuffer | None = None,
+        anchor_link_monitor: AnchorLinkMonitor | None = None,
+    ) -> None:
         self._line_received: Event[Callable[[str], None]] = Event()
+        self._frame_received: Event[Callable[[bytes], None]] = Event()
+        self._message_received: Event[Callable[[str], None]] = Event()
 
         self._web_socket_server = web_socket_server
+        self._ring_buffer = ring_buffer
+        self._anchor_link_monitor = anchor_link_monitor
         self._logger = logger
 
+        self._codec = WandBinaryCodec()
+        self._anchor_tag_codec = AnchorTagCodec()
+
     @property
     def line_received(self) -> Event[Callable[[str], None]]:
         return self._line_received
 
+    @property
+    def frame_received(self) -> Event[Callable[[bytes], None]]:
+        return self._frame_received
+
+    @property
+    def message_received(self) -> Event[Callable[[str], None]]:
+        """JSON messages from relays (e.g. command queue reports), for a MessageHandler."""
+        return self._message_received
+
     def start(self) -> None:
+        self._web_socket_server.client_connected.subscribe(self._on_client_connected)
         self._web_socket_server.message_received.subscribe(self._on_line_received)
 
     def stop(self) -> None:
         self._web_socket_server.message_received.unsubscribe(self._on_line_received)
+        self._web_socket_server.client_connected.unsubscribe(self._on_client_connected)
+
+    def _on_client_connected(self, client: WebSocketClientMeta) -> None:
+        # Relays keep sending legacy text until told which binary frame version and line forms we can decode.
+        self._web_socket_server.send_to_client(
+            client.id,
+            WandWireFormatMessage(
+                binary_version=WandBinaryCodec.VERSION,
+                combined_lines=True,
+                batched_frames=True,
+                binary_flags=WandBinaryCodec.SUPPORTED_FLAGS,
+                anchor_tags=True,
+                relay_timestamps=self._anchor_link_monitor is not None,
+            ),
+        )
+
+    def _on_line_received(self, message: str | bytes) -> None:
+        # Relays tag each message with its anchor; wand data is keyed by wand tag, so only link telemetry uses it.
+        anchor_tag, message = self._anchor_tag_codec.untag(message)
+        # Taken before the items are handed on, which may process them inline.
+        received_ms = time.time() * 1000.0 if anchor_tag is not None else 0.0
+
+        # Relays may batch several lines (newline-delimited) or binary frames (concatenated) into one message.
+        if isinstance(message, bytes):
+            items = 0
+            for frame in self._codec.split(message):
+                self._on_item(frame)
+                items += 1
+        elif message.startswith("{"):
+            self._message_received.invoke(message)
+            return
+        elif "\n" not in message:
+            self._on_item(message)
+            items = 1
+        else:
+            items = 0
+            for line in message.split("\n"):
+                if line:
+                    self._on_item(line)
+                    items += 1
+
+        if anchor_tag is not None and self._anchor_link_monitor is not None:
+            self._anchor_link_monitor.record(anchor_tag, items, received_ms)
+
+    def _on_item(self, item: str | bytes) -> None:
+        if self._ring_buffer is not None:
+            # The socket reader only copies into the ring; a full ring drops (and counts) rather than stalling reads.
+            self._ring_buffer.try_put(item)
+            return
+
+        if isinstance(item, bytes):
+            self._frame_received.invoke(item)
+            return
 
-    def _on_line_received(self, line: str) -> None:
-        self._line_received.invoke(line)
+        self._line_received.invoke(item)
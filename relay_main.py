@@ -1,12 +1,15 @@
 import argparse
 import asyncio
+from dataclasses import replace
 
 from anchor_area.anchor_area import AnchorArea
 from anchor_area.anchor_area_controller import AnchorAreaController
 from anchor_relay.anchor_relay import AnchorRelay
 from appsettings_relay import AppSettingsRelay
+from gamevolt.configuration.errors.appsettings_error import AppsettingsError
 from gamevolt.logging import get_logger
 from gamevolt.messaging.command_bridge.anchor_command_bridge import AnchorCommandBridge
+from gamevolt.messaging.command_bridge.anchor_command_scheduler import AnchorCommandScheduler
 from gamevolt.messaging.events.message_handler import MessageHandler
 from gamevolt.serial.serial_transport import SerialTransport
 from gamevolt.web_sockets.web_socket_client import WebSocketClient
@@ -39,9 +42,17 @@ async def main() -> int:
     logger = get_logger(settings.logging)
     print(settings)
 
-    serial_transport = SerialTransport(logger=logger, settings=settings.serial_receiver)
+    # One anchor is the connection itself; several share this process's connection, each named on its traffic.
+    is_multi_anchor = bool(settings.anchors)
+    anchor_ports = [(a.id, a.port) for a in settings.anchors] or [(settings.id, settings.serial_receiver.port)]
+    if is_multi_anchor and settings.id in (id for id, _ in anchor_ports):
+        # Commands for the connection's own ID go out untagged, so every anchor on it would act on them.
+        raise AppsettingsError(f"relay id ({settings.id}) is also one of its anchors; give the relay its own id", "anchors")
 
     additional_headers = {"Cookie": f"GameVolt-Id={settings.id}; GameVolt-Version={settings.version}"}
+    if is_multi_anchor:
+        additional_headers["Cookie"] += f"; GameVolt-Anchors={','.join(id for id, _ in anchor_ports)}"
+
     web_socket_client = WebSocketClient(
         additional_headers=additional_headers,
         settings=settings.web_socket_client,
@@ -49,38 +60,73 @@ async def main() -> int:
     )
 
     web_socket_message_handler = MessageHandler(logger, web_socket_client)
-    bridge = AnchorCommandBridge(
-        message_handler=web_socket_message_handler,
-        serial_transport=serial_transport,
-        logger=logger,
-    )
-
-    anchor_area = AnchorArea()
-    anchor_area_controller = AnchorAreaController(
-        message_handler=web_socket_message_handler,
-        anchor_area=anchor_area,
-        anchor_id=settings.id,
-        logger=logger,
-    )
-
-    gateway = AnchorRelay(
-        logger=logger,
-        line_receiver_protocol=serial_transport,
-        web_socket_client=web_socket_client,
-        anchor_area=anchor_area,
-    )
 
-    logger.info(f"Running '{settings.name}' ID: ({settings.id})...")
+    schedulers: list[AnchorCommandScheduler] = []
+    bridges: list[AnchorCommandBridge] = []
+    anchor_area_controllers: list[AnchorAreaController] = []
+    gateways: list[AnchorRelay] = []
+
+    for anchor_id, port in anchor_ports:
+        serial_transport = SerialTransport(logger=logger, settings=replace(settings.serial_receiver, port=port))
+
+        scheduler = AnchorCommandScheduler(
+            logger=logger,
+            settings=settings.command_scheduler,
+            serial_transport=serial_transport,
+            baud=settings.serial_receiver.baud,
+            anchor_id=anchor_id,
+            web_socket_client=web_socket_client,
+        )
+        schedulers.append(scheduler)
+
+        bridges.append(
+            AnchorCommandBridge(
+                message_handler=web_socket_message_handler,
+                scheduler=scheduler,
+                logger=logger,
+                anchor_id=anchor_id if is_multi_anchor else None,
+            )
+        )
+
+        anchor_area = AnchorArea()
+        anchor_area_controllers.append(
+            AnchorAreaController(
+                message_handler=web_socket_message_handler,
+                anchor_area=anchor_area,
+                anchor_id=anchor_id,
+                logger=logger,
+            )
+        )
+
+        gateways.append(
+            AnchorRelay(
+                logger=logger,
+                settings=settings.relay,
+                line_receiver_protocol=serial_transport,
+                web_socket_client=web_socket_client,
+                message_handler=web_socket_message_handler,
+                anchor_area=anchor_area,
+                anchor_id=anchor_id,
+            )
+        )
+
+    logger.info(f"Running '{settings.name}' ID: ({settings.id}) for anchors {[id for id, _ in anchor_ports]}...")
 
     try:
-        bridge.start()
+        for scheduler in schedulers:
+            scheduler.start()
+        for bridge in bridges:
+            bridge.start()
         web_socket_message_handler.start()
         await web_socket_client.start_async()
-        await gateway.start_async()
-        anchor_area_controller.start()
+        for gateway in gateways:
+            await gateway.start_async()
+        for anchor_area_controller in anchor_area_controllers:
+            anchor_area_controller.start()
 
         while True:
-            gateway.update()
+            for gateway in gateways:
+                gateway.update()
             await asyncio.sleep(0.01)
     except asyncio.exceptions.CancelledError:
         pass
@@ -94,11 +140,16 @@ async def main() -> int:
 
     finally:
         logger.info(f"Stopping '{settings.name}' ID: ({settings.id})...")
-        anchor_area_controller.stop()
-        await gateway.stop_async()
+        for anchor_area_controller in anchor_area_controllers:
+            anchor_area_controller.stop()
+        for gateway in gateways:
+            await gateway.stop_async()
         await web_socket_client.stop_async()
         web_socket_message_handler.stop()
-        bridge.stop()
+        for bridge in bridges:
+            bridge.stop()
+        for scheduler in schedulers:
+            await scheduler.stop_async()
         return 0
 
 
@@ -5,6 +5,8 @@ from logging import Logger
 from show_system.show_system_controller import ShowSystemController
 from spell_cues.configuration.wand_spell_cue_controller_settings import WandSpellCueControllerSettings
 from spells.spell_type import SpellType
+from wand.sharding.sharded_tracked_wand_manager import ShardedTrackedWandManager
+from wand.sharding.sharded_wand import ShardedWand
 from wand.tracked_wand import TrackedWand
 from wand.tracked_wand_manager import TrackedWandManager
 from wand.wand_device_controller import WandDeviceController
@@ -25,7 +27,7 @@ class WandSpellCueController:
         self,
         logger: Logger,
         settings: WandSpellCueControllerSettings,
-        tracked_wand_manager: TrackedWandManager,
+        tracked_wand_manager: TrackedWandManager | ShardedTrackedWandManager,
         wand_device_controller: WandDeviceController,
         show_system_controller: ShowSystemController,
     ) -> None:
@@ -41,7 +43,7 @@ class WandSpellCueController:
     def stop(self) -> None:
         self._tracked_wand_manager.spell_cast.unsubscribe(self._on_spell_cast)
 
-    def _on_spell_cast(self, wand: TrackedWand, zone: Zone, spell_type: SpellType) -> None:
+    def _on_spell_cast(self, wand: TrackedWand | ShardedWand, zone: Zone, spell_type: SpellType) -> None:
         wizard_level = self._get_wizard_level(wand.id)
         self._show_system_controller.play_spell(spell_type, wizard_level)
 
@@ -5,6 +5,8 @@ from logging import Logger
 
 from spells.spell_type import SpellType
 from visualisation.wand_colour_registry import WandColourRegistry
+from wand.sharding.sharded_tracked_wand_manager import ShardedTrackedWandManager
+from wand.sharding.sharded_wand import ShardedWand
 from wand.tracked_wand import TrackedWand
 from wand.tracked_wand_manager import TrackedWandManager
 from zones.visualisation.zone_visualiser_protocol import ZoneVisualiserProtocol
@@ -18,7 +20,7 @@ class SpellCastPresentationController:
     def __init__(
         self,
         logger: Logger,
-        tracked_wand_manager: TrackedWandManager,
+        tracked_wand_manager: TrackedWandManager | ShardedTrackedWandManager,
         zone_visualiser: ZoneVisualiserProtocol,
         colour_assigner: WandColourRegistry,
     ):
@@ -33,7 +35,7 @@ class SpellCastPresentationController:
     async def stop_async(self) -> None:
         self._tracked_wand_manager.spell_cast.unsubscribe(self._on_spell_cast)
 
-    def _on_spell_cast(self, wand: TrackedWand, zone: Zone, spell_type: SpellType) -> None:
+    def _on_spell_cast(self, wand: TrackedWand | ShardedWand, zone: Zone, spell_type: SpellType) -> None:
         colour = self._colour_assigner.try_get_known(wand.id) or FALLBACK_COLOUR
 
         self._zone_visualiser.show_spell_cast_coloured(spell_type, colour)
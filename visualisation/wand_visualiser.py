@@ -15,6 +15,7 @@ from visualisation.visualised_wand import VisualisedWand
 from visualisation.visualiser_protocol import WandVisualiserProtocol
 from visualisation.wand_colour_registry import WandColourRegistry
 from wand.configuration.input_settings import InputSettings
+from wand.sharding.sharded_tracked_wand_manager import ShardedTrackedWandManager
 from wand.tracked_wand_manager import TrackedWandManager
 
 
@@ -25,7 +26,7 @@ class WandVisualiser(Visualiser, WandVisualiserProtocol):
         wand_visualiser_settings: WandVisualiserSettings,
         input_settings: InputSettings,
         visualised_wand_factory: VisualisedWandFactory,
-        tracked_wand_manager: TrackedWandManager,
+        tracked_wand_manager: TrackedWandManager | ShardedTrackedWandManager,
         wand_colour_registry: WandColourRegistry,
     ) -> None:
         super().__init__(logger, wand_visualiser_settings.visualiser)
@@ -7,6 +7,7 @@ from visualisation.visualiser_protocol import WandVisualiserProtocol
 from visualisation.wand_colour_registry import WandColourRegistry
 from visualisation.wand_visualiser import WandVisualiser
 from wand.configuration.input_settings import InputSettings
+from wand.sharding.sharded_tracked_wand_manager import ShardedTrackedWandManager
 from wand.tracked_wand_manager import TrackedWandManager
 
 
@@ -17,7 +18,7 @@ class WandVisualiserFactory:
         wand_visualiser_settings: WandVisualiserSettings,
         input_settings: InputSettings,
         visualised_wand_factory: VisualisedWandFactory,
-        tracked_wand_manager: TrackedWandManager,
+        tracked_wand_manager: TrackedWandManager | ShardedTrackedWandManager,
         wand_colour_registry: WandColourRegistry,
     ) -> None:
         self._wand_visualiser_settings = wand_visualiser_settings
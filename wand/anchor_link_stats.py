@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from wand.latency_histogram import LatencyHistogram
+
+
+@dataclass
+class AnchorLinkStats:
+    """One anchor's relay link as the server sees it, since the last stats log."""
+
+    messages: int = 0
+    items: int = 0
+
+    # relay queue depth at flush: most lines/frames batched into one message
+    max_items: int = 0
+
+    # timed messages that arrived before the connection's first pong, so with no clock offset to correct by
+    unsynced: int = 0
+
+    # relay send -> server receive, corrected by the ping/pong clock offset
+    transit_ms: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # serial read -> relay send
+    relay_queue_ms: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # anchor receive -> relay serial read, beyond the usual (by the anchor's t_rx clock)
+    serial_lag_ms: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    # latest ping/pong round trip of the connection carrying this anchor
+    rtt_ms: float | None = None
+    last_message_monotonic: float = 0.0
+
+    def reset_window(self) -> None:
+        self.messages = 0
+        self.items = 0
+        self.max_items = 0
+        self.unsynced = 0
+        self.transit_ms.reset()
+        self.relay_queue_ms.reset()
+        self.serial_lag_ms.reset()
+
+    def __str__(self) -> str:
+        rtt = f"{self.rtt_ms:.1f}ms" if self.rtt_ms is not None else "?"
+        return (
+            f"messages={self.messages} items={self.items} max_items={self.max_items} rtt={rtt} "
+            f"transit[{self.transit_ms}] relay_queue[{self.relay_queue_ms}] serial_lag[{self.serial_lag_ms}] unsynced={self.unsynced}"
+        )
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from gamevolt.configuration.settings_base import SettingsBase
+
+
+@dataclass
+class IngestBufferSettings(SettingsBase):
+    # queue socket reads in a shared-memory ring and process them on the main loop tick
+    is_enabled: bool
+    capacity_bytes: int
+    drain_max_items: int
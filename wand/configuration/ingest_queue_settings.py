@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from gamevolt.configuration.settings_base import SettingsBase
+
+
+@dataclass
+class IngestQueueSettings(SettingsBase):
+    # bound the packets waiting for the wand server; the oldest packets of the most backlogged wand go first
+    is_enabled: bool
+    max_packets: int
+    max_packets_per_wand: int
+    max_age_s: float
@@ -5,6 +5,7 @@ from wand.configuration.mock_wand_settings import MockWandSettings
 from wand.configuration.tracked_wands_settings import TrackedWandsSettings
 from wand.configuration.wand_server_settings import WandServerSettings
 from wand.configuration.wand_settings import WandSettings
+from wand.configuration.wand_sharding_settings import WandShardingSettings
 from wand.input_type import InputType
 
 
@@ -14,3 +15,4 @@ class InputSettings(SettingsBase):
     input_type: InputType
     mock: MockWandSettings
     wand: WandSettings
+    sharding: WandShardingSettings
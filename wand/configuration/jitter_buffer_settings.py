@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from gamevolt.configuration.settings_base import SettingsBase
+
+
+@dataclass
+class JitterBufferSettings(SettingsBase):
+    is_enabled: bool
+    hold_ms: float
+    max_packets: int
@@ -1,8 +1,13 @@
 from dataclasses import dataclass
 
 from gamevolt.configuration.settings_base import SettingsBase
+from wand.configuration.jitter_buffer_settings import JitterBufferSettings
 
 
 @dataclass
 class TrackedWandsSettings(SettingsBase):
     ids: list[str]
+    jitter_buffer: JitterBufferSettings
+
+    # only decode and interpret packets of wands that are active in a zone
+    gate_inactive_wands: bool
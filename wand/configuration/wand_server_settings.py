@@ -2,12 +2,18 @@ from dataclasses import dataclass
 
 from gamevolt.configuration.settings_base import SettingsBase
 from gamevolt.web_sockets.configuration.web_socket_server_settings import WebSocketServerSettings
+from wand.configuration.ingest_buffer_settings import IngestBufferSettings
+from wand.configuration.ingest_queue_settings import IngestQueueSettings
 
 
 @dataclass
 class WandServerSettings(SettingsBase):
     header_ttl_s: float
+    dedup_window_s: float
+    dedup_max_entries: int
     disconnect_after_s: float
     filter_wands: bool
     filtered_wand_ids: list[str]
     web_socket: WebSocketServerSettings
+    ingest_buffer: IngestBufferSettings
+    ingest_queue: IngestQueueSettings
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from gamevolt.configuration.settings_base import SettingsBase
+
+
+@dataclass
+class WandShardingSettings(SettingsBase):
+    # 0 or 1 runs every wand in-process; more spreads wands over that many worker processes by tag
+    shard_count: int
+    queue_max_batches: int
+    stop_timeout_s: float
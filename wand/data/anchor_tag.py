@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AnchorTag:
+    anchor_id: str
+
+    # relay timestamps, present once the server has asked for them:
+    # relay wall clock (ms) when the message was sent
+    sent_ms: float | None = None
+    # how long the oldest item in the message waited in the relay after it was read from serial
+    queued_ms: float = 0.0
+    # how much later than usual the slowest item reached the relay, by the anchor's t_rx clock
+    serial_ms: float = 0.0
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import struct
+
+from wand.data.anchor_tag import AnchorTag
+
+
+class AnchorTagCodec:
+    """
+    Marks which anchor a web socket message came from, optionally with the relay's timestamps.
+
+    Every line or frame in a message belongs to the same anchor, so the tag is written once, in front:
+      - text: an "ANCHOR <id>" line, followed by " sent=<ms> queued=<ms> serial=<ms>" when timed
+      - binary: magic "WA" (or "WT" when timed), id length u8, ascii id, then for "WT" sent_ms f64,
+        queued_ms f32, serial_ms f32 (distinct from WandBinaryCodec's "WB")
+    """
+
+    TEXT_PREFIX = "ANCHOR "
+    MAGIC = b"WA"
+    TIMED_MAGIC = b"WT"
+
+    _TIMES = struct.Struct("<dff")
+
+    def tag(self, tag: AnchorTag, message: str | bytes) -> str | bytes:
+        if isinstance(message, bytes):
+            encoded = tag.anchor_id.encode("ascii", errors="ignore")[:255]
+            if tag.sent_ms is None:
+                return self.MAGIC + bytes((len(encoded),)) + encoded + message
+
+            times = self._TIMES.pack(tag.sent_ms, tag.queued_ms, tag.serial_ms)
+            return self.TIMED_MAGIC + bytes((len(encoded),)) + encoded + times + message
+
+        if tag.sent_ms is None:
+            return f"{self.TEXT_PREFIX}{tag.anchor_id}\n{message}"
+
+        return (
+            f"{self.TEXT_PREFIX}{tag.anchor_id} sent={tag.sent_ms:.1f} queued={tag.queued_ms:.1f} serial={tag.serial_ms:.1f}\n" f"{message}"
+        )
+
+    def untag(self, message: str | bytes) -> tuple[AnchorTag | None, str | bytes]:
+        """Returns (tag, untagged message); untagged (or malformed) messages come back as-is with no tag."""
+        if isinstance(message, bytes):
+            return self._untag_binary(message)
+
+        if not message.startswith(self.TEXT_PREFIX):
+            return None, message
+
+        head, _, rest = message.partition("\n")
+        anchor_id, *fields = head[len(self.TEXT_PREFIX) :].split() or [""]
+        if not fields:
+            return AnchorTag(anchor_id), rest
+
+        try:
+            times = dict(field.split("=", 1) for field in fields)
+            tag = AnchorTag(anchor_id, float(times["sent"]), float(times["queued"]), float(times["serial"]))
+        except (KeyError, ValueError):
+            # A newer relay's fields we cannot read; the anchor is still known.
+            return AnchorTag(anchor_id), rest
+
+        return tag, rest
+
+    def _untag_binary(self, message: bytes) -> tuple[AnchorTag | None, bytes]:
+        magic = message[:2]
+        if (magic != self.MAGIC and magic != self.TIMED_MAGIC) or len(message) < 3:
+            return None, message
+
+        end = 3 + message[2]
+        anchor_id = message[3:end].decode("ascii", errors="ignore")
+        if magic == self.MAGIC:
+            return AnchorTag(anchor_id), message[end:]
+
+        if len(message) < end + self._TIMES.size:
+            return None, message
+
+        sent_ms, queued_ms, serial_ms = self._TIMES.unpack_from(message, end)
+        return AnchorTag(anchor_id, sent_ms, queued_ms, serial_ms), message[end + self._TIMES.size :]
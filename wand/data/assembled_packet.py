@@ -11,3 +11,6 @@ class AssembledPacket:
     fmt: str
     data_str: str
     header_age_s: float
+
+    # anchor's own receive clock (ms); 0 when unknown
+    t_rx_ms: int = 0
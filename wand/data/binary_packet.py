@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class BinaryPacket:
+    seq: int
+    t0_ms: int
+    sample_dt_us: int
+    tag_hex: str
+    nsamp: int
+    fmt: str
+    # q15 triplets; an (nsamp, 3) int64 array when decoded from a transcoded frame
+    samples: tuple[tuple[int, int, int], ...] | np.ndarray
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class GatedHeader:
+    """A PKT header of a wand the activity gate turned away, held unparsed so its DATA line is still recognised."""
+
+    tag_hex: str
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import struct
+import zlib
+from typing import Iterator, Sequence
+
+import numpy as np
+
+from wand.data.assembled_packet import AssembledPacket
+from wand.data.binary_packet import BinaryPacket
+from wand.packet_header import PacketHeader
+
+
+class WandBinaryCodec:
+    """
+    Versioned binary form of a PKT header + DATA payload pair.
+
+    Layout (little-endian):
+      - header: magic "WB", version u8, flags u8, tag u16, seq u32, t0 u64, dt_us u32, nsamp u16, fmt 8s
+      - payload: nsamp * (int16, int16, int16) q15 triplets
+
+    With any flag set the header is followed by a u16 payload length and the payload is transcoded:
+      - FLAG_DELTA: each axis as a zigzag varint of its difference from the previous sample (the first from 0)
+      - FLAG_ZLIB: the (raw or delta) payload deflated, set only on frames where that came out smaller
+
+    Encoding is lossless with respect to the text path: q15 values are clamped to ±32767,
+    which is exactly what the float conversion clamps to anyway.
+    """
+
+    VERSION = 1
+    MAGIC = b"WB"
+
+    FLAG_DELTA = 0x01
+    FLAG_ZLIB = 0x02
+    SUPPORTED_FLAGS = FLAG_DELTA | FLAG_ZLIB
+
+    _HEADER = struct.Struct("<2sBBHIQIH8s")
+    _SAMPLE = struct.Struct("<hhh")
+    _TAG = struct.Struct("<H")
+    _TAG_OFFSET = 4
+    _NSAMP = struct.Struct("<H")
+    _NSAMP_OFFSET = 22
+    _PAYLOAD_LENGTH = struct.Struct("<H")
+
+    _Q15_MAX = 32767
+    # a delta of two clamped q15 values zigzags to at most 17 bits, i.e. 3 varint bytes
+    _VARINT_MAX_BYTES = 3
+
+    @property
+    def header_size(self) -> int:
+        return self._HEADER.size
+
+    def is_frame(self, frame: bytes) -> bool:
+        return frame[:2] == self.MAGIC
+
+    def encode(
+        self,
+        header: PacketHeader | AssembledPacket,
+        samples: Sequence[tuple[int, int, int]],
+        flags: int = 0,
+    ) -> bytes | None:
+        """
+        Returns None when the packet cannot be represented, so the caller can fall back to text.
+        flags is what the peer accepts; the frame may use fewer (no ZLIB when it does not help).
+        """
+        if len(header.tag_hex) != 4:
+            return None
+
+        fmt = header.fmt.encode("ascii", errors="ignore")
+        if len(fmt) > 8 or len(samples) > 0xFFFF:
+            return None
+
+        lim = self._Q15_MAX
+        flat = [max(-lim, min(lim, v)) for sample in samples for v in sample]
+
+        flags &= self.SUPPORTED_FLAGS
+        payload = self._encode_deltas(flat) if flags & self.FLAG_DELTA else struct.pack(f"<{len(flat)}h", *flat)
+
+        if flags & self.FLAG_ZLIB:
+            deflated = zlib.compress(payload)
+            if len(deflated) < len(payload):
+                payload = deflated
+            else:
+                flags &= ~self.FLAG_ZLIB
+
+        if flags and len(payload) > 0xFFFF:
+            flags, payload = 0, struct.pack(f"<{len(flat)}h", *flat)
+
+        try:
+            head = self._HEADER.pack(
+                self.MAGIC,
+                self.VERSION,
+                flags,
+                int(header.tag_hex, 16),
+                header.seq,
+                header.t0_ms,
+                header.sample_dt_us,
+                len(samples),
+                fmt,
+            )
+        except (struct.error, ValueError):
+            return None
+
+        if flags:
+            return head + self._PAYLOAD_LENGTH.pack(len(payload)) + payload
+        return head + payload
+
+    def split(self, blob: bytes) -> Iterator[bytes]:
+        """
+        Yields the frames of a batched message (frames simply concatenated), using each header's nsamp
+        (or payload length, for transcoded frames).
+        A single frame is yielded as-is; anything unrecognisable is yielded whole for decode() to reject.
+        """
+        size = len(blob)
+        offset = 0
+
+        while offset < size:
+            if size - offset < self._HEADER.size or blob[offset : offset + 2] != self.MAGIC:
+                yield blob[offset:]
+                return
+
+            end = offset + self._frame_size(blob, offset)
+            yield blob if (offset == 0 and end == size) else blob[offset:end]
+            offset = end
+
+    def peek_tag(self, frame: bytes) -> str | None:
+        """Reads only the wand tag, so a frame can be routed or discarded without decoding its samples."""
+        if len(frame) < self._HEADER.size or frame[:2] != self.MAGIC or frame[2] != self.VERSION:
+            return None
+
+        return f"{self._TAG.unpack_from(frame, self._TAG_OFFSET)[0]:04X}"
+
+    def decode(self, frame: bytes) -> BinaryPacket | None:
+        if len(frame) < self._HEADER.size:
+            return None
+
+        magic, version, flags, tag, seq, t0_ms, dt_us, nsamp, fmt = self._HEADER.unpack_from(frame)
+        if magic != self.MAGIC or version != self.VERSION or flags & ~self.SUPPORTED_FLAGS:
+            return None
+
+        if len(frame) != self._frame_size(frame, 0):
+            return None
+
+        if flags:
+            samples = self._decode_payload(frame[self._HEADER.size + self._PAYLOAD_LENGTH.size :], flags, nsamp)
+            if samples is None:
+                return None
+        else:
+            samples = tuple(self._SAMPLE.iter_unpack(memoryview(frame)[self._HEADER.size :]))
+
+        return BinaryPacket(
+            seq=seq,
+            t0_ms=t0_ms,
+            sample_dt_us=dt_us,
+            tag_hex=f"{tag:04X}",
+            nsamp=nsamp,
+            fmt=fmt.rstrip(b"\x00").decode("ascii") or "yawpitch",
+            samples=samples,
+        )
+
+    def _frame_size(self, blob: bytes, offset: int) -> int:
+        if blob[offset + 3] == 0:
+            return self._HEADER.size + self._NSAMP.unpack_from(blob, offset + self._NSAMP_OFFSET)[0] * self._SAMPLE.size
+
+        length_offset = offset + self._HEADER.size
+        if len(blob) < length_offset + self._PAYLOAD_LENGTH.size:
+            return len(blob) - offset
+        return self._HEADER.size + self._PAYLOAD_LENGTH.size + self._PAYLOAD_LENGTH.unpack_from(blob, length_offset)[0]
+
+    @staticmethod
+    def _encode_deltas(flat: list[int]) -> bytes:
+        out = bytearray()
+        previous = [0, 0, 0]
+
+        for i, v in enumerate(flat):
+            axis = i % 3
+            d = v - previous[axis]
+            previous[axis] = v
+
+            z = d << 1 if d >= 0 else ((-d) << 1) - 1
+            while z >= 0x80:
+                out.append((z & 0x7F) | 0x80)
+                z >>= 7
+            out.append(z)
+
+        return bytes(out)
+
+    def _decode_payload(self, payload: bytes, flags: int, nsamp: int) -> np.ndarray | None:
+        count = nsamp * 3
+
+        if flags & self.FLAG_ZLIB:
+            # bounded, so a corrupt or hostile frame cannot inflate without limit
+            limit = count * (self._VARINT_MAX_BYTES if flags & self.FLAG_DELTA else self._SAMPLE.size // 3)
+            inflater = zlib.decompressobj()
+            try:
+                payload = inflater.decompress(payload, limit)
+            except zlib.error:
+                return None
+            if not inflater.eof or inflater.unconsumed_tail:
+                return None
+
+        if not flags & self.FLAG_DELTA:
+            if len(payload) != count * 2:
+                return None
+            return np.frombuffer(payload, dtype="<i2").astype(np.int64).reshape(-1, 3)
+
+        if count == 0:
+            return np.zeros((0, 3), dtype=np.int64) if not payload else None
+
+        b = np.frombuffer(payload, dtype=np.uint8)
+        ends = np.flatnonzero(b < 0x80)
+        if len(ends) != count or ends[-1] != len(b) - 1:
+            return None
+
+        starts = np.empty_like(ends)
+        starts[0] = 0
+        starts[1:] = ends[:-1] + 1
+        lengths = ends - starts + 1
+        if lengths.max() > self._VARINT_MAX_BYTES:
+            return None
+
+        shifts = (np.arange(len(b)) - np.repeat(starts, lengths)) * 7
+        z = np.add.reduceat((b & 0x7F).astype(np.int64) << shifts, starts)
+        deltas = (z >> 1) ^ -(z & 1)
+        return np.cumsum(deltas.reshape(-1, 3), axis=0)
@@ -1,5 +1,6 @@
 import re
 
+from wand.data.assembled_packet import AssembledPacket
 from wand.data.data_line import DataLine
 from wand.packet_header import PacketHeader
 
@@ -18,7 +19,21 @@ class WandProtocolParser:
 
     _DATA_RE = re.compile(r'^(?:DATA|DATA_RAW)\s+seq=(?P<seq>\d+)\s+data="?(?P<data>.*)"?\s*$')
 
-    def parse(self, line: str, now: float) -> PacketHeader | DataLine | None:
+    # Header and payload on one line; needs no pairing with a DATA line.
+    _PKTD_RE = re.compile(
+        r"^PKTD\s+"
+        r"t_rx=(?P<t_rx>\d+)\s+"
+        r"t0=(?P<t0>\d+)\s+"
+        r"dt_us=(?P<dt_us>\d+)\s+"
+        r"tag=(?P<tag>[0-9A-Fa-f]+)\s+"
+        r"seq=(?P<seq>\d+)\s+"
+        r"nsamp=(?P<nsamp>\d+)"
+        r"(?:\s+fmt=(?P<fmt>[A-Za-z0-9_]+))?\s+"
+        r'data="?(?P<data>.*)"?\s*$'
+    )
+    _PKTD_DATA_SEP_RE = re.compile(r"\s+data=")
+
+    def parse(self, line: str, now: float) -> PacketHeader | DataLine | AssembledPacket | None:
         m = self._PKT_RE.match(line)
         if m:
             seq = int(m["seq"])
@@ -36,16 +51,89 @@ class WandProtocolParser:
                 nsamp=nsamp,
                 fmt=fmt,
                 received_monotonic=now,
+                t_rx_ms=int(m["t_rx"]),
             )
 
         m = self._DATA_RE.match(line)
         if m:
-            seq = int(m["seq"])
-            data_str = m["data"].strip()
+            return DataLine(seq=int(m["seq"]), data_str=self._unquote(m["data"]))
 
-            if len(data_str) >= 2 and data_str[0] == '"' and data_str[-1] == '"':
-                data_str = data_str[1:-1]
-
-            return DataLine(seq=seq, data_str=data_str)
+        m = self._PKTD_RE.match(line)
+        if m:
+            return AssembledPacket(
+                seq=int(m["seq"]),
+                t0_ms=int(m["t0"]),
+                sample_dt_us=int(m["dt_us"]),
+                tag_hex=m["tag"].upper(),
+                nsamp=int(m["nsamp"]),
+                fmt=(m["fmt"] or "yawpitch").lower(),
+                data_str=self._unquote(m["data"]),
+                header_age_s=0.0,
+                t_rx_ms=int(m["t_rx"]),
+            )
 
         return None
+
+    @staticmethod
+    def combine(raw_header_line: str, data_str: str) -> str:
+        """Builds the single-line PKTD form of a PKT header line and its DATA payload."""
+        return f'PKTD{raw_header_line[3:]} data="{data_str}"'
+
+    @classmethod
+    def split(cls, raw_combined_line: str, seq: int, data_str: str) -> tuple[str, str]:
+        """Rebuilds the legacy PKT and DATA lines from a PKTD line, for servers that cannot read it."""
+        head = cls._PKTD_DATA_SEP_RE.split(raw_combined_line, maxsplit=1)[0]
+        return f"PKT{head[4:]}", f'DATA seq={seq} data="{data_str}"'
+
+    @staticmethod
+    def peek_field(raw: str, key: str) -> str | None:
+        """Reads one `key=value` field (key including "=") with str.find, without parsing the rest of the line."""
+        start = raw.find(key)
+        if start < 0:
+            return None
+
+        start += len(key)
+        end = raw.find(" ", start)
+        return raw[start:] if end < 0 else raw[start:end]
+
+    @classmethod
+    def peek_data(cls, raw: str) -> str | None:
+        """The unquoted payload after " data=", without parsing the rest of the line."""
+        _, sep, data_str = raw.partition(" data=")
+        return cls._unquote(data_str) if sep else None
+
+    @staticmethod
+    def count_samples(data_str: str) -> int:
+        """Samples in a DATA payload, counted by separator rather than parsed (compare with a header's nsamp)."""
+        data_str = data_str.strip().strip('"').rstrip(";")
+        return data_str.count(";") + 1 if data_str else 0
+
+    @staticmethod
+    def _unquote(data_str: str) -> str:
+        data_str = data_str.strip()
+        if len(data_str) >= 2 and data_str[0] == '"' and data_str[-1] == '"':
+            data_str = data_str[1:-1]
+        return data_str
+
+    @staticmethod
+    def parse_samples(data_str: str) -> list[tuple[int, int, int]]:
+        """Parses a DATA payload into q15 (x, y, z) triplets, skipping malformed items."""
+        samples: list[tuple[int, int, int]] = []
+        if not data_str:
+            return samples
+
+        for part in data_str.split(";"):
+            part = part.strip().strip('"')
+            if not part:
+                continue
+
+            toks = [t.strip() for t in part.split(",") if t.strip()]
+            if len(toks) < 3:
+                continue
+
+            try:
+                samples.append((int(toks[0]), int(toks[1]), int(toks[2])))
+            except ValueError:
+                continue
+
+        return samples
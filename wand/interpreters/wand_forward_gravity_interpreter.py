@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import functools
 import math
 
+import numpy as np
+
 from maths.utils import cross, dot, norm, normalize
 from maths.vec3 import Vec3
 from wand.interpreters.configuration.rmf_settings import ClipMode, RMFSettings
 from wand.wand_rotation import WandRotation
+from wand.wand_rotation_batch import WandRotationBatch
 
 
 class ForwardGravityInterpreter:
@@ -25,6 +29,9 @@ class ForwardGravityInterpreter:
       - y_delta > 0 : upward motion
     """
 
+    # Below this many samples a packet is cheaper to step through per sample than as a few NumPy calls.
+    BATCH_MIN_SAMPLES = 10
+
     def __init__(self, settings: RMFSettings = RMFSettings()) -> None:
         self._settings = settings
 
@@ -37,6 +44,12 @@ class ForwardGravityInterpreter:
 
         self._az_ref_x, self._az_ref_y = self._build_azimuth_basis()
 
+        # on_batch: up, f -> f x up, and the azimuth basis as matrices
+        u0, u1, u2 = self._u
+        self._u_array = np.array(self._u, dtype=np.float64)
+        self._side_matrix = np.array(((0.0, u2, -u1), (-u2, 0.0, u0), (u1, -u0, 0.0)))
+        self._azimuth_matrix = np.array((self._az_ref_y, self._az_ref_x), dtype=np.float64)
+
     def reset(self) -> None:
         self._f_prev = None
         self._side_prev = None
@@ -44,6 +57,100 @@ class ForwardGravityInterpreter:
         self._y_abs = 0.0
 
     def on_sample(self, id: str, ts_ms: int, fx: float, fy: float, fz: float) -> WandRotation:
+        dx, dy, nx, ny = self._step(fx, fy, fz)
+        return WandRotation(id, ts_ms, dx, dy, nx, ny)
+
+    def on_batch(self, id: str, ts_ms: np.ndarray, f: np.ndarray) -> WandRotationBatch:
+        """
+        Interprets a packet of forward vectors (nsamp, 3), carrying state across batches like on_sample.
+
+        A sample's delta depends only on the forward vector before it (the packet shifted by one, led by the
+        previous packet's last) and on the last usable side axis (a forward fill), so the whole packet is
+        computed at once with NumPy and matches on_sample to within float rounding. Vectors are the columns
+        of one (3, nsamp + 1) array, column 0 being the previous forward vector, and products with the fixed
+        up and azimuth axes are small matrix products, so each step is a few whole-packet operations.
+        Packets shorter than BATCH_MIN_SAMPLES are stepped through per sample instead.
+        """
+        count = len(f)
+        if count == 0 or count < self.BATCH_MIN_SAMPLES:
+            return self._on_batch_per_sample(id, ts_ms, f)
+
+        settings = self._settings
+        tiny = settings.tiny_angle
+
+        raw = np.asarray(f, dtype=np.float64).reshape(count, 3).T
+        mag = np.sqrt((raw * raw).sum(axis=0))
+        mag[mag == 0.0] = np.inf  # zero vectors stay zero, as normalize()
+
+        forward = np.empty((3, count + 1), dtype=np.float64)
+        np.divide(raw, mag, out=forward[:, 1:])
+        # The very first sample is its own predecessor: zero rotation, so zero delta, as on_sample.
+        forward[:, 0] = forward[:, 1] if self._f_prev is None else self._f_prev
+
+        nx, ny = self._abs_norm_from_forward_columns(forward[:, 1:])
+
+        # Side axis (f x up) of every column; its magnitude is also |up x f|, the horizontal check on f_prev.
+        side = self._side_matrix @ forward
+        side_mag = np.sqrt((side * side).sum(axis=0))
+        usable = side_mag >= tiny
+
+        # Side axis before each sample: the last usable one so far, or the state carried in (column 0).
+        side /= np.where(usable, side_mag, np.inf)
+        side[:, 0] = (0.0, 0.0, 0.0) if self._side_prev is None else self._side_prev
+        usable[0] = True
+        last_usable = self._column_index(count + 1) * usable
+        np.maximum.accumulate(last_usable, out=last_usable)
+        side = side[:, last_usable]
+
+        # Minimal rotation between consecutive columns, as cross/dot of the shifted array with itself.
+        rolled_1 = forward[[1, 2, 0]]
+        rolled_2 = forward[[2, 0, 1]]
+        cross_product = rolled_1[:, :-1] * rolled_2[:, 1:] - rolled_2[:, :-1] * rolled_1[:, 1:]
+        s = np.sqrt((cross_product * cross_product).sum(axis=0))
+        c = np.minimum(np.maximum((forward[:, :-1] * forward[:, 1:]).sum(axis=0), -1.0), 1.0)
+        angle = np.arctan2(s, c)
+        moving = (angle >= tiny) & (s >= tiny)
+
+        # omega = (cross / s) * angle, projected onto up (dx) and the previous side axis (dy)
+        scale = np.where(moving, angle, 0.0) / np.maximum(s, tiny)
+        dx = (self._u_array @ cross_product) * scale
+        dy = (cross_product * side[:, :-1]).sum(axis=0) * scale
+
+        # Near-vertical: horizontal direction becomes unreliable
+        dx[side_mag[:-1] < tiny] = 0.0
+
+        if settings.deadzone_x > 0.0:
+            dx[np.abs(dx) < settings.deadzone_x] = 0.0
+        if settings.deadzone_y > 0.0:
+            dy[np.abs(dy) < settings.deadzone_y] = 0.0
+
+        gain_x = -settings.gain_x if settings.invert_x else settings.gain_x
+        gain_y = -settings.gain_y if settings.invert_y else settings.gain_y
+        if gain_x != 1.0:
+            dx *= gain_x
+        if gain_y != 1.0:
+            dy *= gain_y
+
+        if settings.keep_absolute:
+            self._x_abs += float(dx.sum())
+            self._y_abs += float(dy.sum())
+
+        self._f_prev = tuple(forward[:, -1].tolist())
+        if last_usable[-1] > 0 or self._side_prev is not None:
+            self._side_prev = tuple(side[:, -1].tolist())
+
+        return WandRotationBatch(id=id, ts_ms=ts_ms, x_delta=dx, y_delta=dy, nx=nx, ny=ny)
+
+    def _on_batch_per_sample(self, id: str, ts_ms: np.ndarray, f: np.ndarray) -> WandRotationBatch:
+        out = np.empty((len(f), 4), dtype=np.float64)
+
+        for idx, (fx, fy, fz) in enumerate(f.tolist()):
+            dx, dy, nx, ny = self._step(fx, fy, fz)
+            out[idx] = (dx, dy, math.nan if nx is None else nx, math.nan if ny is None else ny)
+
+        return WandRotationBatch(id=id, ts_ms=ts_ms, x_delta=out[:, 0], y_delta=out[:, 1], nx=out[:, 2], ny=out[:, 3])
+
+    def _step(self, fx: float, fy: float, fz: float) -> tuple[float, float, float | None, float | None]:
         f_now = normalize((fx, fy, fz))
 
         nx, ny = self._abs_norm_from_forward(f_now)
@@ -51,7 +158,7 @@ class ForwardGravityInterpreter:
         if self._f_prev is None:
             self._f_prev = f_now
             self._side_prev = self._get_side_axis(f_now, None)
-            return WandRotation(id, ts_ms, 0.0, 0.0, nx, ny)
+            return 0.0, 0.0, nx, ny
 
         cross_product = cross(self._f_prev, f_now)
         s = norm(cross_product)
@@ -63,7 +170,7 @@ class ForwardGravityInterpreter:
             side_now = self._get_side_axis(f_now, self._side_prev)
             if side_now is not None:
                 self._side_prev = side_now
-            return WandRotation(id, ts_ms, 0.0, 0.0, nx, ny)
+            return 0.0, 0.0, nx, ny
 
         axis = (cross_product[0] / s, cross_product[1] / s, cross_product[2] / s)
         omega = (axis[0] * angle, axis[1] * angle, axis[2] * angle)
@@ -105,7 +212,7 @@ class ForwardGravityInterpreter:
         if side_now is not None:
             self._side_prev = side_now
 
-        return WandRotation(id, ts_ms, dx, dy, nx, ny)
+        return dx, dy, nx, ny
 
     def _build_azimuth_basis(self) -> tuple[Vec3, Vec3]:
         # Build a stable horizontal reference basis orthogonal to world up.
@@ -165,3 +272,44 @@ class ForwardGravityInterpreter:
             ny = -ny
 
         return nx, ny
+
+    def _abs_norm_from_forward_columns(self, forward: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """_abs_norm_from_forward over the columns of a (3, n) array; discarded samples are NaN."""
+        settings = self._settings
+
+        # Summed in dot()'s order: asin is ill-conditioned near +-1, so a rounding apart matters when f is up.
+        u0, u1, u2 = self._u
+        up = forward[0] * u0 + forward[1] * u1 + forward[2] * u2
+        elevation = np.arcsin(np.minimum(np.maximum(up, -1.0), 1.0))
+
+        horiz = forward - self._u_array[:, None] * up
+        level = (horiz * horiz).sum(axis=0) >= settings.tiny_angle * settings.tiny_angle
+        # atan2 needs no normalised h: both of its arguments would be divided by the same magnitude.
+        az_y, az_x = self._azimuth_matrix @ horiz
+        azimuth = np.where(level, np.arctan2(az_y, az_x), 0.0)
+
+        yaw_lim = max(1e-6, math.radians(settings.abs_yaw_limit_deg))
+        pit_lim = max(1e-6, math.radians(settings.abs_pitch_limit_deg))
+
+        nx_raw = azimuth / yaw_lim
+        ny_raw = elevation / pit_lim
+
+        nx = np.minimum(np.maximum(nx_raw, -1.0), 1.0)
+        ny = np.minimum(np.maximum(ny_raw, -1.0), 1.0)
+
+        if settings.abs_invert_x:
+            nx = -nx
+        if settings.abs_invert_y:
+            ny = -ny
+
+        if settings.abs_clip_mode is ClipMode.DISCARD:
+            discarded = (np.abs(nx_raw) > 1.0) | (np.abs(ny_raw) > 1.0)
+            nx[discarded] = np.nan
+            ny[discarded] = np.nan
+
+        return nx, ny
+
+    @staticmethod
+    @functools.cache
+    def _column_index(count: int) -> np.ndarray:
+        return np.arange(count)
@@ -3,10 +3,13 @@ from __future__ import annotations
 
 import math
 
-from maths.utils import cross, dot, norm, normalize, ortho_normalize, rotate_axis_angle, wrap_pi
+import numpy as np
+
+from maths.utils import cross, dot, norm, normalize, ortho_normalize, rotate_axis_angle
 from maths.vec3 import Vec3
 from wand.interpreters.configuration.rmf_settings import ClipMode, RMFSettings
 from wand.wand_rotation import WandRotation
+from wand.wand_rotation_batch import WandRotationBatch
 
 
 # ── interpreter ─────────────────────────────────────────────────────────────
@@ -28,6 +31,9 @@ class YawPitchRMFInterpreter:
           Δy = dot(dθ, r_prev)   # up/down   in the view plane (previous frame)
     """
 
+    # Below this many samples a packet is cheaper to step through per sample than as a few NumPy calls.
+    BATCH_MIN_SAMPLES = 8
+
     def __init__(self, settings: RMFSettings = RMFSettings()):
         self._settings = settings
 
@@ -36,6 +42,15 @@ class YawPitchRMFInterpreter:
         self._r_prev: Vec3 | None = None
         self._v_prev: Vec3 | None = None
 
+        # Gesture canvas locked on the first sample
+        self._f_lock: Vec3 | None = None
+        self._r_lock: Vec3 | None = None
+        self._v_lock: Vec3 | None = None
+
+        # on_batch: f_lock x (.) and the (v_lock, r_lock) projection as matrices
+        self._lock_cross_matrix = np.zeros((3, 3))
+        self._lock_basis = np.zeros((2, 3))
+
         # Absolute accumulators (optional)
         self._x_abs = 0.0
         self._y_abs = 0.0
@@ -77,32 +92,16 @@ class YawPitchRMFInterpreter:
         self._f_prev, self._r_prev, self._v_prev = f0, r0, v0
         self._f_lock, self._r_lock, self._v_lock = f0, r0, v0
 
+        a0, a1, a2 = f0
+        self._lock_cross_matrix = np.array(((0.0, -a2, a1), (a2, 0.0, -a0), (-a1, a0, 0.0)))
+        self._lock_basis = np.array((v0, r0), dtype=np.float64)
+
     # ── main entry ──────────────────────────────────────────────────────────
 
     def on_sample(self, id: str, ts_ms: int, yaw_deg: float, pitch_deg: float) -> WandRotation:
         yaw = math.radians(yaw_deg) + self._yaw_offset
         pitch = math.radians(pitch_deg)
 
-        # --- absolute, bounded normalisation to [-1, 1] using symmetric limits ---
-        yaw_rel = wrap_pi(yaw)  # shortest-path yaw around ±π
-        yaw_lim = max(1e-6, math.radians(self._settings.abs_yaw_limit_deg))
-        pit_lim = max(1e-6, math.radians(self._settings.abs_pitch_limit_deg))
-
-        nx_raw = yaw_rel / yaw_lim
-        ny_raw = pitch / pit_lim
-
-        if self._settings.abs_clip_mode is ClipMode.DISCARD and (abs(nx_raw) > 1.0 or abs(ny_raw) > 1.0):
-            nx = ny = None
-        else:
-            nx = max(-1.0, min(1.0, nx_raw))
-            ny = max(-1.0, min(1.0, ny_raw))
-
-        # apply absolute preview inversions only (not delta inversions)
-        if nx and self._settings.abs_invert_x:
-            nx = -nx
-        if ny and self._settings.abs_invert_y:
-            ny = -ny
-
         f_now = normalize(self._forward_from_yawpitch(yaw, pitch))
 
         if self._f_prev is None:
@@ -127,7 +126,7 @@ class YawPitchRMFInterpreter:
         # New behaviour: express the incremental rotation in the fixed
         # "gesture canvas" defined at reset (f_lock, r_lock, v_lock),
         # instead of the moving local frame.
-        if hasattr(self, "_r_lock") and hasattr(self, "_v_lock") and self._r_lock is not None and self._v_lock is not None:
+        if self._r_lock is not None and self._v_lock is not None:
             basis_r = self._r_lock  # "up/down" axis in locked plane
             basis_v = self._v_lock  # "left/right" axis in locked plane
         else:
@@ -162,13 +161,164 @@ class YawPitchRMFInterpreter:
 
         return WandRotation(id, ts_ms, dx, dy, nx, ny)
 
+    def on_batch(self, id: str, ts_ms: np.ndarray, yaw_deg: np.ndarray, pitch_deg: np.ndarray) -> WandRotationBatch:
+        """
+        Interprets a packet of yaw/pitch samples (degrees), carrying the frame across batches like on_sample.
+
+        Deltas and absolute positions depend only on consecutive forward vectors and the locked canvas, so
+        they are computed for the whole packet at once with NumPy (matching on_sample to within float
+        rounding). Transporting the moving frame is path dependent, so it runs as a tight loop over the
+        packet's precomputed rotation axes, sines and cosines. Packets shorter than BATCH_MIN_SAMPLES are
+        stepped through per sample instead.
+        """
+        count = len(yaw_deg)
+        if count == 0 or count < self.BATCH_MIN_SAMPLES:
+            return self._on_batch_per_sample(id, ts_ms, yaw_deg, pitch_deg)
+
+        settings = self._settings
+        tiny = settings.tiny_angle
+
+        yaw = np.radians(np.asarray(yaw_deg, dtype=np.float64)) + self._yaw_offset
+        pitch = np.radians(np.asarray(pitch_deg, dtype=np.float64))
+        cos_pitch = np.cos(pitch)
+
+        # Columns are forward vectors, column 0 the one before the packet.
+        forward = np.empty((3, count + 1), dtype=np.float64)
+        now = forward[:, 1:]
+        now[0] = cos_pitch * np.cos(yaw)
+        now[1] = cos_pitch * np.sin(yaw)
+        now[2] = np.sin(pitch)
+        now /= np.sqrt((now * now).sum(axis=0))
+
+        locked_here = self._f_prev is None
+        if locked_here:
+            self.lock_frame_from_yawpitch(float(yaw_deg[0]), float(pitch_deg[0]))
+        forward[:, 0] = self._f_prev
+
+        nx, ny = self._abs_norm_from_locked_columns(now)
+
+        # --- minimal rotation between consecutive columns ---
+        rolled_1 = forward[[1, 2, 0]]
+        rolled_2 = forward[[2, 0, 1]]
+        cross_product = rolled_1[:, :-1] * rolled_2[:, 1:] - rolled_2[:, :-1] * rolled_1[:, 1:]
+        s = np.sqrt((cross_product * cross_product).sum(axis=0))
+        c = np.minimum(np.maximum((forward[:, :-1] * now).sum(axis=0), -1.0), 1.0)
+        angle = np.arctan2(s, c)
+        moving = (angle >= tiny) & (s >= tiny)
+        if locked_here:
+            # The frame was locked on the first sample, which is its own predecessor: zero delta, as on_sample.
+            moving[0] = False
+
+        # dtheta = (cross / s) * angle, expressed in the locked canvas (v_lock, r_lock)
+        scale = np.where(moving, angle, 0.0) / np.maximum(s, tiny)
+        dx, dy = self._lock_basis @ (cross_product * scale)
+
+        if settings.deadzone_x > 0.0:
+            dx[np.abs(dx) < settings.deadzone_x] = 0.0
+        if settings.deadzone_y > 0.0:
+            dy[np.abs(dy) < settings.deadzone_y] = 0.0
+
+        gain_x = -settings.gain_x if settings.invert_x else settings.gain_x
+        gain_y = -settings.gain_y if settings.invert_y else settings.gain_y
+        if gain_x != 1.0:
+            dx *= gain_x
+        if gain_y != 1.0:
+            dy *= gain_y
+
+        if settings.keep_absolute:
+            self._x_abs += float(dx.sum())
+            self._y_abs += float(dy.sum())
+
+        steps = np.flatnonzero(moving)
+        if len(steps):
+            self._transport_frame(cross_product[:, steps] / s[steps], angle[steps], now[:, steps])
+        self._f_prev = tuple(now[:, -1].tolist())
+
+        return WandRotationBatch(id=id, ts_ms=ts_ms, x_delta=dx, y_delta=dy, nx=nx, ny=ny)
+
     # ── internals ───────────────────────────────────────────────────────────
+    def _on_batch_per_sample(self, id: str, ts_ms: np.ndarray, yaw_deg: np.ndarray, pitch_deg: np.ndarray) -> WandRotationBatch:
+        out = np.empty((len(yaw_deg), 4), dtype=np.float64)
+
+        for idx, (ts, yaw, pitch) in enumerate(
+            zip(np.asarray(ts_ms).tolist(), np.asarray(yaw_deg).tolist(), np.asarray(pitch_deg).tolist())
+        ):
+            rotation = self.on_sample(id, ts, yaw, pitch)
+            nx = math.nan if rotation.nx is None else rotation.nx
+            ny = math.nan if rotation.ny is None else rotation.ny
+            out[idx] = (rotation.x_delta, rotation.y_delta, nx, ny)
+
+        return WandRotationBatch(id=id, ts_ms=ts_ms, x_delta=out[:, 0], y_delta=out[:, 1], nx=out[:, 2], ny=out[:, 3])
+
+    def _transport_frame(self, axes: np.ndarray, angles: np.ndarray, forwards: np.ndarray) -> None:
+        """
+        Parallel transport of r through the packet's rotations, each followed by Gram-Schmidt against its
+        forward vector (rotate_axis_angle then ortho_normalize, inlined over plain floats).
+        """
+        rx, ry, rz = self._r_prev
+        fx = fy = fz = 0.0
+
+        for (ax, ay, az), ca, sa, (fx, fy, fz) in zip(
+            axes.T.tolist(), np.cos(angles).tolist(), np.sin(angles).tolist(), forwards.T.tolist()
+        ):
+            k = (ax * rx + ay * ry + az * rz) * (1.0 - ca)
+            rx, ry, rz = (
+                rx * ca + (ay * rz - az * ry) * sa + ax * k,
+                ry * ca + (az * rx - ax * rz) * sa + ay * k,
+                rz * ca + (ax * ry - ay * rx) * sa + az * k,
+            )
+
+            d = fx * rx + fy * ry + fz * rz
+            rx, ry, rz = rx - fx * d, ry - fy * d, rz - fz * d
+            n = math.sqrt(rx * rx + ry * ry + rz * rz)
+            rx, ry, rz = (rx / n, ry / n, rz / n) if n > 0.0 else (0.0, 0.0, 0.0)
+
+        self._r_prev = (rx, ry, rz)
+        self._v_prev = (fy * rz - fz * ry, fz * rx - fx * rz, fx * ry - fy * rx)
+
     def _forward_from_yawpitch(self, yaw: float, pitch: float) -> Vec3:
         cy, sy = math.cos(yaw), math.sin(yaw)
         cp, sp = math.cos(pitch), math.sin(pitch)
         # Standard "no-roll" forward for Z(yaw) then Y(pitch)
         return normalize((cp * cy, cp * sy, sp))
 
+    def _abs_norm_from_locked_columns(self, forward: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """_abs_norm_from_locked over the columns of a (3, n) array; discarded samples are NaN."""
+        settings = self._settings
+
+        cross_product = self._lock_cross_matrix @ forward
+        s = np.sqrt((cross_product * cross_product).sum(axis=0))
+        c = np.minimum(np.maximum(np.array(self._f_lock) @ forward, -1.0), 1.0)
+        angle = np.arctan2(s, c)
+
+        ox, oy = self._lock_basis @ (cross_product * (angle / np.maximum(s, settings.tiny_angle)))
+
+        # Axis is ambiguous at 0 or 180°; the stable fallback is r_lock
+        ambiguous = s < settings.tiny_angle
+        if ambiguous.any():
+            ox[ambiguous] = dot(self._r_lock, self._v_lock) * angle[ambiguous]
+            oy[ambiguous] = dot(self._r_lock, self._r_lock) * angle[ambiguous]
+
+        yaw_lim = max(1e-6, math.radians(settings.abs_yaw_limit_deg))
+        pit_lim = max(1e-6, math.radians(settings.abs_pitch_limit_deg))
+        nx_raw = ox / yaw_lim
+        ny_raw = oy / pit_lim
+
+        nx = np.minimum(np.maximum(nx_raw, -1.0), 1.0)
+        ny = np.minimum(np.maximum(ny_raw, -1.0), 1.0)
+
+        if settings.abs_invert_x:
+            nx = -nx
+        if settings.abs_invert_y:
+            ny = -ny
+
+        if settings.abs_clip_mode is ClipMode.DISCARD:
+            discarded = (np.abs(nx_raw) > 1.0) | (np.abs(ny_raw) > 1.0)
+            nx[discarded] = np.nan
+            ny[discarded] = np.nan
+
+        return nx, ny
+
     def _abs_norm_from_locked(self, f_now: Vec3) -> tuple[float | None, float | None]:
         """
         Map minimal rotation f_lock -> f_now to view-plane components:
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+
+@dataclass
+class LatencyHistogram:
+    """Latencies in fixed buckets: counts[i] holds values up to BOUNDS_MS[i], the last bucket everything above."""
+
+    BOUNDS_MS: ClassVar[tuple[float, ...]] = (1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0, 500.0, 1000.0)
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LatencyHistogram.BOUNDS_MS) + 1))
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def add(self, ms: float) -> None:
+        self.counts[bisect_left(self.BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile_ms(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given fraction of values (capped at the largest value seen)."""
+        if not self.count:
+            return 0.0
+
+        target = fraction * self.count
+        seen = 0
+        for i, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= target:
+                return min(self.BOUNDS_MS[i], self.max_ms) if i < len(self.BOUNDS_MS) else self.max_ms
+
+        return self.max_ms
+
+    def reset(self) -> None:
+        self.counts = [0] * len(self.counts)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def __str__(self) -> str:
+        return f"p50={self.percentile_ms(0.5):.0f} p95={self.percentile_ms(0.95):.0f} max={self.max_ms:.1f}ms"
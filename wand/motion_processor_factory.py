@@ -1,13 +1,18 @@
 from logging import Logger
 
 from motion.configuration.motion_processor_settings import MotionProcessorSettings
+from motion.motion_engine import MotionEngine
+from motion.motion_engine_slot import MotionEngineSlot
 from motion.motion_processor import MotionProcessor
 
 
 class MotionProcessorFactory:
-    def __init__(self, logger: Logger, settings: MotionProcessorSettings) -> None:
+    def __init__(self, logger: Logger, settings: MotionProcessorSettings, motion_engine: MotionEngine | None = None) -> None:
+        self._motion_engine = motion_engine
         self._logger = logger
         self._settings = settings
 
-    def create(self) -> MotionProcessor:
+    def create(self) -> MotionProcessor | MotionEngineSlot:
+        if self._motion_engine is not None:
+            return self._motion_engine.create()
         return MotionProcessor(self._settings)
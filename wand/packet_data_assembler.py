@@ -1,45 +1,50 @@
 from gamevolt.logging import Logger
 from wand.data.assembled_packet import AssembledPacket
 from wand.data.data_line import DataLine
+from wand.data.gated_header import GatedHeader
+from wand.data.wand_protocol_parser import WandProtocolParser
 from wand.packet_header import PacketHeader
+from wand.pending_header_queue import PendingHeaderQueue
 
 
 class PktDataAssembler:
     """
-    Stores PKT headers by seq, then pops them when DATA arrives.
+    Stores PKT headers by (tag, seq), then pops the one a DATA line belongs to when it arrives.
+    DATA lines carry no tag, so wands sharing a seq are told apart by sample count (see PendingHeaderQueue.pop_seq).
+    Headers of gated wands are held as GatedHeader, so their DATA lines pair with them rather than with another wand's.
     Prunes stale headers by TTL.
     """
 
     def __init__(self, logger: Logger, header_ttl_s: float) -> None:
         self._logger = logger
-        self._header_ttl_s = float(header_ttl_s)
-        self._pending: dict[int, PacketHeader] = {}
+        self._pending: PendingHeaderQueue[PacketHeader | GatedHeader] = PendingHeaderQueue(ttl_s=header_ttl_s)
 
     @property
     def pending_count(self) -> int:
         return len(self._pending)
 
     def on_header(self, header: PacketHeader) -> None:
-        if header.seq in self._pending:
-            old = self._pending[header.seq]
+        old = self._pending.put(header.tag_hex, header.seq, header.nsamp, header.received_monotonic, header)
+        if old is not None:
             self._logger.trace(
-                f"PKT seq overwrite: seq={header.seq} "
+                f"PKT overwrite: tag={header.tag_hex} seq={header.seq} "
                 f"old=(t0={old.t0_ms} dt_us={old.sample_dt_us} tag={old.tag_hex} nsamp={old.nsamp} fmt={old.fmt} "
                 f"age_s={(header.received_monotonic - old.received_monotonic):.3f}) "
                 f"new=(t0={header.t0_ms} dt_us={header.sample_dt_us} tag={header.tag_hex} nsamp={header.nsamp} fmt={header.fmt})"
             )
 
-        self._pending[header.seq] = header
-
         self._logger.trace(
             f"PKT: seq={header.seq} tag={header.tag_hex} t0={header.t0_ms} dt_us={header.sample_dt_us} "
             f"nsamp={header.nsamp} fmt={header.fmt} pending_headers={len(self._pending)}"
         )
 
-    def on_data(self, data: DataLine, now: float) -> AssembledPacket | None:
-        header = self._pending.pop(data.seq, None)
-        if header is None:
-            return None
+    def on_gated_header(self, tag_hex: str, seq: int, nsamp: int, now: float) -> None:
+        self._pending.put(tag_hex, seq, nsamp, now, GatedHeader(tag_hex))
+
+    def on_data(self, data: DataLine, now: float) -> AssembledPacket | GatedHeader | None:
+        header = self._pending.pop_seq(data.seq, lambda: WandProtocolParser.count_samples(data.data_str))
+        if header is None or isinstance(header, GatedHeader):
+            return header
 
         age_s = now - header.received_monotonic
         return AssembledPacket(
@@ -51,14 +56,8 @@ class PktDataAssembler:
             fmt=header.fmt,
             data_str=data.data_str,
             header_age_s=age_s,
+            t_rx_ms=header.t_rx_ms,
         )
 
-    def prune(self, now: float) -> list[int]:
-        if not self._pending:
-            return []
-
-        ttl = self._header_ttl_s
-        expired = [seq for seq, hdr in self._pending.items() if (now - hdr.received_monotonic) > ttl]
-        for seq in expired:
-            self._pending.pop(seq, None)
-        return expired
+    def prune(self, now: float) -> list[tuple[str, int]]:
+        return self._pending.prune(now)
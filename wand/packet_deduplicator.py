@@ -0,0 +1,43 @@
+from collections import OrderedDict
+
+
+class PacketDeduplicator:
+    """
+    Remembers recently seen (tag, seq, t0) packets so copies relayed by other anchors can be dropped.
+
+    Entries expire after window_s and the cache never holds more than max_entries;
+    both are evicted oldest first, so each call only touches what it evicts.
+    A window of zero or less disables de-duplication.
+    """
+
+    def __init__(self, window_s: float, max_entries: int) -> None:
+        self._window_s = float(window_s)
+        self._max_entries = max(1, int(max_entries))
+        self._seen: OrderedDict[tuple[str, int, int], float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def is_duplicate(self, tag_hex: str, seq: int, t0_ms: int, now: float) -> bool:
+        if self._window_s <= 0.0:
+            return False
+
+        seen = self._seen
+        while seen:
+            first_seen = next(iter(seen.values()))
+            if (now - first_seen) <= self._window_s:
+                break
+            seen.popitem(last=False)
+
+        key = (tag_hex, seq, t0_ms)
+        if key in seen:
+            return True
+
+        seen[key] = now
+        if len(seen) > self._max_entries:
+            seen.popitem(last=False)
+
+        return False
+
+    def clear(self) -> None:
+        self._seen.clear()
@@ -10,3 +10,6 @@ class PacketHeader:
     nsamp: int
     fmt: str
     received_monotonic: float
+
+    # anchor's own receive clock (ms); 0 when unknown
+    t_rx_ms: int = 0
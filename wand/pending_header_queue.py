@@ -0,0 +1,107 @@
+from collections import OrderedDict, deque
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class PendingHeaderQueue(Generic[T]):
+    """
+    PKT headers awaiting their DATA line, keyed by (tag, seq) and kept in arrival order.
+
+    DATA lines carry a seq but no tag, so two wands with the same seq pending cannot be told apart by it;
+    pop_seq then falls back on the sample count (see there). Headers arrive with monotonic timestamps,
+    so the expired ones are always a prefix and pruning only touches those.
+    """
+
+    def __init__(self, ttl_s: float) -> None:
+        self._ttl_s = float(ttl_s)
+        self._items: OrderedDict[tuple[str, int], tuple[float, int, T]] = OrderedDict()
+        self._tags_by_seq: dict[int, deque[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, tag: str, seq: int, nsamp: int, received_monotonic: float, item: T) -> T | None:
+        """Adds a header, returning the one it replaced for the same (tag, seq), if any."""
+        key = (tag, seq)
+        replaced = self._items.pop(key, None)
+
+        tags = self._tags_by_seq.get(seq)
+        if tags is None:
+            tags = self._tags_by_seq[seq] = deque()
+        elif replaced is not None:
+            tags.remove(tag)
+
+        self._items[key] = (received_monotonic, nsamp, item)
+        tags.append(tag)
+
+        return None if replaced is None else replaced[2]
+
+    def has_seq(self, seq: int) -> bool:
+        return seq in self._tags_by_seq
+
+    def pop_seq(self, seq: int, sample_count: Callable[[], int]) -> T | None:
+        """
+        Pops the header a DATA line with this seq belongs to.
+
+        With one header pending for the seq, that is the one. With several (wands sharing a seq), only the
+        header whose nsamp equals the DATA line's sample_count() is taken. If none matches, the DATA line
+        is dropped; if several do, so are they, rather than decoding one wand's samples as another's.
+        """
+        tags = self._tags_by_seq.get(seq)
+        if tags is None:
+            return None
+
+        if len(tags) == 1:
+            tag = tags.popleft()
+        else:
+            nsamp = sample_count()
+            matches = [tag for tag in tags if self._items[(tag, seq)][1] == nsamp]
+            if len(matches) > 1:
+                for tag in matches:
+                    self._items.pop((tag, seq))
+                    tags.remove(tag)
+                if not tags:
+                    del self._tags_by_seq[seq]
+            if len(matches) != 1:
+                return None
+
+            tag = matches[0]
+            tags.remove(tag)
+
+        if not tags:
+            del self._tags_by_seq[seq]
+
+        return self._items.pop((tag, seq))[2]
+
+    def prune(self, now: float) -> list[tuple[str, int]]:
+        """Drops headers older than the TTL and returns their (tag, seq) keys."""
+        expired: list[tuple[str, int]] = []
+
+        while self._items:
+            key, (received_monotonic, _, _) = next(iter(self._items.items()))
+            if (now - received_monotonic) <= self._ttl_s:
+                break
+
+            self._items.popitem(last=False)
+            self._forget(key)
+            expired.append(key)
+
+        return expired
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._tags_by_seq.clear()
+
+    def _forget(self, key: tuple[str, int]) -> None:
+        tag, seq = key
+        tags = self._tags_by_seq[seq]
+
+        # Oldest first per seq as well, so this is almost always the left end.
+        if tags[0] == tag:
+            tags.popleft()
+        else:
+            tags.remove(tag)
+
+        if not tags:
+            del self._tags_by_seq[seq]
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import queue
+from typing import Callable
+
+from gamevolt.events.event import Event
+from gamevolt.logging import Logger
+from gamevolt.serial.frame_receiver_protocol import FrameReceiverProtocol
+from gamevolt.serial.line_receiver_protocol import LineReceiverProtocol
+from motion.motion_phase_type import MotionPhaseType
+from spells.spell_type import SpellType
+from wand.configuration.input_settings import InputSettings
+from wand.configuration.wand_server_settings import WandServerSettings
+from wand.sharding.sharded_wand import ShardedWand
+from wand.sharding.wand_shard_message_type import WandShardMessageType
+from wand.sharding.wand_shard_pool import WandShardPool
+from wand.sharding.wand_shard_router import WandShardRouter
+from wand.wand_device_controller import WandDeviceController
+from wand.wand_rotation import WandRotation
+from zones.zone import Zone
+from zones.zone_manager_protocol import ZoneManagerProtocol
+
+
+class ShardedTrackedWandManager:
+    """
+    Drop-in for TrackedWandManager that runs the wand pipelines in `sharding.shard_count` worker processes.
+
+    Incoming lines and frames are routed by wand tag (see WandShardRouter.assign_shards), so each wand always
+    lives in the same worker. Zone, device and show logic stay in this process: zone changes are forwarded
+    to the owning worker, and spell casts, motion phases and device commands come back from it. The workers
+    belong to a WandShardPool, which is started before the rest of the application.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        server_settings: WandServerSettings,
+        settings: InputSettings,
+        shard_pool: WandShardPool,
+        line_receiver: LineReceiverProtocol,
+        frame_receiver: FrameReceiverProtocol | None,
+        zone_manager: ZoneManagerProtocol,
+        wand_device_controller: WandDeviceController,
+    ) -> None:
+        self.wand_motion_changed: Event[Callable[[MotionPhaseType], None]] = Event()
+        self.wand_rotation_updated: Event[Callable[[WandRotation], None]] = Event()
+        self.spell_cast: Event[Callable[[ShardedWand, Zone, SpellType], None]] = Event()
+
+        self._wand_device_controller = wand_device_controller
+        self._server_settings = server_settings
+        self._line_receiver = line_receiver
+        self._frame_receiver = frame_receiver
+        self._zone_manager = zone_manager
+        self._shard_pool = shard_pool
+        self._settings = settings
+        self._logger = logger
+
+        self._wands: dict[str, ShardedWand] = {}
+        self._router: WandShardRouter | None = None
+
+    def start(self) -> None:
+        for id in self._settings.tracked_wands.ids:
+            self._wands[id] = ShardedWand(id)
+
+        self._router = WandShardRouter(
+            logger=self._logger,
+            settings=self._server_settings,
+            line_receiver=self._line_receiver,
+            frame_receiver=self._frame_receiver,
+            shard_by_tag=self._shard_pool.shard_by_tag,
+            inboxes=self._shard_pool.inboxes,
+        )
+        self._router.start()
+
+        self._zone_manager.zone_entered.subscribe(self._on_zone_entered)
+        self._zone_manager.zone_exited.subscribe(self._on_zone_exited)
+
+    def stop(self) -> None:
+        self._zone_manager.zone_entered.unsubscribe(self._on_zone_entered)
+        self._zone_manager.zone_exited.unsubscribe(self._on_zone_exited)
+
+        if self._router is not None:
+            self._router.stop()
+            self._router = None
+
+        self._receive()
+        self._wands.clear()
+
+    def update(self) -> None:
+        if self._router is not None:
+            self._router.update()
+
+        self._receive()
+        self._shard_pool.check_processes()
+
+    def tracked_wands(self) -> list[ShardedWand]:
+        return list(self._wands.values())
+
+    def reset_wand_forwards(self) -> None:
+        for index in range(len(self._shard_pool.inboxes)):
+            self._shard_pool.send(index, (WandShardMessageType.RESET_FORWARDS,))
+
+    def _receive(self) -> None:
+        outbox = self._shard_pool.outbox
+        if outbox is None:
+            return
+
+        while True:
+            try:
+                messages = outbox.get_nowait()
+            except queue.Empty:
+                return
+
+            for message in messages:
+                self._handle(message)
+
+    def _handle(self, message: tuple) -> None:
+        message_type, *args = message
+
+        if message_type is WandShardMessageType.SPELL_CAST:
+            self._on_spell_cast(*args)
+        elif message_type is WandShardMessageType.MOTION_CHANGED:
+            self._on_motion_changed(*args)
+        elif message_type is WandShardMessageType.DEVICE_COMMAND:
+            command, command_args = args
+            getattr(self._wand_device_controller, command)(*command_args)
+        else:
+            self._logger.warning(f"Ignoring unexpected wand shard message '{message_type}'.")
+
+    def _on_zone_entered(self, zone: Zone, wand_id: str) -> None:
+        self._shard_pool.send(
+            self._shard_pool.shard_of(wand_id),
+            (WandShardMessageType.ZONE_ENTERED, zone.id, zone.spell_types, wand_id),
+        )
+
+    def _on_zone_exited(self, zone: Zone, wand_id: str) -> None:
+        self._shard_pool.send(
+            self._shard_pool.shard_of(wand_id),
+            (WandShardMessageType.ZONE_EXITED, zone.id, wand_id),
+        )
+
+    def _on_spell_cast(self, wand_id: str, spell_type: SpellType) -> None:
+        wand = self._wands.get(wand_id) or ShardedWand(wand_id)
+        zone = self._zone_manager.get_zone_containing_wand_id(wand_id)
+
+        self._logger.debug(f"Wand ({wand_id}) cast '{spell_type.name}'!")
+        self.spell_cast.invoke(wand, zone, spell_type)
+
+    def _on_motion_changed(self, wand_id: str, motion_phase: MotionPhaseType) -> None:
+        wand = self._wands.get(wand_id)
+        if wand is not None:
+            wand.on_motion_changed(motion_phase)
+
+        self.wand_motion_changed.invoke(motion_phase)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from gamevolt.events.event import Event
+from motion.motion_phase_type import MotionPhaseType
+from wand.wand_rotation import WandRotation
+
+
+class ShardedWand:
+    """
+    Main process view of a wand running in a shard worker.
+
+    Rotations never leave the worker, so rotation_updated and forward_reset only exist for callers
+    written against TrackedWand and are never raised.
+    """
+
+    def __init__(self, id: str) -> None:
+        self.motion_changed: Event[Callable[[MotionPhaseType], None]] = Event()
+        self.rotation_updated: Event[Callable[[WandRotation], None]] = Event()
+        self.forward_reset: Event[Callable[[], None]] = Event()
+
+        self._id = id
+        self._motion_phase = MotionPhaseType.NONE
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def motion_phase(self) -> MotionPhaseType:
+        return self._motion_phase
+
+    def on_motion_changed(self, motion_phase: MotionPhaseType) -> None:
+        self._motion_phase = motion_phase
+        self.motion_changed.invoke(motion_phase)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from wand.sharding.wand_shard_message_type import WandShardMessageType
+from wand.wand_device_controller import WandDeviceController
+
+
+class WandShardDeviceController(WandDeviceController):
+    """Stands in for the device controller inside a shard; each command is posted back to the main process."""
+
+    def __init__(self, post: Callable[[tuple], None]) -> None:
+        self._post = post
+
+    def blast_wand_active(self, wand_id: str) -> None:
+        self._send("blast_wand_active", wand_id)
+
+    def blast_wand_inactive(self, wand_id: str) -> None:
+        self._send("blast_wand_inactive", wand_id)
+
+    def set_wand_active(self, wand_id: str) -> None:
+        self._send("set_wand_active", wand_id)
+
+    def set_wand_inactive(self, wand_id: str) -> None:
+        self._send("set_wand_inactive", wand_id)
+
+    def play_spell_cast_cue(self, wand_id: str, has_sufficient_level: bool) -> None:
+        self._send("play_spell_cast_cue", wand_id, has_sufficient_level)
+
+    def play_active_reminder_cue(self, wand_id: str) -> None:
+        self._send("play_active_reminder_cue", wand_id)
+
+    def _send(self, command: str, *args) -> None:
+        self._post((WandShardMessageType.DEVICE_COMMAND, command, args))
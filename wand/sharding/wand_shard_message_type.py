@@ -0,0 +1,15 @@
+from enum import Enum, auto
+
+
+class WandShardMessageType(Enum):
+    # main -> worker
+    DATA = auto()
+    ZONE_ENTERED = auto()
+    ZONE_EXITED = auto()
+    RESET_FORWARDS = auto()
+    STOP = auto()
+
+    # worker -> main
+    SPELL_CAST = auto()
+    MOTION_CHANGED = auto()
+    DEVICE_COMMAND = auto()
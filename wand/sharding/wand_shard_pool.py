@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import multiprocessing
+import queue
+from dataclasses import replace
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue
+
+from gamevolt.logging import Logger
+from gamevolt.logging.configuration.logging_settings import LoggingSettings
+from motion.configuration.motion_settings import MotionSettings
+from spells.accuracy.configuration.accuracy_scorer_settings import SpellAccuracyScorerSettings
+from wand.configuration.input_settings import InputSettings
+from wand.configuration.wand_server_settings import WandServerSettings
+from wand.sharding.wand_shard_message_type import WandShardMessageType
+from wand.sharding.wand_shard_router import WandShardRouter
+from wand.sharding.wand_shard_worker import WandShardWorkerConfig, run_wand_shard_worker
+
+
+class WandShardPool:
+    """
+    The worker processes of the sharded pipeline and the queues to and from them.
+
+    Workers are forked where the platform allows, so start the pool before this process opens sockets,
+    starts threads, creates windows or runs an event loop: a fork inherits all of those. Everything a
+    worker needs comes from settings, so nothing else has to exist yet.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        logging_settings: LoggingSettings,
+        server_settings: WandServerSettings,
+        settings: InputSettings,
+        motion_settings: MotionSettings,
+        accuracy_settings: SpellAccuracyScorerSettings,
+    ) -> None:
+        self._logging_settings = logging_settings
+        self._accuracy_settings = accuracy_settings
+        self._server_settings = server_settings
+        self._motion_settings = motion_settings
+        self._settings = settings
+        self._logger = logger
+
+        self._shard_count = max(1, settings.sharding.shard_count)
+        # wands_main builds the whole application at import time, which spawn would repeat in every worker.
+        start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        self._context = multiprocessing.get_context(start_method)
+
+        self._shard_by_tag = WandShardRouter.assign_shards(settings.tracked_wands.ids, self._shard_count)
+
+        self._processes: list[BaseProcess] = []
+        self._inboxes: list[Queue] = []
+        self._outbox: Queue | None = None
+        self._exited_shards: set[int] = set()
+
+    @property
+    def shard_by_tag(self) -> dict[str, int]:
+        return self._shard_by_tag
+
+    @property
+    def inboxes(self) -> list[Queue]:
+        return self._inboxes
+
+    @property
+    def outbox(self) -> Queue | None:
+        return self._outbox
+
+    def shard_of(self, wand_id: str) -> int:
+        index = self._shard_by_tag.get(wand_id.upper())
+        return WandShardRouter.shard_index(wand_id, self._shard_count) if index is None else index
+
+    def start(self) -> None:
+        ids_by_shard: list[list[str]] = [[] for _ in range(self._shard_count)]
+        for id in self._settings.tracked_wands.ids:
+            ids_by_shard[self.shard_of(id)].append(id)
+
+        self._outbox = self._context.Queue()
+        for index, ids in enumerate(ids_by_shard):
+            inbox = self._context.Queue(maxsize=self._settings.sharding.queue_max_batches)
+            process = self._context.Process(
+                target=run_wand_shard_worker,
+                args=(self._create_worker_config(index, ids), inbox, self._outbox),
+                name=f"wand-shard-{index}",
+                daemon=True,
+            )
+            process.start()
+
+            self._inboxes.append(inbox)
+            self._processes.append(process)
+            self._logger.info(f"Wand shard ({index}) started (pid {process.pid}) for wands {ids}.")
+
+    def stop(self) -> None:
+        """Stops the workers and closes the queues; anything still in the outbox is dropped."""
+        for index in range(len(self._inboxes)):
+            self.send(index, (WandShardMessageType.STOP,))
+
+        timeout_s = self._settings.sharding.stop_timeout_s
+        for index, process in enumerate(self._processes):
+            process.join(timeout_s)
+            if process.is_alive():
+                self._logger.warning(f"Wand shard ({index}) did not stop within {timeout_s}s; terminating.")
+                process.terminate()
+                process.join()
+
+        for inbox in self._inboxes:
+            inbox.cancel_join_thread()
+            inbox.close()
+        if self._outbox is not None:
+            self._outbox.cancel_join_thread()
+            self._outbox.close()
+
+        self._processes.clear()
+        self._inboxes.clear()
+        self._outbox = None
+        self._exited_shards.clear()
+
+    def send(self, index: int, message: tuple) -> None:
+        try:
+            self._inboxes[index].put(message, timeout=self._settings.sharding.stop_timeout_s)
+        except queue.Full:
+            self._logger.warning(f"Wand shard ({index}) inbox full; dropped '{message[0].name}'.")
+
+    def check_processes(self) -> None:
+        for index, process in enumerate(self._processes):
+            if index in self._exited_shards or process.exitcode is None:
+                continue
+
+            self._exited_shards.add(index)
+            self._logger.error(f"Wand shard ({index}) exited unexpectedly (exit code {process.exitcode}).")
+
+    def _create_worker_config(self, index: int, ids: list[str]) -> WandShardWorkerConfig:
+        return WandShardWorkerConfig(
+            index=index,
+            logging=self._logging_settings,
+            server=self._server_settings,
+            input=replace(self._settings, tracked_wands=replace(self._settings.tracked_wands, ids=ids)),
+            motion=self._motion_settings,
+            accuracy=self._accuracy_settings,
+        )
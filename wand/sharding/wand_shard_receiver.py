@@ -0,0 +1,32 @@
+from typing import Callable, Sequence
+
+from gamevolt.events.event import Event
+from gamevolt.serial.frame_receiver_protocol import FrameReceiverProtocol
+from gamevolt.serial.line_receiver_protocol import LineReceiverProtocol
+
+
+class WandShardReceiver(LineReceiverProtocol, FrameReceiverProtocol):
+    """Replays the lines and frames routed to a shard as if they came straight off the web socket."""
+
+    def __init__(self) -> None:
+        self._line_received: Event[Callable[[str], None]] = Event()
+        self._frame_received: Event[Callable[[bytes], None]] = Event()
+
+    @property
+    def line_received(self) -> Event[Callable[[str], None]]:
+        return self._line_received
+
+    @property
+    def frame_received(self) -> Event[Callable[[bytes], None]]:
+        return self._frame_received
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    def receive(self, items: Sequence[str | bytes]) -> None:
+        for item in items:
+            if isinstance(item, bytes):
+                self._frame_received.invoke(item)
+            else:
+                self._line_received.invoke(item)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import queue
+import time
+import zlib
+from dataclasses import dataclass
+from multiprocessing.queues import Queue
+
+from gamevolt.logging import Logger
+from gamevolt.serial.frame_receiver_protocol import FrameReceiverProtocol
+from gamevolt.serial.line_receiver_protocol import LineReceiverProtocol
+from wand.configuration.wand_server_settings import WandServerSettings
+from wand.data.wand_binary_codec import WandBinaryCodec
+from wand.data.wand_protocol_parser import WandProtocolParser
+from wand.pending_header_queue import PendingHeaderQueue
+from wand.sharding.wand_shard_message_type import WandShardMessageType
+from wand.sharding.wand_shard_router_stats import WandShardRouterStats
+
+
+@dataclass
+class PendingShardPacket:
+    tag_hex: str
+    raw_header_line: str
+
+
+class WandShardRouter:
+    """
+    Front end of the sharded pipeline: reads only enough of each line or frame to learn the wand tag
+    and forwards it untouched to the worker that owns that tag.
+
+    PKT/DATA pairs are joined here, as DATA lines carry no tag, and travel on as single PKTD lines.
+    Everything routed during a tick is sent to each worker as one batch.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        settings: WandServerSettings,
+        line_receiver: LineReceiverProtocol,
+        frame_receiver: FrameReceiverProtocol | None,
+        shard_by_tag: dict[str, int],
+        inboxes: list[Queue],
+    ) -> None:
+        self._line_receiver = line_receiver
+        self._frame_receiver = frame_receiver
+        self._shard_by_tag = shard_by_tag
+        self._inboxes = inboxes
+        self._settings = settings
+        self._logger = logger
+
+        self._parser = WandProtocolParser()
+        self._codec = WandBinaryCodec()
+        self._pending: PendingHeaderQueue[PendingShardPacket] = PendingHeaderQueue(ttl_s=settings.header_ttl_s)
+
+        self._outgoing: list[list[str | bytes]] = [[] for _ in inboxes]
+        self._stats = WandShardRouterStats(last_log_monotonic=time.monotonic(), log_interval_s=2.0)
+
+    @staticmethod
+    def assign_shards(ids: list[str], shard_count: int) -> dict[str, int]:
+        """Deals configured wands out round-robin in sorted order: balanced, and the same config always gives the same map."""
+        return {id.upper(): index % shard_count for index, id in enumerate(sorted(id.upper() for id in ids))}
+
+    @staticmethod
+    def shard_index(tag_hex: str, shard_count: int) -> int:
+        """Fallback for tags outside the configured wands; stable across processes and restarts, unlike hash()."""
+        return zlib.crc32(tag_hex.upper().encode("ascii", errors="ignore")) % shard_count
+
+    def start(self) -> None:
+        self._line_receiver.line_received.subscribe(self._on_line)
+        if self._frame_receiver is not None:
+            self._frame_receiver.frame_received.subscribe(self._on_frame)
+
+    def stop(self) -> None:
+        self._line_receiver.line_received.unsubscribe(self._on_line)
+        if self._frame_receiver is not None:
+            self._frame_receiver.frame_received.unsubscribe(self._on_frame)
+
+        self._pending.clear()
+        for outgoing in self._outgoing:
+            outgoing.clear()
+
+    def update(self) -> None:
+        now = time.monotonic()
+        self._stats.headers_expired += len(self._pending.prune(now))
+
+        self.flush()
+        self._stats.maybe_log(self._logger, now, pending_headers=len(self._pending))
+
+    def flush(self) -> None:
+        for index, outgoing in enumerate(self._outgoing):
+            if not outgoing:
+                continue
+
+            try:
+                self._inboxes[index].put_nowait((WandShardMessageType.DATA, outgoing))
+            except queue.Full:
+                self._stats.items_dropped += len(outgoing)
+                self._logger.debug(f"Wand shard ({index}) inbox full; dropped {len(outgoing)} items.")
+
+            self._outgoing[index] = []
+
+    def _on_line(self, line: str) -> None:
+        line = line.strip()
+        if not line:
+            return
+
+        # Only the tag (and seq, for pairing) is peeked here; the owning worker runs the full parse.
+        if line.startswith("PKTD"):
+            tag = self._parser.peek_field(line, "tag=")
+            if tag:
+                self._route(tag.upper(), line)
+                return
+
+        elif line.startswith("PKT"):
+            tag = self._parser.peek_field(line, "tag=")
+            seq = self._parser.peek_field(line, "seq=")
+            nsamp = self._parser.peek_field(line, "nsamp=")
+            if tag and seq and seq.isdigit() and nsamp and nsamp.isdigit():
+                tag = tag.upper()
+                self._pending.put(tag, int(seq), int(nsamp), time.monotonic(), PendingShardPacket(tag, line))
+                return
+
+        elif line.startswith("DATA"):
+            seq = self._parser.peek_field(line, "seq=")
+            data_str = self._parser.peek_data(line)
+            if seq and seq.isdigit() and data_str is not None:
+                pending = self._pending.pop_seq(int(seq), lambda: self._parser.count_samples(data_str))
+                if pending is None:
+                    self._stats.lines_orphan_data += 1
+                    return
+
+                self._route(pending.tag_hex, self._parser.combine(pending.raw_header_line, data_str))
+                return
+
+        self._stats.lines_unrouted += 1
+
+    def _on_frame(self, frame: bytes) -> None:
+        tag_hex = self._codec.peek_tag(frame)
+        if tag_hex is None:
+            self._stats.frames_unrouted += 1
+            return
+
+        self._route(tag_hex, frame)
+
+    def _route(self, tag_hex: str, item: str | bytes) -> None:
+        self._stats.items_routed += 1
+        index = self._shard_by_tag.get(tag_hex)
+        if index is None:
+            index = self.shard_index(tag_hex, len(self._outgoing))
+
+        self._outgoing[index].append(item)
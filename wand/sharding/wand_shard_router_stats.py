@@ -0,0 +1,31 @@
+import logging
+from dataclasses import dataclass
+
+from gamevolt.logging import Logger
+
+
+@dataclass
+class WandShardRouterStats:
+    items_routed: int = 0
+    items_dropped: int = 0
+    lines_orphan_data: int = 0
+    lines_unrouted: int = 0
+    frames_unrouted: int = 0
+    headers_expired: int = 0
+
+    last_log_monotonic: float = 0.0
+    log_interval_s: float = 2.0
+
+    def maybe_log(self, logger: Logger, now: float, pending_headers: int) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        if (now - self.last_log_monotonic) < self.log_interval_s:
+            return
+
+        self.last_log_monotonic = now
+        logger.debug(
+            f"Wand shard router: routed={self.items_routed} dropped={self.items_dropped} "
+            f"orphan_data={self.lines_orphan_data} unrouted_lines={self.lines_unrouted} "
+            f"unrouted_frames={self.frames_unrouted} expired_headers={self.headers_expired} "
+            f"pending_headers={pending_headers}"
+        )
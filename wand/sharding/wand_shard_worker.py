@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import os
+import queue
+from dataclasses import dataclass, replace
+from multiprocessing.queues import Queue
+
+from gamevolt.logging import Logger, get_logger
+from gamevolt.logging.configuration.logging_settings import LoggingSettings
+from motion.configuration.motion_settings import MotionSettings
+from motion.gesture.gesture_history_factory import GestureHistoryFactory
+from motion.motion_engine import MotionEngine
+from motion.motion_phase_type import MotionPhaseType
+from spells.accuracy.configuration.accuracy_scorer_settings import SpellAccuracyScorerSettings
+from spells.accuracy.spell_accuracy_scorer import SpellAccuracyScorer
+from spells.matching.spell_matcher_factory import SpellMatcherFactory
+from spells.spell_type import SpellType
+from wand.configuration.input_settings import InputSettings
+from wand.configuration.wand_server_settings import WandServerSettings
+from wand.motion_processor_factory import MotionProcessorFactory
+from wand.sharding.wand_shard_device_controller import WandShardDeviceController
+from wand.sharding.wand_shard_message_type import WandShardMessageType
+from wand.sharding.wand_shard_receiver import WandShardReceiver
+from wand.sharding.wand_shard_zone_manager import WandShardZoneManager
+from wand.tracked_wand import TrackedWand
+from wand.tracked_wand_factory import TrackedWandFactory
+from wand.tracked_wand_manager import TrackedWandManager
+from wand.wand_server import WandServer
+from zones.zone import Zone
+
+
+@dataclass
+class WandShardWorkerConfig:
+    index: int
+    logging: LoggingSettings
+    server: WandServerSettings
+    input: InputSettings
+    motion: MotionSettings
+    accuracy: SpellAccuracyScorerSettings
+
+
+class WandShardWorker:
+    """
+    One shard of the sharded pipeline: an ordinary WandServer + TrackedWandManager for the wands routed here,
+    driven from the inbox instead of the web socket. Only spell casts, motion phases and device commands go back.
+    """
+
+    _UPDATE_INTERVAL_S = 0.01
+
+    def __init__(self, logger: Logger, config: WandShardWorkerConfig, inbox: Queue, outbox: Queue) -> None:
+        self._config = config
+        self._logger = logger
+        self._inbox = inbox
+        self._outbox = outbox
+
+        self._outgoing: list[tuple] = []
+
+        self._receiver = WandShardReceiver()
+        self._zone_manager = WandShardZoneManager(logger)
+        self._server = WandServer(logger=logger, settings=config.server, line_receiver=self._receiver, frame_receiver=self._receiver)
+
+        motion_engine = MotionEngine(config.motion.processor) if config.motion.processor.vectorised else None
+        tracked_wand_factory = TrackedWandFactory(
+            logger=logger,
+            settings=config.input.wand,
+            motion_processor_factory=MotionProcessorFactory(logger, config.motion.processor, motion_engine),
+            gesture_history_factory=GestureHistoryFactory(logger, config.motion.gesture_history),
+            spell_matcher_factory=SpellMatcherFactory(logger=logger, spell_accuracy_scorer=SpellAccuracyScorer(config.accuracy)),
+        )
+
+        self._tracked_wand_manager = TrackedWandManager(
+            logger=logger,
+            settings=config.input,
+            server=self._server,
+            tracked_wand_factory=tracked_wand_factory,
+            zone_manager=self._zone_manager,
+            wand_device_controller=WandShardDeviceController(self._outgoing.append),
+            motion_engine=motion_engine,
+        )
+
+    def run(self) -> None:
+        self._start()
+        try:
+            while self._receive():
+                self._tracked_wand_manager.update()
+                self._flush()
+        finally:
+            self._stop()
+
+    def _start(self) -> None:
+        self._logger.info(f"Starting wand shard ({self._config.index}) for wands {self._config.input.tracked_wands.ids}...")
+
+        self._tracked_wand_manager.start()
+        self._tracked_wand_manager.spell_cast.subscribe(self._on_spell_cast)
+        for wand in self._tracked_wand_manager.tracked_wands():
+            wand.motion_changed.subscribe(lambda phase, id=wand.id: self._on_motion_changed(id, phase))
+
+        self._server.start()
+
+    def _stop(self) -> None:
+        self._server.stop()
+        self._tracked_wand_manager.spell_cast.unsubscribe(self._on_spell_cast)
+        self._tracked_wand_manager.stop()
+        self._flush()
+
+        self._logger.info(f"Stopped wand shard ({self._config.index}).")
+
+    def _receive(self) -> bool:
+        """Handles everything queued since the last tick; False once the main process asks the worker to stop."""
+        try:
+            message = self._inbox.get(timeout=self._UPDATE_INTERVAL_S)
+        except queue.Empty:
+            return True
+
+        while True:
+            if not self._handle(message):
+                return False
+
+            try:
+                message = self._inbox.get_nowait()
+            except queue.Empty:
+                return True
+
+    def _handle(self, message: tuple) -> bool:
+        message_type, *args = message
+
+        if message_type is WandShardMessageType.STOP:
+            return False
+
+        try:
+            if message_type is WandShardMessageType.DATA:
+                self._receiver.receive(args[0])
+            elif message_type is WandShardMessageType.ZONE_ENTERED:
+                self._zone_manager.enter(*args)
+            elif message_type is WandShardMessageType.ZONE_EXITED:
+                self._zone_manager.exit(*args)
+            elif message_type is WandShardMessageType.RESET_FORWARDS:
+                self._tracked_wand_manager.reset_wand_forwards()
+            else:
+                self._logger.warning(f"Wand shard ({self._config.index}) ignoring unexpected message '{message_type}'.")
+        except Exception:
+            self._logger.exception(f"Wand shard ({self._config.index}) failed to handle '{message_type.name}'.")
+
+        return True
+
+    def _flush(self) -> None:
+        if not self._outgoing:
+            return
+
+        self._outbox.put(list(self._outgoing))
+        self._outgoing.clear()
+
+    def _on_spell_cast(self, wand: TrackedWand, zone: Zone, spell_type: SpellType) -> None:
+        self._outgoing.append((WandShardMessageType.SPELL_CAST, wand.id, spell_type))
+
+    def _on_motion_changed(self, wand_id: str, motion_phase: MotionPhaseType) -> None:
+        self._outgoing.append((WandShardMessageType.MOTION_CHANGED, wand_id, motion_phase))
+
+
+def run_wand_shard_worker(config: WandShardWorkerConfig, inbox: Queue, outbox: Queue) -> None:
+    """Process entry point; each shard logs to its own file next to the main log."""
+    root, ext = os.path.splitext(config.logging.file_path)
+    logging_settings = replace(config.logging, file_path=f"{root}.shard{config.index}{ext}")
+    logger = get_logger(logging_settings, name=f"gamevolt.shard{config.index}")
+
+    try:
+        WandShardWorker(logger, config, inbox, outbox).run()
+    except KeyboardInterrupt:
+        pass
+    except Exception:
+        logger.exception(f"Wand shard ({config.index}) crashed.")
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from gamevolt.events.event import Event
+from gamevolt.logging import Logger
+from spells.spell_type import SpellType
+from zones.zone import Zone
+from zones.zone_manager_protocol import ZoneManagerProtocol
+
+
+class WandShardZoneManager(ZoneManagerProtocol):
+    """Mirror of the main process zones, fed with the enter/exit events of this shard's wands."""
+
+    def __init__(self, logger: Logger) -> None:
+        self._zone_entered: Event[Callable[[Zone, str], None]] = Event()
+        self._zone_exited: Event[Callable[[Zone, str], None]] = Event()
+        self._current_zone_changed: Event[Callable[[Zone | None], None]] = Event()
+
+        self._logger = logger
+
+        self._zones: dict[str, Zone] = {}
+
+    @property
+    def zone_entered(self) -> Event[Callable[[Zone, str], None]]:
+        return self._zone_entered
+
+    @property
+    def zone_exited(self) -> Event[Callable[[Zone, str], None]]:
+        return self._zone_exited
+
+    @property
+    def current_zone_changed(self) -> Event[Callable[[Zone | None], None]]:
+        return self._current_zone_changed
+
+    async def start_async(self) -> None: ...
+
+    async def stop_async(self) -> None: ...
+
+    def get_zone(self, id: str) -> Zone:
+        zone = self._zones.get(id)
+        if zone is None:
+            raise KeyError(f"No zone with ID: ({id})!")
+
+        return zone
+
+    def get_zone_containing_wand_id(self, id: str) -> Zone:
+        for zone in self._zones.values():
+            if zone.contains_wand_id(id):
+                return zone
+
+        raise KeyError(f"No zone contains wand ({id})!")
+
+    def on_wand_disconnected(self, wand_id: str) -> None:
+        for zone in self._zones.values():
+            zone.on_wand_disconnected(wand_id)
+
+    def enter(self, zone_id: str, spell_types: list[SpellType], wand_id: str) -> None:
+        zone = self._zones.get(zone_id)
+        if zone is None:
+            zone = self._zones[zone_id] = Zone(self._logger, zone_id, spell_types)
+
+        zone.on_wand_enter(wand_id)
+        self._zone_entered.invoke(zone, wand_id)
+
+    def exit(self, zone_id: str, wand_id: str) -> None:
+        zone = self.get_zone(zone_id)
+
+        zone.on_wand_exit(wand_id)
+        self._zone_exited.invoke(zone, wand_id)
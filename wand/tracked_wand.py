@@ -8,6 +8,7 @@ from gamevolt.toolkit.timer import Timer
 from motion.direction.direction_type import DirectionType
 from motion.gesture.gesture_history import GestureHistory
 from motion.gesture.gesture_segment import GestureSegment
+from motion.motion_engine_slot import MotionEngineSlot
 from motion.motion_phase_type import MotionPhaseType
 from motion.motion_processor import MotionProcessor
 from spells.spell_matcher import SpellMatcher
@@ -17,6 +18,7 @@ from wand.interpreters.wand_forward_gravity_interpreter import ForwardGravityInt
 from wand.wand_base import WandBase
 from wand.wand_rotation import WandRotation
 from wand.wand_rotation_raw import WandRotationRaw
+from wand.wand_rotation_raw_batch import WandRotationRawBatch
 
 
 class TrackedWand(WandBase):
@@ -25,7 +27,7 @@ class TrackedWand(WandBase):
         logger: Logger,
         settings: WandSettings,
         id: str,
-        motion_processor: MotionProcessor,
+        motion_processor: MotionProcessor | MotionEngineSlot,
         gesture_history: GestureHistory,
         spell_matcher: SpellMatcher,
         forward_interpreter: ForwardGravityInterpreter,
@@ -89,6 +91,10 @@ class TrackedWand(WandBase):
 
         self.reset()
 
+    def release(self) -> None:
+        """Frees the motion processor's resources once this wand is removed; the wand is not used again."""
+        self._motion_processor.release()
+
     def update(self) -> None:
         pass
         # if self._active_reminder_timer.is_complete:
@@ -131,6 +137,18 @@ class TrackedWand(WandBase):
         self._motion_processor.on_rotation_updated(transformed)
         self.rotation_updated.invoke(transformed)
 
+    def on_rotation_batch(self, raw: WandRotationRawBatch) -> None:
+        batch = self._forward_interpreter.on_batch(raw.id, raw.ts_ms, raw.f)
+        if not len(batch):
+            return
+
+        self._last_rotation = batch.rotation(-1)
+        self._motion_processor.on_rotation_batch(batch)
+
+        if self.rotation_updated.subscriber_count:
+            for rotation in batch.rotations():
+                self.rotation_updated.invoke(rotation)
+
     def _on_motion_changed(self, motion_phase: MotionPhaseType) -> None:
         if motion_phase is MotionPhaseType.HOLDING:
             self._gesture_history.clear()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import time
 from typing import Callable
 
 from gamevolt.events.event import Event
 from gamevolt.logging import Logger
+from motion.motion_engine import MotionEngine
 from motion.motion_phase_type import MotionPhaseType
 from spells.spell_type import SpellType
 from wand.configuration.input_settings import InputSettings
@@ -11,8 +13,9 @@ from wand.tracked_wand import TrackedWand
 from wand.tracked_wand_factory import TrackedWandFactory
 from wand.wand_client import WandClient
 from wand.wand_device_controller import WandDeviceController
+from wand.wand_jitter_buffer import WandJitterBuffer
 from wand.wand_rotation import WandRotation
-from wand.wand_rotation_raw import WandRotationRaw
+from wand.wand_rotation_raw_batch import WandRotationRawBatch
 from wand.wand_server_protocol import WandServerProtocol
 from zones.zone import Zone
 from zones.zone_manager_protocol import ZoneManagerProtocol
@@ -27,6 +30,7 @@ class TrackedWandManager:
         tracked_wand_factory: TrackedWandFactory,
         zone_manager: ZoneManagerProtocol,
         wand_device_controller: WandDeviceController,
+        motion_engine: MotionEngine | None = None,
     ) -> None:
         self.wand_motion_changed: Event[Callable[[MotionPhaseType], None]] = Event()
         self.wand_rotation_updated: Event[Callable[[WandRotation], None]] = Event()
@@ -34,15 +38,20 @@ class TrackedWandManager:
 
         self._wand_device_controller = wand_device_controller
         self._tracked_wand_factory = tracked_wand_factory
+        self._motion_engine = motion_engine
         self._settings = settings.tracked_wands
         self._zone_manager = zone_manager
         self._server = server
         self._logger = logger
 
         self._tracked_wands: dict[str, TrackedWand] = {}
+        self._jitter_buffers: dict[str, WandJitterBuffer] = {}
 
     def start(self) -> None:
-        self._server.wand_rotation_raw_updated.subscribe(self._on_wand_rotation_raw)
+        if self._settings.gate_inactive_wands:
+            self._server.set_activity_gate(self._is_wand_active)
+
+        self._server.wand_rotation_batch_updated.subscribe(self._on_wand_rotation_batch)
         self._server.wand_disconnected.subscribe(self._on_wand_disconnected)
         self._server.wand_connected.subscribe(self._on_wand_connected)
 
@@ -56,15 +65,21 @@ class TrackedWandManager:
             wand.rotation_updated.subscribe(self._on_wand_rotation_updated)
             wand.spell_cast.subscribe(self._on_spell_cast)
 
+            if self._settings.jitter_buffer.is_enabled:
+                self._jitter_buffers[id] = WandJitterBuffer(self._settings.jitter_buffer)
+
             self._logger.info(f"TrackedWand ({id}) created.")
 
     def stop(self) -> None:
         for wand in list(self._tracked_wands.values()):
             wand.stop()
             wand.rotation_updated.unsubscribe(self._on_wand_rotation_updated)
+            wand.release()
 
         self._tracked_wands.clear()
-        self._server.wand_rotation_raw_updated.unsubscribe(self._on_wand_rotation_raw)
+        self._jitter_buffers.clear()
+        self._server.set_activity_gate(None)
+        self._server.wand_rotation_batch_updated.unsubscribe(self._on_wand_rotation_batch)
         self._server.wand_disconnected.unsubscribe(self._on_wand_disconnected)
         self._server.wand_connected.unsubscribe(self._on_wand_connected)
 
@@ -73,6 +88,9 @@ class TrackedWandManager:
 
     def update(self) -> None:
         self._server.update()
+        self._release_jittered()
+        if self._motion_engine is not None:
+            self._motion_engine.tick()
 
         for wand in self._tracked_wands.values():
             wand.update()
@@ -88,6 +106,15 @@ class TrackedWandManager:
             wand.reset_forward()
             wand.reset_data()
 
+        # held packets predate the new forward
+        for buffer in self._jitter_buffers.values():
+            buffer.clear()
+
+    def _is_wand_active(self, wand_id: str) -> bool:
+        # Only running wands (started by entering a zone) can cast; the rest need liveness only.
+        wand = self._tracked_wands.get(wand_id)
+        return wand is not None and wand.is_running
+
     def _on_wand_connected(self, client: WandClient) -> None:
         self._logger.debug(f"Wand ({client.id}) connected.")
 
@@ -101,18 +128,43 @@ class TrackedWandManager:
     def _on_wand_disconnected(self, client: WandClient) -> None:
         self._logger.debug(f"Wand ({client.id}) disconnected.")
 
+        # Nothing more is coming to wait for, so what is held goes out now rather than on the wand's next packet.
+        wand_id = client.id.upper()
+        buffer = self._jitter_buffers.get(wand_id)
+        if buffer is not None:
+            wand = self._tracked_wands[wand_id]
+            for batch in buffer.flush():
+                wand.on_rotation_batch(batch)
+
     def _on_wand_rotation_updated(self, rotation: WandRotation) -> None:
         self.wand_rotation_updated.invoke(rotation)
 
-    def _on_wand_rotation_raw(self, raw: WandRotationRaw) -> None:
-        wand_id = raw.id.upper()
+    def _on_wand_rotation_batch(self, batch: WandRotationRawBatch) -> None:
+        wand_id = batch.id.upper()
         wand = self._tracked_wands.get(wand_id)
 
         if wand is None:
             self._logger.verbose(f"Wand ({wand_id}) ignoring raw rotation as inactive.")
             return
 
-        wand.on_rotation_raw_updated(raw)
+        buffer = self._jitter_buffers.get(wand_id)
+        if buffer is None:
+            wand.on_rotation_batch(batch)
+            return
+
+        buffer.push(batch, time.monotonic())
+
+    def _release_jittered(self) -> None:
+        if not self._jitter_buffers:
+            return
+
+        now = time.monotonic()
+        for wand_id, buffer in self._jitter_buffers.items():
+            wand = self._tracked_wands[wand_id]
+            for batch in buffer.pop_ready(now):
+                wand.on_rotation_batch(batch)
+
+            buffer.stats.maybe_log(self._logger, now, wand_id, buffer.depth)
 
     def _on_zone_entered(self, zone: Zone, wand_id: str) -> None:
         wand = self._get_wand(wand_id)
@@ -128,6 +180,10 @@ class TrackedWandManager:
         wand.stop()
         wand.clear_spell_target()
 
+        buffer = self._jitter_buffers.get(wand.id)
+        if buffer is not None:
+            buffer.clear()
+
         self._wand_device_controller.set_wand_inactive(wand.id)
 
     def _on_spell_cast(self, wand: TrackedWand, spell_type: SpellType) -> None:
@@ -2,12 +2,13 @@ from typing import Callable
 
 from gamevolt.events.event import Event
 from gamevolt.logging import Logger
+from motion.motion_engine_slot import MotionEngineSlot
 from motion.motion_processor import MotionProcessor
 from wand.wand_rotation import WandRotation
 
 
 class WandBase:
-    def __init__(self, logger: Logger, motion_processor: MotionProcessor) -> None:
+    def __init__(self, logger: Logger, motion_processor: MotionProcessor | MotionEngineSlot) -> None:
         self._logger = logger
         self.position_updated: Event[Callable[[WandRotation], None]] = Event()
 
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-import math
+import re
 import time
-from datetime import datetime, timezone
-from typing import Callable, Iterable
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Sequence
+
+import numpy as np
 
 from gamevolt.events.event import Event
 from gamevolt.logging import Logger
-from wand.wand_rotation_raw import WandRotationRaw
+from wand.data.wand_protocol_parser import WandProtocolParser
+from wand.wand_rotation_raw_batch import WandRotationRawBatch
 
 
 class WandClient:
+    _WELL_FORMED_RE = re.compile(r"-?\d{1,9},-?\d{1,9},-?\d{1,9}(?:;-?\d{1,9},-?\d{1,9},-?\d{1,9})*")
+
     def __init__(
         self,
         logger: Logger,
@@ -22,9 +27,8 @@ class WandClient:
         self._disconnect_after_s = float(disconnect_after_s)
 
         self._last_seen_monotonic: float | None = None
-        self._last_seen_utc: datetime | None = None
 
-        self.wand_rotation_raw_updated: Event[Callable[[WandRotationRaw], None]] = Event()
+        self.wand_rotation_batch_updated: Event[Callable[[WandRotationRawBatch], None]] = Event()
 
     @property
     def id(self) -> str:
@@ -34,7 +38,6 @@ class WandClient:
         if now_monotonic is None:
             now_monotonic = time.monotonic()
         self._last_seen_monotonic = now_monotonic
-        self._last_seen_utc = datetime.now(timezone.utc)
 
     def is_connected(self, now_monotonic: float | None = None) -> bool:
         if self._last_seen_monotonic is None:
@@ -50,65 +53,58 @@ class WandClient:
             now_monotonic = time.monotonic()
         return now_monotonic - self._last_seen_monotonic
 
+    @property
+    def disconnect_deadline_monotonic(self) -> float | None:
+        if self._last_seen_monotonic is None:
+            return None
+        return self._last_seen_monotonic + self._disconnect_after_s
+
     @property
     def last_seen_utc(self) -> datetime | None:
-        return self._last_seen_utc
+        # Derived on demand so touch() stays a single monotonic stamp per packet.
+        if self._last_seen_monotonic is None:
+            return None
+        return datetime.now(timezone.utc) - timedelta(seconds=time.monotonic() - self._last_seen_monotonic)
 
     def on_wand_rotation_data(self, t0_ms: int, sample_dt_us: int, data_str: str) -> None:
         self.touch()
+        self._emit_batch(self.decode_batch(t0_ms, sample_dt_us, data_str))
+
+    def on_wand_rotation_samples(self, t0_ms: int, sample_dt_us: int, samples: Sequence[tuple[int, int, int]] | np.ndarray) -> None:
+        self.touch()
+        self._emit_batch(self.decode_samples(t0_ms, sample_dt_us, samples))
+
+    def decode_batch(self, t0_ms: int, sample_dt_us: int, data_str: str) -> WandRotationRawBatch:
+        return self._decode(t0_ms, sample_dt_us, self._parse_q15(data_str))
+
+    def decode_samples(self, t0_ms: int, sample_dt_us: int, samples: Sequence[tuple[int, int, int]] | np.ndarray) -> WandRotationRawBatch:
+        return self._decode(t0_ms, sample_dt_us, np.array(samples, dtype=np.int64).reshape(-1, 3))
+
+    def _decode(self, t0_ms: int, sample_dt_us: int, q15: np.ndarray) -> WandRotationRawBatch:
+        # Same float operations, in the same order, as the scalar q15 -> unit vector conversion.
+        f = np.clip(q15 / 32767.0, -1.0, 1.0)
+        fx, fy, fz = f[:, 0], f[:, 1], f[:, 2]
+        mag = np.sqrt(fx * fx + fy * fy + fz * fz)
+
+        small = mag < 1e-6
+        f /= np.where(small, 1.0, mag)[:, None]
+        f[small] = 0.0
 
         dt_ms = sample_dt_us / 1000.0
+        ts_ms = np.rint(t0_ms + np.arange(len(f)) * dt_ms).astype(np.int64)
+
+        return WandRotationRawBatch(id=self._id, ts_ms=ts_ms, f=f)
+
+    def _parse_q15(self, data_str: str) -> np.ndarray:
+        # The DATA line parser keeps the closing quote of a quoted payload.
+        data_str = data_str.strip('"')
+        if self._WELL_FORMED_RE.fullmatch(data_str):
+            return np.fromstring(data_str.replace(";", ","), dtype=np.int64, sep=",").reshape(-1, 3)
+
+        # Whitespace, quotes, empty or malformed items: defer to the tolerant parser.
+        # Out-of-range values are clamped first; the float conversion saturates at ±1 regardless.
+        samples = WandProtocolParser.parse_samples(data_str)
+        return np.array([[max(-32767, min(32767, v)) for v in sample] for sample in samples], dtype=np.int64).reshape(-1, 3)
 
-        for idx, (fx, fy, fz) in enumerate(self._parse_items(data_str)):
-            ms = int(round(t0_ms + idx * dt_ms))
-            msg = WandRotationRaw(
-                id=self._id,
-                fx=fx,
-                fy=fy,
-                fz=fz,
-                ms=ms,
-            )
-            self._emit(msg)
-
-    def _parse_items(self, s: str) -> Iterable[tuple[float, float, float]]:
-        if not s:
-            return
-
-        for part in s.split(";"):
-            part = part.strip().strip('"')
-            if not part:
-                continue
-
-            toks = [t.strip() for t in part.split(",") if t.strip()]
-            if len(toks) < 3:
-                continue
-
-            try:
-                fx_q15 = int(toks[0])
-                fy_q15 = int(toks[1])
-                fz_q15 = int(toks[2])
-            except ValueError:
-                continue
-
-            fx = self._q15_to_float(fx_q15)
-            fy = self._q15_to_float(fy_q15)
-            fz = self._q15_to_float(fz_q15)
-
-            fx, fy, fz = self._normalize_vector(fx, fy, fz)
-
-            yield (fx, fy, fz)
-
-    @staticmethod
-    def _q15_to_float(v: int) -> float:
-        return max(-1.0, min(1.0, v / 32767.0))
-
-    @staticmethod
-    def _normalize_vector(fx: float, fy: float, fz: float) -> tuple[float, float, float]:
-        mag = math.sqrt(fx * fx + fy * fy + fz * fz)
-        if mag < 1e-6:
-            return (0.0, 0.0, 0.0)
-        return (fx / mag, fy / mag, fz / mag)
-
-    def _emit(self, msg: WandRotationRaw) -> None:
-        self.wand_rotation_raw_updated.invoke(msg)
-        self._logger.trace(f"Wand ({self._id}) EMIT @ {msg.ms} ms  fx={msg.fx:.4f}  fy={msg.fy:.4f}  fz={msg.fz:.4f}")
+    def _emit_batch(self, batch: WandRotationRawBatch) -> None:
+        self.wand_rotation_batch_updated.invoke(batch)
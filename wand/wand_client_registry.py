@@ -1,11 +1,13 @@
+import heapq
 import logging
+import time
 from typing import Callable
 
 from gamevolt.logging import Logger
 from wand.configuration.wand_server_settings import WandServerSettings
 from wand.wand_client import WandClient
 from wand.wand_id_filter import WandIdFilter
-from wand.wand_rotation_raw import WandRotationRaw
+from wand.wand_rotation_raw_batch import WandRotationRawBatch
 
 
 class WandClientRegistry:
@@ -16,24 +18,29 @@ class WandClientRegistry:
         wand_filter: WandIdFilter,
         on_connected: Callable[[WandClient], None],
         on_disconnected: Callable[[WandClient], None],
-        on_rotation_raw: Callable[[WandRotationRaw], None],
+        on_rotation_batch: Callable[[WandRotationRawBatch], None],
     ) -> None:
         self._logger = logger
         self._settings = settings
         self._filter = wand_filter
         self._clients: dict[str, WandClient] = {}
 
+        # (deadline, id) with at most one entry per client; entries are checked lazily and
+        # rescheduled on pop, so touches never need to reorder the heap.
+        self._deadlines: list[tuple[float, str]] = []
+
         self._on_connected = on_connected
         self._on_disconnected = on_disconnected
-        self._on_rotation_raw = on_rotation_raw
+        self._on_rotation_batch = on_rotation_batch
 
     def snapshot(self) -> list[WandClient]:
         return list(self._clients.values())
 
     def clear(self) -> None:
         for client in list(self._clients.values()):
-            client.wand_rotation_raw_updated.unsubscribe(self._on_rotation_raw)
+            client.wand_rotation_batch_updated.unsubscribe(self._on_rotation_batch)
         self._clients.clear()
+        self._deadlines.clear()
 
     def get_or_create(self, client_id: str) -> WandClient | None:
         client_id = client_id.upper()
@@ -53,24 +60,27 @@ class WandClientRegistry:
             disconnect_after_s=self._settings.disconnect_after_s,
         )
         self._clients[client_id] = client
+        heapq.heappush(self._deadlines, (time.monotonic() + self._settings.disconnect_after_s, client_id))
 
         self._on_connected(client)
-        client.wand_rotation_raw_updated.subscribe(self._on_rotation_raw)
+        client.wand_rotation_batch_updated.subscribe(self._on_rotation_batch)
         return client
 
     def prune_disconnected(self, now: float) -> None:
-        if not self._clients:
-            return
-
-        to_remove: list[str] = []
-        for client_id, client in list(self._clients.items()):
-            if not client.is_connected(now):
-                self._logger.info(f"Client ({client_id}) disconnected.")
-                to_remove.append(client_id)
-
-        for client_id in to_remove:
-            client = self._clients.pop(client_id, None)
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] <= now:
+            _, client_id = heapq.heappop(deadlines)
+            client = self._clients.get(client_id)
             if client is None:
                 continue
-            client.wand_rotation_raw_updated.unsubscribe(self._on_rotation_raw)
+
+            deadline = client.disconnect_deadline_monotonic
+            if deadline is not None and deadline > now:
+                # Touched since this entry was scheduled.
+                heapq.heappush(deadlines, (deadline, client_id))
+                continue
+
+            self._logger.info(f"Client ({client_id}) disconnected.")
+            del self._clients[client_id]
+            client.wand_rotation_batch_updated.unsubscribe(self._on_rotation_batch)
             self._on_disconnected(client)
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable
+
+from gamevolt.events.event import Event
+from gamevolt.logging import Logger
+from gamevolt.serial.frame_receiver_protocol import FrameReceiverProtocol
+from gamevolt.serial.line_receiver_protocol import LineReceiverProtocol
+from wand.configuration.ingest_queue_settings import IngestQueueSettings
+from wand.data.wand_binary_codec import WandBinaryCodec
+from wand.data.wand_protocol_parser import WandProtocolParser
+from wand.pending_header_queue import PendingHeaderQueue
+from wand.wand_ingest_queue_stats import WandIngestQueueStats
+
+
+@dataclass
+class IngestUnit:
+    """One packet (a PKTD line, a binary frame, or a PKT line with its DATA line) or one control line."""
+
+    tag: str | None
+    items: list[str | bytes]
+    received_monotonic: float
+    is_dropped: bool = False
+    is_drained: bool = False
+
+
+class WandIngestQueue(LineReceiverProtocol, FrameReceiverProtocol):
+    """
+    Bounded queue between the socket receiver and the wand server, drained once per tick.
+
+    Packets are queued per wand. When a wand exceeds its share, or the queue its total, the oldest packet of
+    the most backlogged wand is dropped, and packets older than max_age_s are dropped on drain, so a backlog
+    costs staleness-bounded latency rather than growing without limit. Lines that are not wand packets are
+    never dropped and do not count towards the limits.
+    """
+
+    def __init__(
+        self,
+        logger: Logger,
+        settings: IngestQueueSettings,
+        line_receiver: LineReceiverProtocol,
+        frame_receiver: FrameReceiverProtocol | None = None,
+    ) -> None:
+        self._line_received: Event[Callable[[str], None]] = Event()
+        self._frame_received: Event[Callable[[bytes], None]] = Event()
+
+        self._line_receiver = line_receiver
+        self._frame_receiver = frame_receiver
+        self._settings = settings
+        self._logger = logger
+
+        self._parser = WandProtocolParser()
+        self._codec = WandBinaryCodec()
+
+        self._arrivals: deque[IngestUnit] = deque()
+        self._backlogs: dict[str, deque[IngestUnit]] = {}
+        self._headers: PendingHeaderQueue[IngestUnit] = PendingHeaderQueue(ttl_s=settings.max_age_s)
+        self._depth = 0
+
+        self._stats = WandIngestQueueStats(last_log_monotonic=time.monotonic(), log_interval_s=2.0)
+
+    @property
+    def line_received(self) -> Event[Callable[[str], None]]:
+        return self._line_received
+
+    @property
+    def frame_received(self) -> Event[Callable[[bytes], None]]:
+        return self._frame_received
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def stats(self) -> WandIngestQueueStats:
+        return self._stats
+
+    def start(self) -> None:
+        self._line_receiver.line_received.subscribe(self._on_line)
+        if self._frame_receiver is not None:
+            self._frame_receiver.frame_received.subscribe(self._on_frame)
+
+    def stop(self) -> None:
+        self._line_receiver.line_received.unsubscribe(self._on_line)
+        if self._frame_receiver is not None:
+            self._frame_receiver.frame_received.unsubscribe(self._on_frame)
+
+        self._arrivals.clear()
+        self._backlogs.clear()
+        self._headers.clear()
+        self._depth = 0
+
+    def update(self) -> None:
+        now = time.monotonic()
+        oldest_allowed = now - self._settings.max_age_s
+        self._headers.prune(now)
+        self._stats.max_depth = max(self._stats.max_depth, self._depth)
+
+        # Only what is queued now; anything raised while draining waits for the next tick.
+        for _ in range(len(self._arrivals)):
+            unit = self._arrivals.popleft()
+            if unit.is_dropped:
+                continue
+
+            if unit.tag is not None:
+                self._backlogs[unit.tag].popleft()
+                self._depth -= 1
+
+                if unit.received_monotonic < oldest_allowed:
+                    self._drop(unit, stale=True)
+                    continue
+
+            unit.is_drained = True
+            self._raise(unit)
+
+        self._stats.maybe_log(self._logger, now, self._depth)
+
+    def _on_line(self, line: str) -> None:
+        now = time.monotonic()
+
+        if line.startswith("DATA"):
+            self._on_data(line, now)
+            return
+
+        if line.startswith("PKT"):
+            tag = self._parser.peek_field(line, "tag=")
+            if tag:
+                tag = tag.upper()
+                unit = self._enqueue(tag, line, now)
+
+                if not line.startswith("PKTD"):
+                    seq = self._parser.peek_field(line, "seq=")
+                    nsamp = self._parser.peek_field(line, "nsamp=")
+                    if seq is not None and seq.isdigit() and nsamp is not None and nsamp.isdigit():
+                        self._headers.put(tag, int(seq), int(nsamp), now, unit)
+                return
+
+        self._stats.control += 1
+        self._arrivals.append(IngestUnit(tag=None, items=[line], received_monotonic=now))
+
+    def _on_frame(self, frame: bytes) -> None:
+        tag = self._codec.peek_tag(frame)
+        if tag is None:
+            # Undecodable frames are the wand server's to count; they cost nothing to pass on.
+            self._arrivals.append(IngestUnit(tag=None, items=[frame], received_monotonic=time.monotonic()))
+            return
+
+        self._enqueue(tag, frame, time.monotonic())
+
+    def _on_data(self, line: str, now: float) -> None:
+        seq = self._parser.peek_field(line, "seq=")
+        header = self._headers.pop_seq(int(seq), lambda: self._count_samples(line)) if seq is not None and seq.isdigit() else None
+
+        if header is None:
+            self._stats.control += 1
+            self._arrivals.append(IngestUnit(tag=None, items=[line], received_monotonic=now))
+            return
+
+        if header.is_dropped:
+            # Its header was shed, so the DATA line would only be an orphan downstream.
+            return
+
+        if header.is_drained and header.tag is not None:
+            self._enqueue(header.tag, line, header.received_monotonic)
+            return
+
+        header.items.append(line)
+
+    def _count_samples(self, line: str) -> int:
+        data_str = self._parser.peek_data(line)
+        return -1 if data_str is None else self._parser.count_samples(data_str)
+
+    def _enqueue(self, tag: str, item: str | bytes, received_monotonic: float) -> IngestUnit:
+        unit = IngestUnit(tag=tag, items=[item], received_monotonic=received_monotonic)
+        self._stats.packets += 1
+
+        backlog = self._backlogs.get(tag)
+        if backlog is None:
+            backlog = self._backlogs[tag] = deque()
+
+        backlog.append(unit)
+        self._arrivals.append(unit)
+        self._depth += 1
+
+        if len(backlog) > self._settings.max_packets_per_wand:
+            self._shed(backlog)
+        elif self._depth > self._settings.max_packets:
+            self._shed(max(self._backlogs.values(), key=len))
+
+        return unit
+
+    def _shed(self, backlog: deque[IngestUnit]) -> None:
+        unit = backlog.popleft()
+        self._depth -= 1
+        self._drop(unit, stale=False)
+
+    def _drop(self, unit: IngestUnit, stale: bool) -> None:
+        unit.is_dropped = True
+        self._stats.count_drop(unit.tag or "?", stale)
+
+    def _raise(self, unit: IngestUnit) -> None:
+        for item in unit.items:
+            if isinstance(item, bytes):
+                self._frame_received.invoke(item)
+            else:
+                self._line_received.invoke(item)
@@ -0,0 +1,36 @@
+import logging
+from dataclasses import dataclass, field
+
+from gamevolt.logging import Logger
+
+
+@dataclass
+class WandIngestQueueStats:
+    packets: int = 0
+    control: int = 0
+    max_depth: int = 0
+    shed_by_wand: dict[str, int] = field(default_factory=dict)
+    stale_by_wand: dict[str, int] = field(default_factory=dict)
+
+    last_log_monotonic: float = 0.0
+    log_interval_s: float = 2.0
+
+    @property
+    def dropped(self) -> int:
+        return sum(self.shed_by_wand.values()) + sum(self.stale_by_wand.values())
+
+    def count_drop(self, wand_id: str, stale: bool) -> None:
+        counts = self.stale_by_wand if stale else self.shed_by_wand
+        counts[wand_id] = counts.get(wand_id, 0) + 1
+
+    def maybe_log(self, logger: Logger, now: float, depth: int) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        if (now - self.last_log_monotonic) < self.log_interval_s:
+            return
+
+        self.last_log_monotonic = now
+        logger.debug(
+            f"Ingest queue: packets={self.packets} control={self.control} dropped={self.dropped} "
+            f"depth={depth} max_depth={self.max_depth} shed={self.shed_by_wand} stale={self.stale_by_wand}"
+        )
@@ -0,0 +1,95 @@
+import heapq
+from itertools import count
+
+from wand.configuration.jitter_buffer_settings import JitterBufferSettings
+from wand.wand_jitter_buffer_stats import WandJitterBufferStats
+from wand.wand_rotation_raw_batch import WandRotationRawBatch
+
+
+class WandJitterBuffer:
+    """
+    Holds one wand's packets for hold_ms and releases them in t0 order.
+
+    Packets that arrive after a later packet has already been released would only be
+    discarded by the motion processor (non-increasing timestamps), so they are dropped
+    here and counted as late. max_packets bounds the added latency under bursts by
+    releasing the earliest packets before their hold has elapsed.
+    """
+
+    # A packet this far behind the last release means the wand restarted its clock, not jitter.
+    _RESYNC_MS = 1000
+
+    def __init__(self, settings: JitterBufferSettings) -> None:
+        self._hold_s = float(settings.hold_ms) / 1000.0
+        self._max_packets = max(1, int(settings.max_packets))
+
+        self._heap: list[tuple[int, int, float, WandRotationRawBatch]] = []
+        self._order = count()
+        self._newest_t0_ms: int | None = None
+        self._released_ts_ms: int | None = None
+
+        self._stats = WandJitterBufferStats()
+
+    @property
+    def stats(self) -> WandJitterBufferStats:
+        return self._stats
+
+    @property
+    def depth(self) -> int:
+        return len(self._heap)
+
+    def push(self, batch: WandRotationRawBatch, now: float) -> None:
+        if not len(batch):
+            return
+
+        self._stats.received += 1
+        t0_ms = int(batch.ts_ms[0])
+
+        if self._released_ts_ms is not None and t0_ms <= self._released_ts_ms:
+            if self._released_ts_ms - t0_ms < self._RESYNC_MS:
+                self._stats.late_dropped += 1
+                return
+
+            self._newest_t0_ms = None
+            self._released_ts_ms = None
+
+        if self._newest_t0_ms is not None and t0_ms < self._newest_t0_ms:
+            self._stats.reordered += 1
+        else:
+            self._newest_t0_ms = t0_ms
+
+        heapq.heappush(self._heap, (t0_ms, next(self._order), now, batch))
+        self._stats.max_depth = max(self._stats.max_depth, len(self._heap))
+
+    def pop_ready(self, now: float) -> list[WandRotationRawBatch]:
+        ready: list[WandRotationRawBatch] = []
+        heap = self._heap
+
+        while heap:
+            _, _, arrived, _ = heap[0]
+            if len(heap) > self._max_packets:
+                self._stats.forced += 1
+            elif (now - arrived) < self._hold_s:
+                break
+
+            ready.append(self._release(heapq.heappop(heap)[3]))
+
+        return ready
+
+    def flush(self) -> list[WandRotationRawBatch]:
+        """Releases everything held, in t0 order, without waiting out the hold (the wand has disconnected)."""
+        ready: list[WandRotationRawBatch] = []
+        while self._heap:
+            ready.append(self._release(heapq.heappop(self._heap)[3]))
+        return ready
+
+    def clear(self) -> None:
+        """Drops everything held (the wand stopped or was reset)."""
+        self._heap.clear()
+        self._newest_t0_ms = None
+        self._released_ts_ms = None
+
+    def _release(self, batch: WandRotationRawBatch) -> WandRotationRawBatch:
+        self._stats.released += 1
+        self._released_ts_ms = int(batch.ts_ms[-1])
+        return batch
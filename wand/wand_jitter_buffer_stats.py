@@ -0,0 +1,30 @@
+import logging
+from dataclasses import dataclass
+
+from gamevolt.logging import Logger
+
+
+@dataclass
+class WandJitterBufferStats:
+    received: int = 0
+    released: int = 0
+    reordered: int = 0
+    late_dropped: int = 0
+    forced: int = 0
+    max_depth: int = 0
+
+    last_log_monotonic: float = 0.0
+    log_interval_s: float = 2.0
+
+    def maybe_log(self, logger: Logger, now: float, wand_id: str, depth: int) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        if (now - self.last_log_monotonic) < self.log_interval_s:
+            return
+
+        self.last_log_monotonic = now
+        logger.trace(
+            f"Wand ({wand_id}) jitter buffer: received={self.received} released={self.released} "
+            f"reordered={self.reordered} late_dropped={self.late_dropped} forced={self.forced} "
+            f"depth={depth} max_depth={self.max_depth}"
+        )
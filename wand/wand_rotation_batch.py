@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Iterator
+
+import numpy as np
+
+from wand.wand_rotation import WandRotation
+
+
+@dataclass(frozen=True, eq=False)
+class WandRotationBatch:
+    """Interpreted samples of one packet as parallel arrays. Missing nx/ny values are NaN."""
+
+    id: str
+    ts_ms: np.ndarray
+    x_delta: np.ndarray
+    y_delta: np.ndarray
+
+    # used for debugging
+    nx: np.ndarray
+    ny: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ts_ms)
+
+    def rotation(self, index: int) -> WandRotation:
+        nx = float(self.nx[index])
+        ny = float(self.ny[index])
+        return WandRotation(
+            id=self.id,
+            ts_ms=int(self.ts_ms[index]),
+            x_delta=float(self.x_delta[index]),
+            y_delta=float(self.y_delta[index]),
+            nx=None if math.isnan(nx) else nx,
+            ny=None if math.isnan(ny) else ny,
+        )
+
+    def rotations(self) -> Iterator[WandRotation]:
+        columns = zip(self.ts_ms.tolist(), self.x_delta.tolist(), self.y_delta.tolist(), self.nx.tolist(), self.ny.tolist())
+        for ts_ms, dx, dy, nx, ny in columns:
+            yield WandRotation(self.id, ts_ms, dx, dy, None if math.isnan(nx) else nx, None if math.isnan(ny) else ny)
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True, eq=False)
+class WandRotationRawBatch:
+    """All samples of one packet: ts_ms is (nsamp,) int64, f is (nsamp, 3) float64 unit forward vectors."""
+
+    id: str
+    ts_ms: np.ndarray
+    f: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ts_ms)
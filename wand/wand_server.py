@@ -6,33 +6,51 @@ from typing import Callable
 
 from gamevolt.events.event import Event
 from gamevolt.logging import Logger
+from gamevolt.serial.frame_receiver_protocol import FrameReceiverProtocol
 from gamevolt.serial.line_receiver_protocol import LineReceiverProtocol
+from wand.anchor_link_stats import AnchorLinkStats
 from wand.configuration.wand_server_settings import WandServerSettings
+from wand.data.assembled_packet import AssembledPacket
 from wand.data.data_line import DataLine
+from wand.data.gated_header import GatedHeader
+from wand.data.wand_binary_codec import WandBinaryCodec
 from wand.data.wand_protocol_parser import WandProtocolParser
 from wand.packet_data_assembler import PktDataAssembler
+from wand.packet_deduplicator import PacketDeduplicator
 from wand.packet_header import PacketHeader
 from wand.wand_client import WandClient
 from wand.wand_client_registry import WandClientRegistry
 from wand.wand_id_filter import WandIdFilter
 from wand.wand_rotation_raw import WandRotationRaw
+from wand.wand_rotation_raw_batch import WandRotationRawBatch
 from wand.wand_server_protocol import WandServerProtocol
 from wand.wand_server_stats import WandServerStats
 
 
 class WandServer(WandServerProtocol):
-    def __init__(self, logger: Logger, settings: WandServerSettings, line_receiver: LineReceiverProtocol) -> None:
+    def __init__(
+        self,
+        logger: Logger,
+        settings: WandServerSettings,
+        line_receiver: LineReceiverProtocol,
+        frame_receiver: FrameReceiverProtocol | None = None,
+        anchor_links: dict[str, AnchorLinkStats] | None = None,
+    ) -> None:
+        self._wand_rotation_batch_updated: Event[Callable[[WandRotationRawBatch], None]] = Event()
         self._wand_rotation_raw_updated: Event[Callable[[WandRotationRaw], None]] = Event()
         self._wand_disconnected: Event[Callable[[WandClient], None]] = Event()
         self._wand_connected: Event[Callable[[WandClient], None]] = Event()
 
         self._line_receiver = line_receiver
+        self._frame_receiver = frame_receiver
         self._settings = settings
         self._logger = logger
 
         self._parser = WandProtocolParser()
+        self._codec = WandBinaryCodec()
         self._assembler = PktDataAssembler(logger=logger, header_ttl_s=float(settings.header_ttl_s))
         self._filter = WandIdFilter(settings=settings)
+        self._deduplicator = PacketDeduplicator(window_s=settings.dedup_window_s, max_entries=settings.dedup_max_entries)
 
         self._registry = WandClientRegistry(
             logger=logger,
@@ -40,10 +58,17 @@ class WandServer(WandServerProtocol):
             wand_filter=self._filter,
             on_connected=self._wand_connected.invoke,
             on_disconnected=self._wand_disconnected.invoke,
-            on_rotation_raw=self._on_wand_rotation_raw_updated,
+            on_rotation_batch=self._on_wand_rotation_batch_updated,
         )
 
         self._stats = WandServerStats(last_log_monotonic=time.monotonic(), log_interval_s=2.0)
+        if anchor_links is not None:
+            self._stats.anchor_links = anchor_links
+        self._is_active: Callable[[str], bool] | None = None
+
+    @property
+    def wand_rotation_batch_updated(self) -> Event[Callable[[WandRotationRawBatch], None]]:
+        return self._wand_rotation_batch_updated
 
     @property
     def wand_rotation_raw_updated(self) -> Event[Callable[[WandRotationRaw], None]]:
@@ -53,6 +78,10 @@ class WandServer(WandServerProtocol):
     def wand_disconnected(self) -> Event[Callable[[WandClient], None]]:
         return self._wand_disconnected
 
+    @property
+    def stats(self) -> WandServerStats:
+        return self._stats
+
     @property
     def wand_connected(self) -> Event[Callable[[WandClient], None]]:
         return self._wand_connected
@@ -60,15 +89,20 @@ class WandServer(WandServerProtocol):
     def start(self) -> None:
         self._logger.info("Starting wand server...")
         self._line_receiver.line_received.subscribe(self._on_line)
+        if self._frame_receiver is not None:
+            self._frame_receiver.frame_received.subscribe(self._on_frame)
         # await self._line_receiver.start_async()
         self._logger.info(f"Started wand server. Allow list: {self._filter.snapshot()}")
 
     def stop(self) -> None:
         self._logger.info("Stopping wand server...")
         self._line_receiver.line_received.unsubscribe(self._on_line)
+        if self._frame_receiver is not None:
+            self._frame_receiver.frame_received.unsubscribe(self._on_frame)
         # await self._line_receiver.stop_async()
 
         self._registry.clear()
+        self._deduplicator.clear()
         self._logger.info("WandServer stopped.")
 
     def update(self) -> None:
@@ -80,7 +114,7 @@ class WandServer(WandServerProtocol):
             suffix = "…" if len(expired) > 10 else ""
             self._logger.trace(
                 f"Pruned {len(expired)} expired PKT headers. ttl_s={float(self._settings.header_ttl_s):.3f} "
-                f"seq_preview={preview}{suffix} pending_now={self._assembler.pending_count}"
+                f"key_preview={preview}{suffix} pending_now={self._assembler.pending_count}"
             )
 
         self._registry.prune_disconnected(now)
@@ -91,6 +125,10 @@ class WandServer(WandServerProtocol):
             clients=len(self._registry.snapshot()),
         )
 
+    def set_activity_gate(self, is_active: Callable[[str], bool] | None) -> None:
+        """Payloads of wands the gate rejects are dropped undecoded; the wand is only marked as seen."""
+        self._is_active = is_active
+
     def add_wand_id(self, id: str) -> None:
         self._filter.add(id)
 
@@ -113,6 +151,9 @@ class WandServer(WandServerProtocol):
             return
 
         now = time.monotonic()
+        if self._is_active is not None and line.startswith("PKT") and self._is_text_gated(line, now):
+            return
+
         parsed = self._parser.parse(line, now)
 
         if isinstance(parsed, PacketHeader):
@@ -129,10 +170,19 @@ class WandServer(WandServerProtocol):
                 self._logger.debug(f"Unparsed serial line. preview='{preview}'")
             return
 
+        if isinstance(parsed, AssembledPacket):
+            # Single-line packets need no header pairing, so they skip the assembler entirely.
+            self._stats.lines_combined += 1
+            self._route_packet(parsed, now)
+            return
+
         assert isinstance(parsed, DataLine)
         self._stats.lines_data += 1
 
         pkt = self._assembler.on_data(parsed, now)
+        if isinstance(pkt, GatedHeader):
+            return
+
         if pkt is None:
             self._stats.lines_orphan_data += 1
             preview = parsed.data_str if len(parsed.data_str) <= 140 else f"{parsed.data_str[:140]}…"
@@ -142,6 +192,12 @@ class WandServer(WandServerProtocol):
             )
             return
 
+        self._route_packet(pkt, now)
+
+    def _route_packet(self, pkt: AssembledPacket, now: float) -> None:
+        if self._is_duplicate(pkt.tag_hex, pkt.seq, pkt.t0_ms, now):
+            return
+
         preview = pkt.data_str if len(pkt.data_str) <= 140 else f"{pkt.data_str[:140]}…"
         self._logger.trace(
             f"DATA: seq={pkt.seq} tag={pkt.tag_hex} t0={pkt.t0_ms} dt_us={pkt.sample_dt_us} "
@@ -155,6 +211,9 @@ class WandServer(WandServerProtocol):
             self._logger.debug(f"DATA dropped (client filtered): tag={pkt.tag_hex} seq={pkt.seq}")
             return
 
+        if self._is_gated(client):
+            return
+
         try:
             client.on_wand_rotation_data(pkt.t0_ms, pkt.sample_dt_us, pkt.data_str)
         except Exception:
@@ -163,6 +222,94 @@ class WandServer(WandServerProtocol):
                 f"t0={pkt.t0_ms} dt_us={pkt.sample_dt_us} fmt={pkt.fmt} data_len={len(pkt.data_str)}"
             )
 
-    def _on_wand_rotation_raw_updated(self, msg: WandRotationRaw) -> None:
-        self._logger.trace(f"wand_rotation_raw_updated: id={msg.id} ts={msg.ms} " f"fx={msg.fx:.4f} fy={msg.fy:.4f} fz={msg.fz:.4f}")
-        self.wand_rotation_raw_updated.invoke(msg)
+    def _on_frame(self, frame: bytes) -> None:
+        self._stats.frames_binary += 1
+
+        if self._is_active is not None:
+            tag_hex = self._codec.peek_tag(frame)
+            if tag_hex is not None and not self._is_active(tag_hex):
+                self._gate(tag_hex)
+                return
+
+        pkt = self._codec.decode(frame)
+        if pkt is None:
+            self._stats.frames_unparsed += 1
+            self._logger.debug(f"Unparsed binary frame. len={len(frame)} head={frame[: self._codec.header_size].hex()}")
+            return
+
+        if self._is_duplicate(pkt.tag_hex, pkt.seq, pkt.t0_ms, time.monotonic()):
+            return
+
+        self._logger.trace(f"BIN: seq={pkt.seq} tag={pkt.tag_hex} t0={pkt.t0_ms} dt_us={pkt.sample_dt_us} nsamp={pkt.nsamp} fmt={pkt.fmt}")
+
+        client = self._registry.get_or_create(pkt.tag_hex)
+        if client is None:
+            self._stats.lines_filtered += 1
+            self._logger.debug(f"BIN dropped (client filtered): tag={pkt.tag_hex} seq={pkt.seq}")
+            return
+
+        try:
+            client.on_wand_rotation_samples(pkt.t0_ms, pkt.sample_dt_us, pkt.samples)
+        except Exception:
+            self._logger.exception(
+                f"Exception while routing wand data: tag={pkt.tag_hex} seq={pkt.seq} "
+                f"t0={pkt.t0_ms} dt_us={pkt.sample_dt_us} fmt={pkt.fmt} nsamp={pkt.nsamp}"
+            )
+
+    def _is_text_gated(self, line: str, now: float) -> bool:
+        """Turns away a PKT or PKTD line of an inactive wand on a peek at its tag, before the line is parsed."""
+        tag = self._parser.peek_field(line, "tag=")
+        if tag is None:
+            return False
+
+        tag_hex = tag.upper()
+        if self._is_active(tag_hex):
+            return False
+
+        if not line.startswith("PKTD"):
+            # A PKT header is still queued, unparsed: dropped, its DATA line could pair with another wand's header.
+            seq = self._parser.peek_field(line, "seq=")
+            nsamp = self._parser.peek_field(line, "nsamp=")
+            if seq is None or nsamp is None or not seq.isdigit() or not nsamp.isdigit():
+                return False
+
+            self._assembler.on_gated_header(tag_hex, int(seq), int(nsamp), now)
+
+        self._gate(tag_hex)
+        return True
+
+    def _gate(self, tag_hex: str) -> None:
+        client = self._registry.get_or_create(tag_hex)
+        if client is not None:
+            client.touch()
+        self._stats.packets_gated += 1
+
+    def _is_gated(self, client: WandClient) -> bool:
+        if self._is_active is None or self._is_active(client.id):
+            return False
+
+        client.touch()
+        self._stats.packets_gated += 1
+        return True
+
+    def _is_duplicate(self, tag_hex: str, seq: int, t0_ms: int, now: float) -> bool:
+        # The same packet reaches us once per anchor in range; only the first arrival is processed.
+        if self._deduplicator.is_duplicate(tag_hex, seq, t0_ms, now):
+            self._stats.dedup_hits += 1
+            self._logger.trace(f"Duplicate packet dropped: tag={tag_hex} seq={seq} t0={t0_ms}")
+            return True
+
+        self._stats.dedup_misses += 1
+        return False
+
+    def _on_wand_rotation_batch_updated(self, batch: WandRotationRawBatch) -> None:
+        self._wand_rotation_batch_updated.invoke(batch)
+
+        # Per-sample fan-out is only for observers such as the visualiser.
+        if not self._wand_rotation_raw_updated.subscriber_count:
+            return
+
+        for ms, (fx, fy, fz) in zip(batch.ts_ms.tolist(), batch.f.tolist()):
+            msg = WandRotationRaw(id=batch.id, ms=ms, fx=fx, fy=fy, fz=fz)
+            self._logger.trace(f"wand_rotation_raw_updated: id={msg.id} ts={msg.ms} " f"fx={msg.fx:.4f} fy={msg.fy:.4f} fz={msg.fz:.4f}")
+            self._wand_rotation_raw_updated.invoke(msg)
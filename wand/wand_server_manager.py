@@ -4,12 +4,14 @@ from typing import Callable
 from gamevolt.events.event import Event
 from wand.wand_client import WandClient
 from wand.wand_rotation_raw import WandRotationRaw
+from wand.wand_rotation_raw_batch import WandRotationRawBatch
 from wand.wand_server import WandServer
 from wand.wand_server_protocol import WandServerProtocol
 
 
 class WandServerManager(WandServerProtocol):
     def __init__(self, logger: Logger, servers: list[WandServer]) -> None:
+        self._wand_rotation_batch_updated: Event[Callable[[WandRotationRawBatch], None]] = Event()
         self._wand_rotation_raw_updated: Event[Callable[[WandRotationRaw], None]] = Event()
         self._wand_disconnected: Event[Callable[[WandClient], None]] = Event()
         self._wand_connected: Event[Callable[[WandClient], None]] = Event()
@@ -17,6 +19,10 @@ class WandServerManager(WandServerProtocol):
         self._servers = servers
         self._logger = logger
 
+    @property
+    def wand_rotation_batch_updated(self) -> Event[Callable[[WandRotationRawBatch], None]]:
+        return self._wand_rotation_batch_updated
+
     @property
     def wand_rotation_raw_updated(self) -> Event[Callable[[WandRotationRaw], None]]:
         return self._wand_rotation_raw_updated
@@ -29,8 +35,13 @@ class WandServerManager(WandServerProtocol):
     def wand_connected(self) -> Event[Callable[[WandClient], None]]:
         return self._wand_connected
 
+    def set_activity_gate(self, is_active: Callable[[str], bool] | None) -> None:
+        for server in self._servers:
+            server.set_activity_gate(is_active)
+
     async def start(self) -> None:
         for server in self._servers:
+            server.wand_rotation_batch_updated.subscribe(self._wand_rotation_batch_updated.invoke)
             server.wand_rotation_raw_updated.subscribe(self._wand_rotation_raw_updated.invoke)
             server.wand_disconnected.subscribe(self._wand_disconnected.invoke)
             server.wand_connected.subscribe(self._wand_connected.invoke)
@@ -43,6 +54,7 @@ class WandServerManager(WandServerProtocol):
             await server.stop()
 
         for server in self._servers:
+            server.wand_rotation_batch_updated.unsubscribe(self._wand_rotation_batch_updated.invoke)
             server.wand_rotation_raw_updated.unsubscribe(self._wand_rotation_raw_updated.invoke)
             server.wand_disconnected.unsubscribe(self._wand_disconnected.invoke)
             server.wand_connected.unsubscribe(self._wand_connected.invoke)
@@ -3,9 +3,13 @@ from typing import Callable
 from gamevolt.events.event import Event
 from wand.wand_client import WandClient
 from wand.wand_rotation_raw import WandRotationRaw
+from wand.wand_rotation_raw_batch import WandRotationRawBatch
 
 
 class WandServerProtocol:
+    @property
+    def wand_rotation_batch_updated(self) -> Event[Callable[[WandRotationRawBatch], None]]: ...
+
     @property
     def wand_rotation_raw_updated(self) -> Event[Callable[[WandRotationRaw], None]]: ...
 
@@ -15,6 +19,8 @@ class WandServerProtocol:
     @property
     def wand_connected(self) -> Event[Callable[[WandClient], None]]: ...
 
+    def set_activity_gate(self, is_active: Callable[[str], bool] | None) -> None: ...
+
     async def start(self) -> None: ...
 
     async def stop(self) -> None: ...
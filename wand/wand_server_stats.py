@@ -1,7 +1,8 @@
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from gamevolt.logging import Logger
+from wand.anchor_link_stats import AnchorLinkStats
 
 
 @dataclass
@@ -9,10 +10,19 @@ class WandServerStats:
     lines_total: int = 0
     lines_pkt: int = 0
     lines_data: int = 0
+    lines_combined: int = 0
     lines_unparsed: int = 0
     lines_orphan_data: int = 0
     lines_filtered: int = 0
+    packets_gated: int = 0
     lines_empty: int = 0
+    frames_binary: int = 0
+    frames_unparsed: int = 0
+    dedup_hits: int = 0
+    dedup_misses: int = 0
+
+    # per-anchor latency and relay queue depth, shared with the receiver's AnchorLinkMonitor when there is one
+    anchor_links: dict[str, AnchorLinkStats] = field(default_factory=dict)
 
     last_log_monotonic: float = 0.0
     log_interval_s: float = 2.0
@@ -25,7 +35,12 @@ class WandServerStats:
 
         self.last_log_monotonic = now
         logger.trace(
-            f"WandServer stats: lines={self.lines_total} pkt={self.lines_pkt} data={self.lines_data} "
+            f"WandServer stats: lines={self.lines_total} pkt={self.lines_pkt} data={self.lines_data} pktd={self.lines_combined} "
             f"orphan_data={self.lines_orphan_data} unparsed={self.lines_unparsed} empty={self.lines_empty} "
-            f"pending_headers={pending_headers} clients={clients} filtered={self.lines_filtered}"
+            f"bin={self.frames_binary} bin_unparsed={self.frames_unparsed} dedup_hits={self.dedup_hits} dedup_misses={self.dedup_misses} "
+            f"pending_headers={pending_headers} clients={clients} filtered={self.lines_filtered} gated={self.packets_gated}"
         )
+
+        for anchor_id, link in list(self.anchor_links.items()):
+            logger.trace(f"Anchor ({anchor_id}) link: {link}")
+            link.reset_window()
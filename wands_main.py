@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import multiprocessing
 import os
 
 from anchor_area.anchor_area_manager import AnchorAreaManager
+from anchor_area.anchor_command_queue_monitor import AnchorCommandQueueMonitor
 from appsettings import AppSettings
 from display.image_libraries.spell_image_library import SpellImageLibrary
+from gamevolt.io.spsc_ring_buffer import SpscRingBuffer
 from gamevolt.io.utils import bundled_path, install_path
 from gamevolt.logging import get_logger
 from gamevolt.messaging.events.message_handler import MessageHandler
@@ -14,6 +17,9 @@ from gamevolt.messaging.udp.udp_tx import UdpTx
 from gamevolt.visualisation.visualiser import Visualiser
 from gamevolt.web_sockets.web_socket_server import WebSocketServer
 from motion.gesture.gesture_history_factory import GestureHistoryFactory
+from motion.motion_engine import MotionEngine
+from receivers.anchor_link_monitor import AnchorLinkMonitor
+from receivers.ring_buffer_receiver import RingBufferReceiver
 from receivers.web_socket_line_receiver import WebSocketLineReceiver
 from show_system.show_system_controller import ShowSystemController
 from spell_cues.wand_spell_cue_controller import WandSpellCueController
@@ -26,9 +32,12 @@ from visualisation.trail_factory import TrailFactory
 from visualisation.wand_colour_registry import WandColourRegistry
 from visualisation.wand_visualiser_factory import WandVisualiserFactory
 from wand.motion_processor_factory import MotionProcessorFactory
+from wand.sharding.sharded_tracked_wand_manager import ShardedTrackedWandManager
+from wand.sharding.wand_shard_pool import WandShardPool
 from wand.tracked_wand_factory import TrackedWandFactory
 from wand.tracked_wand_manager import TrackedWandManager
 from wand.wand_device_controller import WandDeviceController
+from wand.wand_ingest_queue import WandIngestQueue
 from wand.wand_server import WandServer
 from zones.zone_application_builder import ZoneApplicationBuilder
 from zones.zone_factory import ZoneFactory
@@ -42,6 +51,21 @@ print(settings)
 
 logger = get_logger(settings.logging)
 
+# Shard workers are forked, so they start before any socket, thread, window or event loop exists here.
+# A spawned worker re-runs this module as its main, and must not start a pool of its own.
+wand_shard_pool: WandShardPool | None = None
+
+if settings.input.sharding.shard_count > 1 and multiprocessing.parent_process() is None:
+    wand_shard_pool = WandShardPool(
+        logger=logger,
+        logging_settings=settings.logging,
+        server_settings=settings.server,
+        settings=settings.input,
+        motion_settings=settings.motion,
+        accuracy_settings=settings.accuracy,
+    )
+    wand_shard_pool.start()
+
 spell_registry = SpellRegistry(logger, settings.spell_registry)
 web_socket_server = WebSocketServer(logger, settings.server.web_socket)
 zone_message_handler = None
@@ -77,15 +101,39 @@ else:
 
 zone_manager = zone_application.zone_manager
 
-line_receiver = WebSocketLineReceiver(logger=logger, web_socket_server=web_socket_server)
+ingest_settings = settings.server.ingest_buffer
+ingest_receiver: RingBufferReceiver | None = None
+
+if ingest_settings.is_enabled:
+    ingest_receiver = RingBufferReceiver(
+        logger=logger,
+        ring_buffer=SpscRingBuffer.create(ingest_settings.capacity_bytes),
+        drain_max_items=ingest_settings.drain_max_items,
+    )
 
-server = WandServer(
+anchor_link_monitor = AnchorLinkMonitor(web_socket_server)
+line_receiver = WebSocketLineReceiver(
     logger=logger,
-    settings=settings.server,
-    line_receiver=line_receiver,
+    web_socket_server=web_socket_server,
+    ring_buffer=ingest_receiver.ring_buffer if ingest_receiver is not None else None,
+    anchor_link_monitor=anchor_link_monitor,
 )
+relay_message_handler = MessageHandler(logger, line_receiver)
+anchor_command_queue_monitor = AnchorCommandQueueMonitor(logger, relay_message_handler)
+wand_data_receiver: WebSocketLineReceiver | RingBufferReceiver | WandIngestQueue = ingest_receiver or line_receiver
+ingest_queue: WandIngestQueue | None = None
+
+if settings.server.ingest_queue.is_enabled:
+    ingest_queue = WandIngestQueue(
+        logger=logger,
+        settings=settings.server.ingest_queue,
+        line_receiver=wand_data_receiver,
+        frame_receiver=wand_data_receiver,
+    )
+    wand_data_receiver = ingest_queue
 
-motion_processor_factory = MotionProcessorFactory(logger, settings.motion.processor)
+motion_engine = MotionEngine(settings.motion.processor) if settings.motion.processor.vectorised else None
+motion_processor_factory = MotionProcessorFactory(logger, settings.motion.processor, motion_engine)
 gesture_history_factory = GestureHistoryFactory(logger, settings.motion.gesture_history)
 spell_matcher_factory = SpellMatcherFactory(
     spell_accuracy_scorer=SpellAccuracyScorer(settings.accuracy),
@@ -118,14 +166,38 @@ wand_device_controller = WandDeviceController(
     logger=logger,
 )
 
-tracked_wand_manager = TrackedWandManager(
-    wand_device_controller=wand_device_controller,
-    tracked_wand_factory=tracked_wand_factory,
-    zone_manager=zone_manager,
-    settings=settings.input,
-    logger=logger,
-    server=server,
-)
+server: WandServer | None = None
+tracked_wand_manager: TrackedWandManager | ShardedTrackedWandManager
+
+if wand_shard_pool is not None:
+    tracked_wand_manager = ShardedTrackedWandManager(
+        wand_device_controller=wand_device_controller,
+        zone_manager=zone_manager,
+        line_receiver=wand_data_receiver,
+        frame_receiver=wand_data_receiver,
+        server_settings=settings.server,
+        shard_pool=wand_shard_pool,
+        settings=settings.input,
+        logger=logger,
+    )
+else:
+    server = WandServer(
+        logger=logger,
+        settings=settings.server,
+        line_receiver=wand_data_receiver,
+        frame_receiver=wand_data_receiver,
+        anchor_links=anchor_link_monitor.stats,
+    )
+
+    tracked_wand_manager = TrackedWandManager(
+        wand_device_controller=wand_device_controller,
+        tracked_wand_factory=tracked_wand_factory,
+        zone_manager=zone_manager,
+        motion_engine=motion_engine,
+        settings=settings.input,
+        logger=logger,
+        server=server,
+    )
 
 trail_factory = TrailFactory(logger, settings.wand_visualiser.trail)
 visualised_wand_factory = VisualisedWandFactory(logger, trail_factory)
@@ -190,9 +262,14 @@ async def main() -> int:
         if zone_message_handler is not None:
             zone_message_handler.start()
         wand_spell_cue_controller.start()
+        relay_message_handler.start()
+        anchor_command_queue_monitor.start()
         line_receiver.start()
+        if ingest_queue is not None:
+            ingest_queue.start()
 
-        server.start()
+        if server is not None:
+            server.start()
         wand_visualiser.start()
 
         # logger.info(f"Enabling all wands...")
@@ -205,6 +282,10 @@ async def main() -> int:
 
     try:
         while not quit_event.is_set():
+            if ingest_receiver is not None:
+                ingest_receiver.update()
+            if ingest_queue is not None:
+                ingest_queue.update()
             tracked_wand_manager.update()
             zone_application.update()
             wand_visualiser.update()
@@ -233,13 +314,22 @@ async def main() -> int:
         await zone_application.stop_async()
         await spell_cast_presentation_controller.stop_async()
         tracked_wand_manager.stop()
+        if wand_shard_pool is not None:
+            wand_shard_pool.stop()
         anchor_area_manager.stop()
         if zone_message_handler is not None:
             zone_message_handler.stop()
         wand_spell_cue_controller.stop()
+        if ingest_queue is not None:
+            ingest_queue.stop()
         line_receiver.stop()
+        anchor_command_queue_monitor.stop()
+        relay_message_handler.stop()
 
-        server.stop()
+        if server is not None:
+            server.stop()
+        if ingest_receiver is not None:
+            ingest_receiver.ring_buffer.close()
         logger.info(f"Exited '{settings.name}'.")
         return 0
 